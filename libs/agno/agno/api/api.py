@@ -1,4 +1,7 @@
-from typing import Dict
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 from httpx import AsyncClient as HttpxAsyncClient
 from httpx import Client as HttpxClient
@@ -13,6 +16,11 @@ class Api:
             "user-agent": f"{agno_api_settings.app_name}/{agno_api_settings.app_version}",
             "Content-Type": "application/json",
         }
+        # Telemetry clients reused across runs so each POST skips the TCP/TLS handshake.
+        # The async client is only shared on the loop that opened it (see `aopen`).
+        self._shared_client: Optional[HttpxClient] = None
+        self._shared_async_client: Optional[Tuple[asyncio.AbstractEventLoop, HttpxAsyncClient]] = None
+        self._lock = threading.Lock()
 
     def Client(self) -> HttpxClient:
         return HttpxClient(
@@ -30,6 +38,57 @@ class Api:
             http2=True,
         )
 
+    def shared_client(self) -> HttpxClient:
+        """Sync client shared by all telemetry calls.
+
+        HTTP/2 is disabled because the client is shared across threads.
+        """
+        client = self._shared_client
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._shared_client
+                if client is None or client.is_closed:
+                    client = HttpxClient(
+                        base_url=agno_api_settings.api_url,
+                        headers=self.headers,
+                        timeout=60,
+                    )
+                    self._shared_client = client
+        return client
+
+    @asynccontextmanager
+    async def async_client(self) -> AsyncIterator[HttpxAsyncClient]:
+        """Async client for a single telemetry call.
+
+        An async client is bound to the event loop it is used on, so it is only shared
+        on the loop that opened it with `aopen()` (the AgentOS server loop). Anywhere
+        else, e.g. under `asyncio.run`, a short-lived client is opened and closed
+        around the call.
+        """
+        entry = self._shared_async_client
+        if entry is not None and entry[0] is asyncio.get_running_loop() and not entry[1].is_closed:
+            yield entry[1]
+        else:
+            async with self.AsyncClient() as client:
+                yield client
+
+    async def aopen(self) -> None:
+        """Open the async client shared by telemetry calls made on the running event loop."""
+        entry = self._shared_async_client
+        if entry is None or entry[1].is_closed:
+            self._shared_async_client = (asyncio.get_running_loop(), self.AsyncClient())
+
+    async def aclose(self) -> None:
+        """Close the shared telemetry clients."""
+        with self._lock:
+            client, self._shared_client = self._shared_client, None
+        if client is not None:
+            client.close()
+        entry = self._shared_async_client
+        if entry is not None and entry[0] is asyncio.get_running_loop():
+            self._shared_async_client = None
+            await entry[1].aclose()
+
 
 api = Api()
 
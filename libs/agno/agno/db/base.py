@@ -194,6 +194,19 @@ class BaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """Return True if a session with this id exists, optionally scoped to a session type and user.
+
+        Falls back to reading the raw session row; backends that can answer with a
+        cheaper key lookup override this.
+        """
+        return (
+            self.get_session(session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False)
+            is not None
+        )
+
     @abstractmethod
     def get_sessions(
         self,
@@ -211,6 +224,38 @@ class BaseDb(ABC):
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return one page of raw session dicts and the total count for a session listing.
+
+        Falls back to get_sessions; backends that can skip reading runs of named
+        sessions override this.
+        """
+        return self.get_sessions(  # type: ignore[return-value]
+            session_type=session_type,
+            user_id=user_id,
+            component_id=component_id,
+            session_name=session_name,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=False,
+        )
+
     @abstractmethod
     def rename_session(
         self,
@@ -1577,6 +1622,19 @@ class AsyncBaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    async def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """Return True if a session with this id exists, optionally scoped to a session type and user.
+
+        Falls back to reading the raw session row; backends that can answer with a
+        cheaper key lookup override this.
+        """
+        return (
+            await self.get_session(session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False)
+            is not None
+        )
+
     @abstractmethod
     async def get_sessions(
         self,
@@ -1594,6 +1652,38 @@ class AsyncBaseDb(ABC):
     ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
         raise NotImplementedError
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return one page of raw session dicts and the total count for a session listing.
+
+        Falls back to get_sessions; backends that can skip reading runs of named
+        sessions override this.
+        """
+        return await self.get_sessions(  # type: ignore[return-value]
+            session_type=session_type,
+            user_id=user_id,
+            component_id=component_id,
+            session_name=session_name,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=False,
+        )
+
     @abstractmethod
     async def rename_session(
         self,
@@ -16,6 +16,7 @@ class MigrationManager:
         ("v2_3_0", packaging_version.parse("2.3.0")),
         ("v2_5_0", packaging_version.parse("2.5.0")),
         ("v2_5_6", packaging_version.parse("2.5.6")),
+        ("v2_8_7", packaging_version.parse("2.8.7")),
     ]
 
     def __init__(self, db: Union[AsyncBaseDb, BaseDb]):
@@ -0,0 +1,320 @@
+"""Migration v2.8.7: Add composite session-list indexes to sessions table
+
+Changes:
+- Add (agent_id, user_id, created_at), (team_id, user_id, created_at) and
+  (workflow_id, user_id, created_at) indexes to agno_sessions, matching the
+  component + user filter and created_at ordering of get_sessions
+"""
+
+from typing import List
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.migrations.utils import quote_db_identifier
+from agno.utils.log import log_error, log_info
+
+try:
+    from sqlalchemy import text
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+# Must match the "__composite_indexes__" of the sessions table schema, so tables created
+# before and after this migration end up with the same index names.
+SESSION_LIST_INDEX_COLUMNS: List[List[str]] = [
+    ["agent_id", "user_id", "created_at"],
+    ["team_id", "user_id", "created_at"],
+    ["workflow_id", "user_id", "created_at"],
+]
+
+
+def _index_name(table_name: str, columns: List[str]) -> str:
+    return f"idx_{table_name}_{'_'.join(columns)}"
+
+
+def up(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Add composite session-list indexes to sessions table.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "sessions":
+            return False
+
+        if db_type == "PostgresDb":
+            return _migrate_postgres(db, table_name)
+        elif db_type == "SqliteDb":
+            return _migrate_sqlite(db, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.8.7 for {db_type} on table {table_name}: {str(e)}")
+        raise
+
+
+async def async_up(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Add composite session-list indexes to sessions table.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "sessions":
+            return False
+
+        if db_type == "AsyncPostgresDb":
+            return await _migrate_async_postgres(db, table_name)
+        elif db_type == "AsyncSqliteDb":
+            return await _migrate_async_sqlite(db, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.8.7 for {db_type} on table {table_name}: {str(e)}")
+        raise
+
+
+def down(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert: drop composite session-list indexes from sessions table.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "sessions":
+            return False
+
+        if db_type == "PostgresDb":
+            return _revert_postgres(db, table_name)
+        elif db_type == "SqliteDb":
+            return _revert_sqlite(db, table_name)
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.8.7 for {db_type} on table {table_name}: {str(e)}")
+        raise
+
+
+async def async_down(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert: drop composite session-list indexes from sessions table.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "sessions":
+            return False
+
+        if db_type == "AsyncPostgresDb":
+            return await _revert_async_postgres(db, table_name)
+        elif db_type == "AsyncSqliteDb":
+            return await _revert_async_sqlite(db, table_name)
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.8.7 for {db_type} on table {table_name} asynchronously: {str(e)}")
+        raise
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL
+# ---------------------------------------------------------------------------
+
+_POSTGRES_TABLE_EXISTS = text(
+    "SELECT EXISTS (  SELECT FROM information_schema.tables  WHERE table_schema = :schema AND table_name = :table_name)"
+)
+_POSTGRES_INDEX_EXISTS = text(
+    "SELECT 1 FROM pg_indexes WHERE schemaname = :schema AND tablename = :table AND indexname = :index"
+)
+
+
+def _migrate_postgres(db: BaseDb, table_name: str) -> bool:
+    """Add composite session-list indexes to sessions table for PostgreSQL."""
+    db_schema = db.db_schema or "public"  # type: ignore
+    db_type = type(db).__name__
+    full_table = f"{quote_db_identifier(db_type, db_schema)}.{quote_db_identifier(db_type, table_name)}"
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        table_exists = sess.execute(_POSTGRES_TABLE_EXISTS, {"schema": db_schema, "table_name": table_name}).scalar()
+        if not table_exists:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            has_index = sess.execute(
+                _POSTGRES_INDEX_EXISTS, {"schema": db_schema, "table": table_name, "index": index_name}
+            ).scalar()
+            if not has_index:
+                log_info(f"-- Adding index {index_name} on {table_name}")
+                quoted_index = quote_db_identifier(db_type, index_name)
+                sess.execute(text(f"CREATE INDEX {quoted_index} ON {full_table} ({', '.join(columns)})"))
+                applied = True
+
+        return applied
+
+
+async def _migrate_async_postgres(db: AsyncBaseDb, table_name: str) -> bool:
+    """Add composite session-list indexes to sessions table for async PostgreSQL."""
+    db_schema = db.db_schema or "public"  # type: ignore
+    db_type = type(db).__name__
+    full_table = f"{quote_db_identifier(db_type, db_schema)}.{quote_db_identifier(db_type, table_name)}"
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        result = await sess.execute(_POSTGRES_TABLE_EXISTS, {"schema": db_schema, "table_name": table_name})
+        if not result.scalar():
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            result = await sess.execute(
+                _POSTGRES_INDEX_EXISTS, {"schema": db_schema, "table": table_name, "index": index_name}
+            )
+            if not result.scalar():
+                log_info(f"-- Adding index {index_name} on {table_name}")
+                quoted_index = quote_db_identifier(db_type, index_name)
+                await sess.execute(text(f"CREATE INDEX {quoted_index} ON {full_table} ({', '.join(columns)})"))
+                applied = True
+
+        return applied
+
+
+def _revert_postgres(db: BaseDb, table_name: str) -> bool:
+    """Revert: drop composite session-list indexes from sessions table for PostgreSQL."""
+    db_schema = db.db_schema or "public"  # type: ignore
+    db_type = type(db).__name__
+    quoted_schema = quote_db_identifier(db_type, db_schema)
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            has_index = sess.execute(
+                _POSTGRES_INDEX_EXISTS, {"schema": db_schema, "table": table_name, "index": index_name}
+            ).scalar()
+            if has_index:
+                log_info(f"-- Dropping index {index_name} from {table_name}")
+                sess.execute(text(f"DROP INDEX {quoted_schema}.{quote_db_identifier(db_type, index_name)}"))
+                applied = True
+
+        return applied
+
+
+async def _revert_async_postgres(db: AsyncBaseDb, table_name: str) -> bool:
+    """Revert: drop composite session-list indexes from sessions table for async PostgreSQL."""
+    db_schema = db.db_schema or "public"  # type: ignore
+    db_type = type(db).__name__
+    quoted_schema = quote_db_identifier(db_type, db_schema)
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            result = await sess.execute(
+                _POSTGRES_INDEX_EXISTS, {"schema": db_schema, "table": table_name, "index": index_name}
+            )
+            if result.scalar():
+                log_info(f"-- Dropping index {index_name} from {table_name}")
+                await sess.execute(text(f"DROP INDEX {quoted_schema}.{quote_db_identifier(db_type, index_name)}"))
+                applied = True
+
+        return applied
+
+
+# ---------------------------------------------------------------------------
+# SQLite
+# ---------------------------------------------------------------------------
+
+_SQLITE_TABLE_EXISTS = text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:table_name")
+
+
+def _migrate_sqlite(db: BaseDb, table_name: str) -> bool:
+    """Add composite session-list indexes to sessions table for SQLite."""
+    with db.Session() as sess, sess.begin():  # type: ignore
+        if not sess.execute(_SQLITE_TABLE_EXISTS, {"table_name": table_name}).scalar():
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        index_names = {idx[1] for idx in sess.execute(text(f"PRAGMA index_list({table_name})")).fetchall()}
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            if index_name not in index_names:
+                log_info(f"-- Adding index {index_name} on {table_name}")
+                sess.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({', '.join(columns)})"))
+                applied = True
+
+        return applied
+
+
+async def _migrate_async_sqlite(db: AsyncBaseDb, table_name: str) -> bool:
+    """Add composite session-list indexes to sessions table for async SQLite."""
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        result = await sess.execute(_SQLITE_TABLE_EXISTS, {"table_name": table_name})
+        if not result.scalar():
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        result = await sess.execute(text(f"PRAGMA index_list({table_name})"))
+        index_names = {idx[1] for idx in result.fetchall()}
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            if index_name not in index_names:
+                log_info(f"-- Adding index {index_name} on {table_name}")
+                await sess.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({', '.join(columns)})"))
+                applied = True
+
+        return applied
+
+
+def _revert_sqlite(db: BaseDb, table_name: str) -> bool:
+    """Revert: drop composite session-list indexes from sessions table for SQLite."""
+    with db.Session() as sess, sess.begin():  # type: ignore
+        index_names = {idx[1] for idx in sess.execute(text(f"PRAGMA index_list({table_name})")).fetchall()}
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            if index_name in index_names:
+                log_info(f"-- Dropping index {index_name} from {table_name}")
+                sess.execute(text(f"DROP INDEX {index_name}"))
+                applied = True
+
+        return applied
+
+
+async def _revert_async_sqlite(db: AsyncBaseDb, table_name: str) -> bool:
+    """Revert: drop composite session-list indexes from sessions table for async SQLite."""
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        result = await sess.execute(text(f"PRAGMA index_list({table_name})"))
+        index_names = {idx[1] for idx in result.fetchall()}
+
+        applied = False
+        for columns in SESSION_LIST_INDEX_COLUMNS:
+            index_name = _index_name(table_name, columns)
+            if index_name in index_names:
+                log_info(f"-- Dropping index {index_name} from {table_name}")
+                await sess.execute(text(f"DROP INDEX {index_name}"))
+                applied = True
+
+        return applied
@@ -14,12 +14,14 @@ from agno.db.postgres.utils import (
     acreate_schema,
     ais_table_available,
     ais_valid_table,
+    apply_session_filters,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
     serialize_cultural_knowledge,
+    session_summary_columns,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
@@ -29,7 +31,13 @@ from agno.db.schemas.service_accounts import (
     resolve_service_account_sort_column,
     validate_service_account_update,
 )
-from agno.db.utils import deserialize_session, deserialize_sessions, json_serializer, learning_search_patterns
+from agno.db.utils import (
+    deserialize_session,
+    deserialize_sessions,
+    json_serializer,
+    learning_search_patterns,
+    session_to_dict_with_title,
+)
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -662,6 +670,40 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             return None
 
+    async def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a session exists without reading its row.
+
+        Args:
+            session_id (str): ID of the session to look up.
+            session_type (Optional[SessionType]): Type of session to filter by. Defaults to None.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return False
+
+            async with self.async_session_factory() as sess:
+                stmt = select(table.c.session_id).where(table.c.session_id == session_id)
+
+                if session_type is not None:
+                    stmt = stmt.where(table.c.session_type == session_type.value)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+
+                result = await sess.execute(stmt.limit(1))
+                return result.first() is not None
+
+        except Exception as e:
+            log_error(f"Exception reading from session table: {str(e)}")
+            raise e
+
     async def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -707,33 +749,16 @@ class AsyncPostgresDb(AsyncBaseDb):
             async with self.async_session_factory() as sess, sess.begin():
                 stmt = select(table)
 
-                # Filtering
-                if user_id is not None:
-                    stmt = stmt.where(table.c.user_id == user_id)
-                if component_id is not None:
-                    if session_type == SessionType.AGENT:
-                        stmt = stmt.where(table.c.agent_id == component_id)
-                    elif session_type == SessionType.TEAM:
-                        stmt = stmt.where(table.c.team_id == component_id)
-                    elif session_type == SessionType.WORKFLOW:
-                        stmt = stmt.where(table.c.workflow_id == component_id)
-                    elif session_type is None:
-                        stmt = stmt.where(
-                            (table.c.agent_id == component_id)
-                            | (table.c.team_id == component_id)
-                            | (table.c.workflow_id == component_id)
-                        )
-                if start_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at >= start_timestamp)
-                if end_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at <= end_timestamp)
-                if session_name is not None:
-                    stmt = stmt.where(
-                        func.coalesce(table.c.session_data["session_name"].astext, "").ilike(f"%{session_name}%")
-                    )
-                if session_type is not None:
-                    session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                    stmt = stmt.where(table.c.session_type == session_type_value)
+                stmt = apply_session_filters(
+                    stmt,
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
 
                 count_stmt = select(func.count()).select_from(stmt.alias())
                 total_count = await sess.scalar(count_stmt) or 0
@@ -762,6 +787,65 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             return [] if deserialize else ([], 0)
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of sessions as dictionaries for a session listing, without the runs of named sessions.
+
+        Takes the same filters as get_sessions. Runs are only read for sessions that have no stored
+        session name, since the listing derives the name from them.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The session dictionaries and the total count matching the filters.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return [], 0
+
+            async with self.async_session_factory() as sess, sess.begin():
+                stmt = apply_session_filters(
+                    select(*session_summary_columns(table)),
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
+
+                count_stmt = select(func.count()).select_from(stmt.alias())
+                total_count = await sess.scalar(count_stmt) or 0
+
+                # Sorting
+                stmt = apply_sorting(stmt, table, sort_by, sort_order)
+
+                # Paginating
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                    if page is not None:
+                        stmt = stmt.offset((page - 1) * limit)
+
+                result = await sess.execute(stmt)
+                records = result.fetchall()
+                return [dict(record._mapping) for record in records], total_count
+
+        except Exception as e:
+            log_error(f"Exception reading from session table: {str(e)}")
+            return [], 0
+
     async def rename_session(
         self,
         session_id: str,
@@ -854,7 +938,7 @@ class AsyncPostgresDb(AsyncBaseDb):
             table = await self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return None
-            session_dict = session.to_dict()
+            session_dict = session_to_dict_with_title(session)
             # Sanitize JSON/dict fields to remove null bytes from nested strings
             if session_dict.get("agent_data"):
                 session_dict["agent_data"] = sanitize_postgres_strings(session_dict["agent_data"])
@@ -11,6 +11,7 @@ from agno.db.base import BaseDb, ComponentType, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
+    apply_session_filters,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
@@ -21,6 +22,7 @@ from agno.db.postgres.utils import (
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge,
+    session_summary_columns,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
@@ -38,7 +40,13 @@ from agno.db.schemas.service_accounts import (
     resolve_service_account_sort_column,
     validate_service_account_update,
 )
-from agno.db.utils import deserialize_session, deserialize_sessions, json_serializer, learning_search_patterns
+from agno.db.utils import (
+    deserialize_session,
+    deserialize_sessions,
+    json_serializer,
+    learning_search_patterns,
+    session_to_dict_with_title,
+)
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -849,6 +857,40 @@ class PostgresDb(BaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             raise e
 
+    def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a session exists without reading its row.
+
+        Args:
+            session_id (str): ID of the session to look up.
+            session_type (Optional[SessionType]): Type of session to filter by. Defaults to None.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return False
+
+            with self.Session() as sess:
+                stmt = select(table.c.session_id).where(table.c.session_id == session_id)
+
+                if session_type is not None:
+                    stmt = stmt.where(table.c.session_type == session_type.value)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+
+                result = sess.execute(stmt.limit(1))
+                return result.first() is not None
+
+        except Exception as e:
+            log_error(f"Exception reading from session table: {str(e)}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -895,33 +937,16 @@ class PostgresDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
 
-                # Filtering
-                if user_id is not None:
-                    stmt = stmt.where(table.c.user_id == user_id)
-                if component_id is not None:
-                    if session_type == SessionType.AGENT:
-                        stmt = stmt.where(table.c.agent_id == component_id)
-                    elif session_type == SessionType.TEAM:
-                        stmt = stmt.where(table.c.team_id == component_id)
-                    elif session_type == SessionType.WORKFLOW:
-                        stmt = stmt.where(table.c.workflow_id == component_id)
-                    elif session_type is None:
-                        stmt = stmt.where(
-                            (table.c.agent_id == component_id)
-                            | (table.c.team_id == component_id)
-                            | (table.c.workflow_id == component_id)
-                        )
-                if start_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at >= start_timestamp)
-                if end_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at <= end_timestamp)
-                if session_name is not None:
-                    stmt = stmt.where(
-                        func.coalesce(table.c.session_data["session_name"].astext, "").ilike(f"%{session_name}%")
-                    )
-                if session_type is not None:
-                    session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                    stmt = stmt.where(table.c.session_type == session_type_value)
+                stmt = apply_session_filters(
+                    stmt,
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
 
                 count_stmt = select(func.count()).select_from(stmt.alias())
                 total_count = sess.execute(count_stmt).scalar() or 0
@@ -949,6 +974,67 @@ class PostgresDb(BaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             raise e
 
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of sessions as dictionaries for a session listing, without the runs of named sessions.
+
+        Takes the same filters as get_sessions. Runs are only read for sessions that have no stored
+        session name, since the listing derives the name from them.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The session dictionaries and the total count matching the filters.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return [], 0
+
+            with self.Session() as sess, sess.begin():
+                stmt = apply_session_filters(
+                    select(*session_summary_columns(table)),
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
+
+                count_stmt = select(func.count()).select_from(stmt.alias())
+                total_count = sess.execute(count_stmt).scalar() or 0
+
+                # Sorting
+                stmt = apply_sorting(stmt, table, sort_by, sort_order)
+
+                # Paginating
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                    if page is not None:
+                        stmt = stmt.offset((page - 1) * limit)
+
+                records = sess.execute(stmt).fetchall()
+                return [dict(record._mapping) for record in records], total_count
+
+        except Exception as e:
+            log_error(f"Exception reading from session table: {str(e)}")
+            raise e
+
     def rename_session(
         self,
         session_id: str,
@@ -1042,7 +1128,7 @@ class PostgresDb(BaseDb):
             if table is None:
                 return None
 
-            session_dict = session.to_dict()
+            session_dict = session_to_dict_with_title(session)
             # Sanitize JSON/dict fields to remove null bytes from nested strings
             if session_dict.get("agent_data"):
                 session_dict["agent_data"] = sanitize_postgres_strings(session_dict["agent_data"])
@@ -1219,7 +1305,7 @@ class PostgresDb(BaseDb):
             if agent_sessions:
                 session_records = []
                 for agent_session in agent_sessions:
-                    session_dict = agent_session.to_dict()
+                    session_dict = session_to_dict_with_title(agent_session)
                     # Sanitize JSON/dict fields to remove null bytes from nested strings
                     if session_dict.get("agent_data"):
                         session_dict["agent_data"] = sanitize_postgres_strings(session_dict["agent_data"])
@@ -1278,7 +1364,7 @@ class PostgresDb(BaseDb):
             if team_sessions:
                 session_records = []
                 for team_session in team_sessions:
-                    session_dict = team_session.to_dict()
+                    session_dict = session_to_dict_with_title(team_session)
                     # Sanitize JSON/dict fields to remove null bytes from nested strings
                     if session_dict.get("team_data"):
                         session_dict["team_data"] = sanitize_postgres_strings(session_dict["team_data"])
@@ -1337,7 +1423,7 @@ class PostgresDb(BaseDb):
             if workflow_sessions:
                 session_records = []
                 for workflow_session in workflow_sessions:
-                    session_dict = workflow_session.to_dict()
+                    session_dict = session_to_dict_with_title(workflow_session)
                     # Sanitize JSON/dict fields to remove null bytes from nested strings
                     if session_dict.get("workflow_data"):
                         session_dict["workflow_data"] = sanitize_postgres_strings(session_dict["workflow_data"])
@@ -8,12 +8,13 @@ from uuid import uuid4
 from sqlalchemy import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from agno.db.base import SessionType
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import Table, and_, case, func
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.exc import NoSuchTableError
     from sqlalchemy.inspection import inspect
@@ -61,6 +62,62 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def apply_session_filters(
+    stmt,
+    table: Table,
+    session_type: Optional[SessionType] = None,
+    user_id: Optional[str] = None,
+    component_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+):
+    """Apply the `get_sessions` filters to a select on the sessions table.
+
+    Returns:
+        The modified statement with the filters applied
+    """
+    if user_id is not None:
+        stmt = stmt.where(table.c.user_id == user_id)
+    if component_id is not None:
+        if session_type == SessionType.AGENT:
+            stmt = stmt.where(table.c.agent_id == component_id)
+        elif session_type == SessionType.TEAM:
+            stmt = stmt.where(table.c.team_id == component_id)
+        elif session_type == SessionType.WORKFLOW:
+            stmt = stmt.where(table.c.workflow_id == component_id)
+        elif session_type is None:
+            stmt = stmt.where(
+                (table.c.agent_id == component_id)
+                | (table.c.team_id == component_id)
+                | (table.c.workflow_id == component_id)
+            )
+    if start_timestamp is not None:
+        stmt = stmt.where(table.c.created_at >= start_timestamp)
+    if end_timestamp is not None:
+        stmt = stmt.where(table.c.created_at <= end_timestamp)
+    if session_name is not None:
+        stmt = stmt.where(func.coalesce(table.c.session_data["session_name"].astext, "").ilike(f"%{session_name}%"))
+    if session_type is not None:
+        session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+        stmt = stmt.where(table.c.session_type == session_type_value)
+    return stmt
+
+
+def session_summary_columns(table: Table) -> List[Any]:
+    """Columns of the sessions table for session listings.
+
+    Listings never show runs; they only need them to derive a name for sessions that have
+    none stored. `runs` is therefore only read for rows with neither `session_data.session_name`
+    nor the precomputed `session_data.session_title`, and is NULL otherwise, which skips the
+    largest column for every named or titled session.
+    """
+    session_name = table.c.session_data["session_name"].astext
+    session_title = table.c.session_data["session_title"].astext
+    runs = case((and_(session_name.is_(None), session_title.is_(None)), table.c.runs)).label("runs")
+    return [column for column in table.c if column.name != "runs"] + [runs]
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
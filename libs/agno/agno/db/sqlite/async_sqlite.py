@@ -25,18 +25,21 @@ from agno.db.sqlite.utils import (
     abulk_upsert_metrics,
     ais_table_available,
     ais_valid_table,
+    apply_session_filters,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
     serialize_cultural_knowledge_for_db,
+    session_summary_columns,
 )
 from agno.db.utils import (
     deserialize_session,
     deserialize_session_json_fields,
     deserialize_sessions,
     serialize_session_json_fields,
+    session_to_dict_with_title,
 )
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
@@ -644,6 +647,40 @@ class AsyncSqliteDb(AsyncBaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    async def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a session exists without reading its row.
+
+        Args:
+            session_id (str): ID of the session to look up.
+            session_type (Optional[SessionType]): Type of session to filter by. Defaults to None.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return False
+
+            async with self.async_session_factory() as sess, sess.begin():
+                stmt = select(table.c.session_id).where(table.c.session_id == session_id)
+
+                if session_type is not None:
+                    stmt = stmt.where(table.c.session_type == session_type.value)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+
+                result = await sess.execute(stmt.limit(1))
+                return result.first() is not None
+
+        except Exception as e:
+            log_debug(f"Exception reading from sessions table: {e}")
+            raise e
+
     async def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -689,30 +726,16 @@ class AsyncSqliteDb(AsyncBaseDb):
             async with self.async_session_factory() as sess, sess.begin():
                 stmt = select(table)
 
-                # Filtering
-                if user_id is not None:
-                    stmt = stmt.where(table.c.user_id == user_id)
-                if component_id is not None:
-                    if session_type == SessionType.AGENT:
-                        stmt = stmt.where(table.c.agent_id == component_id)
-                    elif session_type == SessionType.TEAM:
-                        stmt = stmt.where(table.c.team_id == component_id)
-                    elif session_type == SessionType.WORKFLOW:
-                        stmt = stmt.where(table.c.workflow_id == component_id)
-                    elif session_type is None:
-                        stmt = stmt.where(
-                            (table.c.agent_id == component_id)
-                            | (table.c.team_id == component_id)
-                            | (table.c.workflow_id == component_id)
-                        )
-                if start_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at >= start_timestamp)
-                if end_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at <= end_timestamp)
-                if session_name is not None:
-                    stmt = stmt.where(table.c.session_data.like(f"%{session_name}%"))
-                if session_type is not None:
-                    stmt = stmt.where(table.c.session_type == session_type.value)
+                stmt = apply_session_filters(
+                    stmt,
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
 
                 # Getting total count
                 count_stmt = select(func.count()).select_from(stmt.alias())
@@ -745,6 +768,69 @@ class AsyncSqliteDb(AsyncBaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of sessions as dictionaries for a session listing, without the runs of named sessions.
+
+        Takes the same filters as get_sessions. Runs are only read for sessions that have no stored
+        session name, since the listing derives the name from them.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The session dictionaries and the total count matching the filters.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return [], 0
+
+            async with self.async_session_factory() as sess, sess.begin():
+                stmt = apply_session_filters(
+                    select(*session_summary_columns(table)),
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
+
+                count_stmt = select(func.count()).select_from(stmt.alias())
+                count_result = await sess.execute(count_stmt)
+                total_count = count_result.scalar() or 0
+
+                # Sorting
+                stmt = apply_sorting(stmt, table, sort_by, sort_order)
+
+                # Paginating
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                    if page is not None:
+                        stmt = stmt.offset((page - 1) * limit)
+
+                result = await sess.execute(stmt)
+                records = result.fetchall()
+                return [deserialize_session_json_fields(dict(record._mapping)) for record in records], total_count
+
+        except Exception as e:
+            log_debug(f"Exception reading from sessions table: {e}")
+            raise e
+
     async def rename_session(
         self,
         session_id: str,
@@ -813,7 +899,7 @@ class AsyncSqliteDb(AsyncBaseDb):
             if table is None:
                 return None
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
 
             if isinstance(session, AgentSession):
                 async with self.async_session_factory() as sess, sess.begin():
@@ -989,7 +1075,7 @@ class AsyncSqliteDb(AsyncBaseDb):
                 if agent_sessions:
                     agent_data = []
                     for session in agent_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         agent_data.append(
@@ -1044,7 +1130,7 @@ class AsyncSqliteDb(AsyncBaseDb):
                 if team_sessions:
                     team_data = []
                     for session in team_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         team_data.append(
@@ -1099,7 +1185,7 @@ class AsyncSqliteDb(AsyncBaseDb):
                 if workflow_sessions:
                     workflow_data = []
                     for session in workflow_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         workflow_data.append(
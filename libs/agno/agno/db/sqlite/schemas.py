@@ -26,6 +26,11 @@ SESSION_TABLE_SCHEMA = {
     "summary": {"type": JSON, "nullable": True},
     "created_at": {"type": BigInteger, "nullable": False, "index": True},
     "updated_at": {"type": BigInteger, "nullable": True},
+    "__composite_indexes__": [
+        {"name": "agent_user_created", "columns": ["agent_id", "user_id", "created_at"]},
+        {"name": "team_user_created", "columns": ["team_id", "user_id", "created_at"]},
+        {"name": "workflow_user_created", "columns": ["workflow_id", "user_id", "created_at"]},
+    ],
 }
 
 USER_MEMORY_TABLE_SCHEMA = {
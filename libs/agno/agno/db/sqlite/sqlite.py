@@ -29,6 +29,7 @@ from agno.db.schemas.service_accounts import (
 )
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
+    apply_session_filters,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
@@ -38,6 +39,7 @@ from agno.db.sqlite.utils import (
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
+    session_summary_columns,
 )
 from agno.db.utils import (
     deserialize_session,
@@ -45,6 +47,7 @@ from agno.db.utils import (
     deserialize_sessions,
     learning_search_patterns,
     serialize_session_json_fields,
+    session_to_dict_with_title,
 )
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
@@ -836,6 +839,40 @@ class SqliteDb(BaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def session_exists(
+        self, session_id: str, session_type: Optional[SessionType] = None, user_id: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a session exists without reading its row.
+
+        Args:
+            session_id (str): ID of the session to look up.
+            session_type (Optional[SessionType]): Type of session to filter by. Defaults to None.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            bool: True if the session exists.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return False
+
+            with self.Session() as sess, sess.begin():
+                stmt = select(table.c.session_id).where(table.c.session_id == session_id)
+
+                if session_type is not None:
+                    stmt = stmt.where(table.c.session_type == session_type.value)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+
+                result = sess.execute(stmt.limit(1))
+                return result.first() is not None
+
+        except Exception as e:
+            log_debug(f"Exception reading from sessions table: {e}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -882,30 +919,16 @@ class SqliteDb(BaseDb):
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
 
-                # Filtering
-                if user_id is not None:
-                    stmt = stmt.where(table.c.user_id == user_id)
-                if component_id is not None:
-                    if session_type == SessionType.AGENT:
-                        stmt = stmt.where(table.c.agent_id == component_id)
-                    elif session_type == SessionType.TEAM:
-                        stmt = stmt.where(table.c.team_id == component_id)
-                    elif session_type == SessionType.WORKFLOW:
-                        stmt = stmt.where(table.c.workflow_id == component_id)
-                    elif session_type is None:
-                        stmt = stmt.where(
-                            (table.c.agent_id == component_id)
-                            | (table.c.team_id == component_id)
-                            | (table.c.workflow_id == component_id)
-                        )
-                if start_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at >= start_timestamp)
-                if end_timestamp is not None:
-                    stmt = stmt.where(table.c.created_at <= end_timestamp)
-                if session_name is not None:
-                    stmt = stmt.where(table.c.session_data.like(f"%{session_name}%"))
-                if session_type is not None:
-                    stmt = stmt.where(table.c.session_type == session_type.value)
+                stmt = apply_session_filters(
+                    stmt,
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
 
                 # Getting total count
                 count_stmt = select(func.count()).select_from(stmt.alias())
@@ -936,6 +959,67 @@ class SqliteDb(BaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of sessions as dictionaries for a session listing, without the runs of named sessions.
+
+        Takes the same filters as get_sessions. Runs are only read for sessions that have no stored
+        session name, since the listing derives the name from them.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The session dictionaries and the total count matching the filters.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return [], 0
+
+            with self.Session() as sess, sess.begin():
+                stmt = apply_session_filters(
+                    select(*session_summary_columns(table)),
+                    table,
+                    session_type=session_type,
+                    user_id=user_id,
+                    component_id=component_id,
+                    session_name=session_name,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                )
+
+                count_stmt = select(func.count()).select_from(stmt.alias())
+                total_count = sess.execute(count_stmt).scalar() or 0
+
+                # Sorting
+                stmt = apply_sorting(stmt, table, sort_by, sort_order)
+
+                # Paginating
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                    if page is not None:
+                        stmt = stmt.offset((page - 1) * limit)
+
+                records = sess.execute(stmt).fetchall()
+                return [deserialize_session_json_fields(dict(record._mapping)) for record in records], total_count
+
+        except Exception as e:
+            log_debug(f"Exception reading from sessions table: {e}")
+            raise e
+
     def rename_session(
         self,
         session_id: str,
@@ -1005,7 +1089,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -1181,7 +1265,7 @@ class SqliteDb(BaseDb):
                 if agent_sessions:
                     agent_data = []
                     for session in agent_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         agent_data.append(
@@ -1236,7 +1320,7 @@ class SqliteDb(BaseDb):
                 if team_sessions:
                     team_data = []
                     for session in team_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         team_data.append(
@@ -1291,7 +1375,7 @@ class SqliteDb(BaseDb):
                 if workflow_sessions:
                     workflow_data = []
                     for session in workflow_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(session_to_dict_with_title(session))
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         workflow_data.append(
@@ -5,6 +5,8 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
+from pydantic import BaseModel
+
 from agno.metrics import ModelMetrics, RunMetrics, SessionMetrics
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
@@ -189,6 +191,161 @@ def get_sort_value(record: Dict[str, Any], sort_by: str) -> Any:
     return value
 
 
+def stringify_input_content(input_content: Union[str, Dict[str, Any], List[Any], BaseModel]) -> str:
+    """Convert any given input_content into its string representation.
+
+    This handles both serialized (dict) and live (object) input_content formats.
+    """
+    if isinstance(input_content, str):
+        return input_content
+    elif isinstance(input_content, Message):
+        return json.dumps(input_content.to_dict())
+    elif isinstance(input_content, dict):
+        return json.dumps(input_content, indent=2, default=str)
+    elif isinstance(input_content, list):
+        if input_content:
+            # Handle live Message objects
+            if isinstance(input_content[0], Message):
+                return json.dumps([m.to_dict() for m in input_content])
+            # Handle serialized Message dicts
+            elif isinstance(input_content[0], dict) and input_content[0].get("role") == "user":
+                return input_content[0].get("content", str(input_content))
+        return str(input_content)
+    else:
+        return str(input_content)
+
+
+def get_session_title(session: Dict[str, Any]) -> str:
+    """Derive a display title for a session from its runs.
+
+    Workflow sessions are titled by the input of their first run. Agent and team sessions
+    are titled by the first user message (or input) across their runs, where team sessions
+    only consider team runs and skip member runs.
+    """
+    runs = session.get("runs", []) or []
+    session_type = session.get("session_type")
+
+    # Handle workflows separately
+    if session_type == "workflow":
+        if not runs:
+            return ""
+        # Only the first run names a workflow session, so only that one is converted
+        workflow_run = runs[0] if isinstance(runs[0], dict) else runs[0].to_dict()
+        workflow_input = workflow_run.get("input")
+        if isinstance(workflow_input, str):
+            return workflow_input
+        elif isinstance(workflow_input, dict):
+            try:
+                return json.dumps(workflow_input)
+            except (TypeError, ValueError):
+                pass
+        workflow_name = (session.get("workflow_data") or {}).get("name")
+        return f"New {workflow_name} Session" if workflow_name else ""
+
+    # Find the first user message across runs. Runs may be dicts or run objects; objects are
+    # only converted once they are known to be candidates, so the scan stops at the first match.
+    for r in runs:
+        if r is None:
+            continue
+        # For team, only team runs (runs without agent_id) name the session; for agents, use all runs
+        if session_type == "team" and (r.get("agent_id") if isinstance(r, dict) else getattr(r, "agent_id", None)):
+            continue
+        run_dict = r if isinstance(r, dict) else r.to_dict()
+
+        first_user_message = next(
+            (m["content"] for m in run_dict.get("messages") or () if m.get("role") == "user" and m.get("content")),
+            None,
+        )
+        if first_user_message is not None:
+            return first_user_message
+
+        run_input = run_dict.get("input")
+        if run_input is not None:
+            return stringify_input_content(run_input)
+
+    return ""
+
+
+def _get_final_session_title(session_type: str, runs: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+    """Return a session's title only once later writes can no longer change it, else None.
+
+    A workflow session is titled by the input of its first run, which is fixed when that run
+    starts. Agent and team sessions are titled by the first user message of their first (team)
+    run; until that run has its messages, for example while a background run is still pending,
+    the title is derived from the raw run input and would change, so nothing is returned.
+    """
+    if not runs:
+        return None
+
+    if session_type == "workflow":
+        workflow_input = runs[0].get("input") if runs[0] else None
+        if not isinstance(workflow_input, (str, dict)):
+            return None
+        return get_session_title({"session_type": "workflow", "runs": runs[:1]}) or None
+
+    for run in runs:
+        if run is None:
+            continue
+        # For team, only team runs (runs without agent_id) name the session; for agents, use all runs
+        if session_type == "team" and run.get("agent_id"):
+            continue
+        return next(
+            (m["content"] for m in run.get("messages") or () if m.get("role") == "user" and m.get("content")),
+            None,
+        )
+    return None
+
+
+def session_to_dict_with_title(session: "Session") -> Dict[str, Any]:
+    """Convert a session to a dictionary for storage, precomputing its title under session_data.session_title.
+
+    Session lists can then read the title from session_data instead of loading every run. The
+    title is derived from the runs being written on every call, so rewriting or replacing the
+    first run also rewrites the title, and only a final title is stored (see
+    `_get_final_session_title`). The key is storage-only: the session classes drop it again
+    when a stored row is loaded.
+
+    Args:
+        session (Session): The session about to be written.
+
+    Returns:
+        Dict[str, Any]: The session dictionary, with session_data.session_title set once the title is final.
+    """
+    from agno.session import TeamSession, WorkflowSession
+
+    session_dict = session.to_dict()
+    session_data = session_dict.get("session_data") or {}
+    if "session_title" in session_data:
+        session_data = {key: value for key, value in session_data.items() if key != "session_title"}
+        session_dict["session_data"] = session_data
+    if session_data.get("session_name") is not None:
+        return session_dict
+
+    if isinstance(session, WorkflowSession):
+        session_type = "workflow"
+    elif isinstance(session, TeamSession):
+        session_type = "team"
+    else:
+        session_type = "agent"
+
+    title = _get_final_session_title(session_type, session_dict.get("runs"))
+    if title:
+        session_dict["session_data"] = {**session_data, "session_title": title}
+    return session_dict
+
+    if isinstance(session, WorkflowSession):
+        session_type = "workflow"
+    elif isinstance(session, TeamSession):
+        session_type = "team"
+    else:
+        session_type = "agent"
+
+    title = _get_final_session_title(session_type, session_dict.get("runs"))
+    if title:
+        session_dict["session_data"] = {**session_data, "session_title": title}
+    return session_dict
+
+
 def learning_search_patterns(query: str) -> List[str]:
     """Build the ILIKE patterns for a learnings text search.
 
@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, field_validator, model_validator
@@ -378,6 +378,39 @@ class Video(BaseModel):
         return {k: v for k, v in result.items() if v is not None}
 
 
+# NOTE: Keep this in sync with `DOCUMENT_MIME_TYPES` in agno.os.utils. Every MIME type
+# the upload routers accept must be valid here, otherwise FileMedia construction fails
+# and the file is silently dropped. Not all of these are accepted by every model
+# provider (e.g. Anthropic/Gemini reject Office binary formats); those fail at the
+# model with a provider error rather than being dropped at upload.
+FILE_MIME_TYPES: FrozenSet[str] = frozenset(
+    {
+        "application/pdf",
+        "application/json",
+        "application/x-javascript",
+        # Office Open XML (modern Office formats)
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
+        # Legacy binary Office formats
+        "application/msword",  # .doc
+        "application/vnd.ms-powerpoint",  # .ppt
+        "application/vnd.ms-excel",  # .xls
+        "application/vnd.ms-outlook",  # .msg
+        "text/javascript",
+        "application/x-python",
+        "text/x-python",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/markdown",
+        "text/csv",
+        "text/xml",
+        "text/rtf",
+    }
+)
+
+
 class File(BaseModel):
     id: Optional[str] = None
     url: Optional[str] = None
@@ -415,41 +448,13 @@ class File(BaseModel):
     @classmethod
     def validate_mime_type(cls, v):
         """Validate that the mime_type is one of the allowed types."""
-        if v is not None and v not in cls.valid_mime_types():
+        if v is not None and v not in FILE_MIME_TYPES:
             raise ValueError(f"Invalid MIME type: {v}. Must be one of: {cls.valid_mime_types()}")
         return v
 
     @classmethod
     def valid_mime_types(cls) -> List[str]:
-        # NOTE: Keep this in sync with `DOCUMENT_MIME_TYPES` in agno.os.utils. Every MIME type
-        # the upload routers accept must be valid here, otherwise FileMedia construction fails
-        # and the file is silently dropped. Not all of these are accepted by every model
-        # provider (e.g. Anthropic/Gemini reject Office binary formats); those fail at the
-        # model with a provider error rather than being dropped at upload.
-        return [
-            "application/pdf",
-            "application/json",
-            "application/x-javascript",
-            # Office Open XML (modern Office formats)
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
-            # Legacy binary Office formats
-            "application/msword",  # .doc
-            "application/vnd.ms-powerpoint",  # .ppt
-            "application/vnd.ms-excel",  # .xls
-            "application/vnd.ms-outlook",  # .msg
-            "text/javascript",
-            "application/x-python",
-            "text/x-python",
-            "text/plain",
-            "text/html",
-            "text/css",
-            "text/markdown",
-            "text/csv",
-            "text/xml",
-            "text/rtf",
-        ]
+        return sorted(FILE_MIME_TYPES)
 
     @classmethod
     def from_base64(
@@ -104,11 +104,14 @@ async def mcp_lifespan(_, mcp_tools):
 @asynccontextmanager
 async def http_client_lifespan(_):
     """Manage httpx client lifecycle for proper connection pool cleanup."""
+    from agno.api.api import api
     from agno.utils.http import aclose_default_clients
 
+    await api.aopen()
     yield
 
     await aclose_default_clients()
+    await api.aclose()
 
 
 async def _drain_cancel_persist_tasks(timeout: float = 30.0) -> None:
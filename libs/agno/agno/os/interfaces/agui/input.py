@@ -9,7 +9,7 @@ from ag_ui.core.types import Tool as AGUITool
 from ag_ui.core.types import ToolMessage as AGUIToolMessage
 from pydantic import BaseModel
 
-from agno.media import Audio, File, Image, Video
+from agno.media import FILE_MIME_TYPES, Audio, File, Image, Video
 from agno.tools.function import Function
 from agno.utils.log import log_warning
 
@@ -87,7 +87,7 @@ def extract_media(
                     videos.append(Video(url=url, content=content, mime_type=mime))
                 else:
                     # File validates MIME — pass None for unsupported types to avoid raising
-                    safe_mime = mime if mime in File.valid_mime_types() else None
+                    safe_mime = mime if mime in FILE_MIME_TYPES else None
                     files.append(File(url=url, content=content, mime_type=safe_mime, filename=filename))
 
         return images, audio, videos, files
@@ -1,8 +1,10 @@
+import asyncio
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
-from agno.media import Audio, File, Image, Video
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.media import FILE_MIME_TYPES, Audio, File, Image, Video
 from agno.utils.log import log_error, log_warning
 
 
@@ -22,8 +24,15 @@ async def resolve_session_id(entity: Any, entity_id: str, channel_id: str, threa
     # Probe for existing legacy session so an upgrade doesn't orphan history.
     legacy_id = f"{entity_id}:{thread_ts}"
     try:
-        session = await entity.aget_session(session_id=legacy_id)
-        if session is not None:
+        # Only existence matters here, so skip reading and deserializing the session when the db can answer directly
+        db = getattr(entity, "db", None)
+        if isinstance(db, AsyncBaseDb):
+            legacy_exists = await db.session_exists(session_id=legacy_id)
+        elif isinstance(db, BaseDb):
+            legacy_exists = await asyncio.to_thread(db.session_exists, session_id=legacy_id)
+        else:
+            legacy_exists = await entity.aget_session(session_id=legacy_id) is not None
+        if legacy_exists:
             return legacy_id
     except Exception:
         pass
@@ -238,7 +247,7 @@ async def download_event_files_async(
                     audio.append(Audio(content=file_content, mime_type=mimetype))
                 else:
                     # Pass None for unsupported types to avoid File validation errors
-                    safe_mime = mimetype if mimetype in File.valid_mime_types() else None
+                    safe_mime = mimetype if mimetype in FILE_MIME_TYPES else None
                     files.append(File(content=file_content, filename=filename, mime_type=safe_mime))
             except Exception as e:
                 log_error(f"Failed to download file {file_id}: {str(e)}")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import time
@@ -179,7 +180,8 @@ def attach_routes(
                 if cfg.is_async_db:
                     await cfg.db.upsert_session(session)
                 else:
-                    cfg.db.upsert_session(session)
+                    # Sync DB would block the event loop; offload to a thread
+                    await asyncio.to_thread(cfg.db.upsert_session, session)
                 await send_message(bot, chat_id, new_message, message_thread_id=message_thread_id)
             except Exception as e:
                 log_warning(f"Failed to persist new session to DB: {str(e)}")
@@ -251,7 +251,8 @@ def attach_routes(
                     if session_config.is_async_db:
                         await session_config.db.upsert_session(new_session)
                     else:
-                        session_config.db.upsert_session(new_session)
+                        # Sync DB would block the event loop; offload to a thread
+                        await asyncio.to_thread(session_config.db.upsert_session, new_session)
                     await send_whatsapp_message_async(phone_number, _SESSION_RESET_MESSAGE, config)
                 except Exception as e:
                     log_warning(f"Failed to persist /new session: {str(e)}")
@@ -277,7 +278,7 @@ def attach_routes(
                     if session_config.is_async_db:
                         sessions = await session_config.db.get_sessions(**session_filter)
                     else:
-                        sessions = session_config.db.get_sessions(**session_filter)
+                        sessions = await asyncio.to_thread(session_config.db.get_sessions, **session_filter)
                     if sessions:
                         session_id = sessions[0].session_id
                 except Exception as e:
@@ -39,6 +39,7 @@ isolation disabled get ``None`` from ``get_scoped_user_id`` — both helpers
 become no-ops in that case, preserving the legacy unscoped behaviour.
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from fastapi import HTTPException, Query, Request
@@ -392,7 +393,8 @@ async def verify_run_in_session_via_db(
     if isinstance(db, AsyncBaseDb):
         session = await db.get_session(session_id=session_id, user_id=user_id)
     else:
-        session = db.get_session(session_id=session_id, user_id=user_id)
+        # Sync DB would block the event loop; offload to a thread
+        session = await asyncio.to_thread(db.get_session, session_id=session_id, user_id=user_id)
 
     if session is None:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -1,7 +1,7 @@
 import asyncio
 import json
-from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Literal, Optional, Union, cast
-from uuid import uuid4
+import traceback
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Awaitable, Callable, Dict, List, Literal, Optional, Union, cast
 
 from fastapi import (
     APIRouter,
@@ -14,7 +14,7 @@ from fastapi import (
     Request,
     UploadFile,
 )
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from agno.agent.agent import Agent
 from agno.agent.factory import AgentFactory
@@ -24,6 +24,7 @@ from agno.db.base import BaseDb
 from agno.exceptions import InputCheckError, OutputCheckError, RunNotContinuableError, RunNotFoundError
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
+from agno.models.response import ToolExecution
 from agno.os.auth import (
     get_auth_token_from_request,
     get_authentication_dependency,
@@ -42,6 +43,7 @@ from agno.os.middleware.user_scope import (
 )
 from agno.os.routers.agents.schema import AgentResponse
 from agno.os.schema import (
+    AgentBatchRunRequest,
     BadRequestResponse,
     InternalServerErrorResponse,
     NotFoundResponse,
@@ -50,26 +52,33 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
-    classify_upload_file,
+    SSE_HEADERS,
+    ComponentResponseCache,
+    RunJSONResponse,
+    RunResponseCache,
+    SSEErrorFrame,
+    coalesce_sse_stream,
     find_factory_by_id,
     format_sse_event,
+    format_sse_event_bytes,
     get_agent_by_id,
     get_request_kwargs,
-    process_audio,
-    process_document,
-    process_image,
-    process_video,
+    is_static_component,
+    process_upload_files,
     resolve_agent,
 )
 from agno.registry import Registry
 from agno.run.agent import RunErrorEvent, RunOutput
 from agno.run.base import RunStatus
 from agno.utils.log import log_debug, log_error, log_warning
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import json_dumps_bytes, json_loads, json_serializer
+from agno.utils.string import generate_uuid7
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
 
+RUN_ERROR_FRAME = SSEErrorFrame(RunErrorEvent)
+
 
 def _require_capability(agent: Any, method: str, feature: str) -> None:
     """Raise 501 if the agent does not expose the given method."""
@@ -116,7 +125,7 @@ async def agent_response_streamer(
             **kwargs,
         )
         async for run_response_chunk in run_response:  # type: ignore[union-attr]
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -124,17 +133,12 @@ async def agent_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
-        error_response = RunErrorEvent(
-            content=str(e),
-        )
-        yield format_sse_event(error_response)
+        yield RUN_ERROR_FRAME.render(str(e))
 
 
 async def agent_resumable_response_streamer(
@@ -196,8 +200,6 @@ async def agent_resumable_response_streamer(
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
         error_response = RunErrorEvent(
             content=str(e),
@@ -248,7 +250,7 @@ async def agent_continue_response_streamer(
             **kwargs,
         )
         async for run_response_chunk in continue_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
             content=str(e),
@@ -256,20 +258,13 @@ async def agent_continue_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
 
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
-        error_response = RunErrorEvent(
-            content=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield RUN_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
 
 
 async def agent_resumable_continue_response_streamer(
@@ -336,8 +331,6 @@ async def agent_resumable_continue_response_streamer(
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
         error_response = RunErrorEvent(
             content=str(e),
@@ -529,6 +522,28 @@ async def _resume_stream_generator(
         sse_subscriber_manager.unsubscribe(run_id, queue)
 
 
+async def agent_batch_response_streamer(
+    run_one: Callable[[int, str], Awaitable[Dict[str, Any]]],
+    messages: List[str],
+    max_concurrency: int,
+) -> AsyncGenerator:
+    """NDJSON generator for batch runs. Runs at most ``max_concurrency`` messages at once and yields
+    one line per run in completion order; pending runs are cancelled if the client disconnects."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_run(index: int, message: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_one(index, message)
+
+    tasks = [asyncio.create_task(bounded_run(index, message)) for index, message in enumerate(messages)]
+    try:
+        for next_completed in asyncio.as_completed(tasks):
+            yield json_dumps_bytes(await next_completed) + b"\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 def get_agent_router(
     os: "AgentOS",
     settings: AgnoAPISettings = AgnoAPISettings(),
@@ -548,6 +563,11 @@ def get_agent_router(
         },
     )
 
+    # Responses for code-defined agents, reused across GET /agents requests
+    agent_response_cache = ComponentResponseCache()
+    # Rendered responses of completed `?cache=1` runs, replayed for exact-match repeats
+    run_response_cache = RunResponseCache()
+
     @router.post(
         "/agents/{agent_id}/runs",
         tags=["Agents"],
@@ -605,6 +625,14 @@ def get_agent_router(
             None,
             description="JSON object with factory-specific parameters for dynamic agent construction",
         ),
+        cache: bool = Query(
+            False,
+            description=(
+                "Replay the stored response of an identical earlier completed run instead of running the agent "
+                "again. Replayed runs are not persisted to the session. Requires a session_id; ignored for background "
+                "runs and file uploads."
+            ),
+        ),
     ):
         kwargs = await get_request_kwargs(request, create_agent_run)
 
@@ -649,9 +677,28 @@ def get_agent_router(
             factory_input=factory_input,
         )
 
+        # Replays are scoped to the caller's own session: without a session_id the run would get a
+        # fresh session, so a stored response (with another caller's run and session ids) never applies
+        cache_key: Optional[bytes] = None
+        if (
+            cache
+            and session_id
+            and not background
+            and not files
+            and not any(kwargs.get(k) for k in ("images", "audio", "videos", "files"))
+        ):
+            cache_key = RunResponseCache.fingerprint(
+                agent_id, version, factory_input, user_id, session_id, stream, message, kwargs
+            )
+            cached_body = run_response_cache.get(cache_key)
+            if cached_body is not None:
+                if stream:
+                    return Response(content=cached_body, media_type="text/event-stream", headers=SSE_HEADERS)
+                return Response(content=cached_body, media_type="application/json")
+
         if session_id is None or session_id == "":
             log_debug("Creating new session")
-            session_id = str(uuid4())
+            session_id = generate_uuid7()
 
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
@@ -659,42 +706,7 @@ def get_agent_router(
         input_files: List[FileMedia] = []
 
         if files:
-            for file in files:
-                file_category = classify_upload_file(file)
-                if file_category == "image":
-                    try:
-                        base64_image = process_image(file)
-                        base64_images.append(base64_image)
-                    except Exception as e:
-                        log_error(f"Error processing image {file.filename}: {str(e)}")
-                        continue
-                elif file_category == "audio":
-                    try:
-                        audio = process_audio(file)
-                        base64_audios.append(audio)
-                    except Exception as e:
-                        log_error(
-                            f"Error processing audio {file.filename} with content type {file.content_type}: {str(e)}"
-                        )
-                        continue
-                elif file_category == "video":
-                    try:
-                        base64_video = process_video(file)
-                        base64_videos.append(base64_video)
-                    except Exception as e:
-                        log_error(f"Error processing video {file.filename}: {str(e)}")
-                        continue
-                elif file_category == "document":
-                    # Process document files
-                    try:
-                        input_file = process_document(file)
-                        if input_file is not None:
-                            input_files.append(input_file)
-                    except Exception as e:
-                        log_error(f"Error processing file {file.filename}: {str(e)}")
-                        continue
-                else:
-                    raise HTTPException(status_code=400, detail="Unsupported file type")
+            base64_images, base64_audios, base64_videos, input_files = await process_upload_files(files)
 
         # Merge media passed as JSON form fields (sent by AgnoClient, e.g. when a team
         # delegates to this agent as a remote member) with media from uploaded files.
@@ -731,6 +743,7 @@ def get_agent_router(
                         **kwargs,
                     ),
                     media_type="text/event-stream",
+                    headers=SSE_HEADERS,
                 )
 
             # background=True, stream=False: return 202 immediately with run metadata
@@ -764,21 +777,25 @@ def get_agent_router(
             )
 
         if stream:
+            frames = agent_response_streamer(
+                agent,
+                message,
+                session_id=session_id,
+                user_id=user_id,
+                images=base64_images if base64_images else None,
+                audio=base64_audios if base64_audios else None,
+                videos=base64_videos if base64_videos else None,
+                files=input_files if input_files else None,
+                background_tasks=background_tasks,
+                auth_token=auth_token,
+                **kwargs,
+            )
+            if cache_key is not None:
+                frames = run_response_cache.tee(cache_key, frames)
             return StreamingResponse(
-                agent_response_streamer(
-                    agent,
-                    message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    files=input_files if input_files else None,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
-                ),
+                coalesce_sse_stream(frames),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         else:
             # Pass auth_token for remote agents
@@ -801,11 +818,113 @@ def get_agent_router(
                         **kwargs,
                     ),
                 )
-                return run_response.to_dict()
+                response = RunJSONResponse(run_response.to_dict())
+                if cache_key is not None and run_response.status == RunStatus.completed:
+                    run_response_cache.set(cache_key, bytes(response.body))
+                return response
 
             except InputCheckError as e:
                 raise HTTPException(status_code=400, detail=str(e))
 
+    @router.post(
+        "/agents/{agent_id}/batch",
+        tags=["Agents"],
+        operation_id="create_agent_batch_run",
+        summary="Create Agent Batch Run",
+        description=(
+            "Run an agent on a list of messages concurrently and stream the results as newline-delimited JSON.\n\n"
+            "Each message runs in its own new session, with at most `max_concurrency` runs in flight. "
+            "Lines are emitted as runs complete, so they are not in request order: every line carries the "
+            "`index` of its message and either the run `response` or an `error`."
+        ),
+        responses={
+            200: {
+                "description": "Batch runs executed",
+                "content": {
+                    "application/x-ndjson": {
+                        "examples": {
+                            "ndjson_stream": {
+                                "summary": "Example batch response",
+                                "value": '{"index":1,"response":{"run_id":"123...","content":"Hi!"}}\n'
+                                '{"index":0,"error":"Input check failed"}\n',
+                            }
+                        }
+                    },
+                },
+            },
+            404: {"description": "Agent not found", "model": NotFoundResponse},
+        },
+        dependencies=[Depends(require_resource_access("agents", "run", "agent_id"))],
+    )
+    async def create_agent_batch_run(
+        agent_id: str,
+        request: Request,
+        batch_request: AgentBatchRunRequest,
+    ):
+        user_id = batch_request.user_id
+        scoped_user_id = get_scoped_user_id(request)
+        if scoped_user_id is not None:
+            user_id = scoped_user_id
+        elif hasattr(request.state, "user_id") and request.state.user_id is not None:
+            user_id = request.state.user_id
+
+        run_kwargs: Dict[str, Any] = {}
+        for key in ("session_state", "dependencies", "metadata"):
+            value = getattr(request.state, key, None)
+            if value is not None:
+                run_kwargs[key] = value
+
+        session_ids = [generate_uuid7() for _ in batch_request.messages]
+
+        # Resolve the first run's agent before streaming, so an unknown agent or a rejected
+        # factory call fails the request instead of every line
+        first_agent = await resolve_agent(
+            agent_id, os.agents, os.db, registry, request=request, user_id=user_id, session_id=session_ids[0]
+        )
+        auth_token = get_auth_token_from_request(request)
+
+        async def run_one(index: int, message: str) -> Dict[str, Any]:
+            try:
+                # Every run gets its own agent instance, like separate run requests would
+                agent = first_agent
+                if index > 0:
+                    agent = await resolve_agent(
+                        agent_id,
+                        os.agents,
+                        os.db,
+                        registry,
+                        request=request,
+                        user_id=user_id,
+                        session_id=session_ids[index],
+                    )
+                kwargs = dict(run_kwargs)
+                if auth_token and isinstance(agent, RemoteAgent):
+                    kwargs["auth_token"] = auth_token
+
+                run_response = cast(
+                    RunOutput,
+                    await agent.arun(  # type: ignore[misc]
+                        input=message,
+                        session_id=session_ids[index],
+                        user_id=user_id,
+                        stream=False,
+                        **kwargs,
+                    ),
+                )
+                return {"index": index, "response": run_response.to_dict()}
+            except HTTPException as e:
+                return {"index": index, "error": e.detail}
+            except (InputCheckError, OutputCheckError) as e:
+                return {"index": index, "error": str(e)}
+            except Exception as e:
+                log_error(f"Error in batch run {index} for agent '{agent_id}': {e}")
+                return {"index": index, "error": str(e)}
+
+        return StreamingResponse(
+            agent_batch_response_streamer(run_one, batch_request.messages, batch_request.max_concurrency),
+            media_type="application/x-ndjson",
+        )
+
     @router.post(
         "/agents/{agent_id}/runs/{run_id}/cancel",
         tags=["Agents"],
@@ -1009,8 +1128,8 @@ def get_agent_router(
 
         # Parse the JSON string manually
         try:
-            tools_data = json.loads(tools) if tools else None
-        except json.JSONDecodeError:
+            tools_data = json_loads(tools) if tools else None
+        except ValueError:
             raise HTTPException(status_code=400, detail="Invalid JSON in tools field")
 
         # Factory agents: re-invoke factory to get a real agent for continue
@@ -1064,8 +1183,6 @@ def get_agent_router(
         updated_tools = None
         if tools_data:
             try:
-                from agno.models.response import ToolExecution
-
                 updated_tools = [ToolExecution.from_dict(tool) for tool in tools_data]
             except Exception as e:
                 raise HTTPException(status_code=400, detail=f"Invalid structure or content for tools: {str(e)}")
@@ -1110,26 +1227,30 @@ def get_agent_router(
                     **kwargs,
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         elif stream:
             return StreamingResponse(
-                agent_continue_response_streamer(
-                    agent,
-                    run_id=run_id,  # run_id from path
-                    updated_tools=updated_tools,
-                    input=input,
-                    continue_from=continue_from_value,
-                    fork=fork,
-                    regenerate=regenerate,
-                    replace_original=replace_original,
-                    additional_instructions=additional_instructions,
-                    session_id=session_id,
-                    user_id=user_id,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
+                coalesce_sse_stream(
+                    agent_continue_response_streamer(
+                        agent,
+                        run_id=run_id,  # run_id from path
+                        updated_tools=updated_tools,
+                        input=input,
+                        continue_from=continue_from_value,
+                        fork=fork,
+                        regenerate=regenerate,
+                        replace_original=replace_original,
+                        additional_instructions=additional_instructions,
+                        session_id=session_id,
+                        user_id=user_id,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                        **kwargs,
+                    )
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         else:
             # Build extra kwargs for remote agent auth
@@ -1157,7 +1278,7 @@ def get_agent_router(
                         **kwargs,
                     ),
                 )
-                return run_response_obj.to_dict()
+                return RunJSONResponse(run_response_obj.to_dict())
 
             except RunNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
@@ -1285,11 +1406,24 @@ def get_agent_router(
         agents: List[AgentResponse] = []
         if accessible_agents:
             for agent in accessible_agents:
+                cached_response = agent_response_cache.get(agent)
+                if cached_response is not None:
+                    if isinstance(agent, Agent) and not is_static_component(agent):
+                        # Only callable tools, MCP toolkits and instructions/system message are re-resolved
+                        cached_response = await cached_response.with_dynamic_config(agent)
+                    agents.append(cached_response)
+                    continue
+
                 if isinstance(agent, Agent):
-                    agents.append(await AgentResponse.from_agent(agent=agent, is_component=False))
+                    agent_response = await AgentResponse.from_agent(agent=agent, is_component=False)
+                    agent_response_cache.set(agent, agent_response)
+                    agents.append(agent_response)
                 elif isinstance(agent, AgentFactory):
-                    agents.append(AgentResponse.from_factory(agent))
+                    agent_response = AgentResponse.from_factory(agent)
+                    agent_response_cache.set(agent, agent_response)
+                    agents.append(agent_response)
                 elif isinstance(agent, RemoteAgent):
+                    # Remote config can change at any time, so it is never cached
                     agents.append(await agent.get_agent_config())
                 else:
                     # External framework adapter: build a minimal response
@@ -1298,16 +1432,16 @@ def get_agent_router(
                         agent_db.session_table_name if agent_db and hasattr(agent_db, "session_table_name") else None
                     )
                     sessions = {"session_table": session_table} if session_table else None
-                    agents.append(
-                        AgentResponse(
-                            id=agent.id,
-                            name=agent.name,
-                            description=getattr(agent, "description", None),
-                            db_id=agent_db.id if agent_db else None,
-                            sessions=sessions,
-                            metadata={"framework": getattr(agent, "framework", "external")},
-                        )
+                    agent_response = AgentResponse(
+                        id=agent.id,
+                        name=agent.name,
+                        description=getattr(agent, "description", None),
+                        db_id=agent_db.id if agent_db else None,
+                        sessions=sessions,
+                        metadata={"framework": getattr(agent, "framework", "external")},
                     )
+                    agent_response_cache.set(agent, agent_response)
+                    agents.append(agent_response)
 
         if os.db and isinstance(os.db, BaseDb):
             from agno.agent.agent import get_agents
@@ -1459,7 +1593,7 @@ def get_agent_router(
         if not run_matches_component(run_output, "agents", agent_id):
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return RunJSONResponse(run_output.to_dict())
 
     @router.get(
         "/agents/{agent_id}/runs/{run_id}/checkpoints",
@@ -1668,6 +1802,7 @@ def get_agent_router(
         return StreamingResponse(
             _resume_stream_generator(agent, run_id, last_event_index, session_id, user_id=scoped_user_id),  # type: ignore[arg-type]
             media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
 
     @router.get(
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
-from uuid import uuid4
 
 from pydantic import BaseModel
 
@@ -12,7 +11,10 @@ from agno.agent import Agent
 from agno.models.message import Message
 from agno.os.schema import ModelResponse
 from agno.os.utils import (
+    INTROSPECTION_RUN_ID,
+    INTROSPECTION_SESSION_ID,
     format_tools,
+    has_mcp_tools,
 )
 from agno.run import RunContext
 from agno.run.agent import RunOutput
@@ -20,6 +22,66 @@ from agno.session import AgentSession
 from agno.utils.agent import aexecute_instructions, aexecute_system_message
 
 
+def _filter_meaningful_config(d: Dict[str, Any], defaults: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Filter out fields that match their default values, keeping only meaningful user configurations"""
+    filtered = {}
+    for key, value in d.items():
+        if value is None:
+            continue
+        # Skip if value matches the default exactly
+        if key in defaults and value == defaults[key]:
+            continue
+        # Keep non-default values
+        filtered[key] = value
+    return filtered if filtered else None
+
+
+# Default values of the agent config fields, filtered out of responses
+_AGENT_DEFAULTS: Dict[str, Any] = {
+    # Sessions defaults
+    "add_history_to_context": False,
+    "num_history_runs": 3,
+    "enable_session_summaries": False,
+    "search_past_sessions": False,
+    "cache_session": False,
+    # Knowledge defaults
+    "add_references": False,
+    "references_format": "json",
+    "enable_agentic_knowledge_filters": False,
+    # Memory defaults
+    "enable_agentic_memory": False,
+    "update_memory_on_run": False,
+    # Reasoning defaults
+    "reasoning": False,
+    "reasoning_min_steps": 1,
+    "reasoning_max_steps": 10,
+    # Default tools defaults
+    "read_chat_history": False,
+    "search_knowledge": True,
+    "update_knowledge": False,
+    "read_tool_call_history": False,
+    # System message defaults
+    "system_message_role": "system",
+    "build_context": True,
+    "markdown": False,
+    "add_name_to_context": False,
+    "add_datetime_to_context": False,
+    "add_location_to_context": False,
+    "resolve_in_context": True,
+    # Extra messages defaults
+    "user_message_role": "user",
+    "build_user_context": True,
+    # Response settings defaults
+    "retries": 0,
+    "delay_between_retries": 1,
+    "exponential_backoff": False,
+    "parse_response": True,
+    "use_json_mode": False,
+    # Streaming defaults
+    "stream_events": False,
+}
+
+
 class AgentResponse(BaseModel):
     id: Optional[str] = None
     name: Optional[str] = None
@@ -66,72 +128,10 @@ class AgentResponse(BaseModel):
             factory_input_schema=factory_input_schema,
         )
 
-    @classmethod
-    async def from_agent(
-        cls,
-        agent: Agent,
-        is_component: bool = False,
-    ) -> "AgentResponse":
-        def filter_meaningful_config(d: Dict[str, Any], defaults: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-            """Filter out fields that match their default values, keeping only meaningful user configurations"""
-            filtered = {}
-            for key, value in d.items():
-                if value is None:
-                    continue
-                # Skip if value matches the default exactly
-                if key in defaults and value == defaults[key]:
-                    continue
-                # Keep non-default values
-                filtered[key] = value
-            return filtered if filtered else None
-
-        # Define default values for filtering
-        agent_defaults = {
-            # Sessions defaults
-            "add_history_to_context": False,
-            "num_history_runs": 3,
-            "enable_session_summaries": False,
-            "search_past_sessions": False,
-            "cache_session": False,
-            # Knowledge defaults
-            "add_references": False,
-            "references_format": "json",
-            "enable_agentic_knowledge_filters": False,
-            # Memory defaults
-            "enable_agentic_memory": False,
-            "update_memory_on_run": False,
-            # Reasoning defaults
-            "reasoning": False,
-            "reasoning_min_steps": 1,
-            "reasoning_max_steps": 10,
-            # Default tools defaults
-            "read_chat_history": False,
-            "search_knowledge": True,
-            "update_knowledge": False,
-            "read_tool_call_history": False,
-            # System message defaults
-            "system_message_role": "system",
-            "build_context": True,
-            "markdown": False,
-            "add_name_to_context": False,
-            "add_datetime_to_context": False,
-            "add_location_to_context": False,
-            "resolve_in_context": True,
-            # Extra messages defaults
-            "user_message_role": "user",
-            "build_user_context": True,
-            # Response settings defaults
-            "retries": 0,
-            "delay_between_retries": 1,
-            "exponential_backoff": False,
-            "parse_response": True,
-            "use_json_mode": False,
-            # Streaming defaults
-            "stream_events": False,
-        }
-
-        session_id = str(uuid4())
-        run_id = str(uuid4())
+    @staticmethod
+    async def _atools_config(agent: Agent) -> Optional[Dict[str, Any]]:
+        session_id = INTROSPECTION_SESSION_ID
+        run_id = INTROSPECTION_RUN_ID
         agent_tools = await agent.aget_tools(
             session=AgentSession(session_id=session_id, session_data={}),
             run_response=RunOutput(run_id=run_id, session_id=session_id),
@@ -140,6 +140,61 @@ class AgentResponse(BaseModel):
         )
         formatted_tools = format_tools(agent_tools) if agent_tools else None
 
+        tools_info = {
+            "tools": formatted_tools,
+            "tool_call_limit": agent.tool_call_limit,
+            "tool_choice": agent.tool_choice,
+        }
+
+        return _filter_meaningful_config(tools_info, {})
+
+    @staticmethod
+    async def _asystem_message_config(agent: Agent) -> Optional[Dict[str, Any]]:
+        instructions = agent.instructions if agent.instructions else None
+        if instructions and callable(instructions):
+            instructions = await aexecute_instructions(instructions=instructions, agent=agent)
+
+        system_message = agent.system_message if agent.system_message else None
+        if system_message and callable(system_message):
+            system_message = await aexecute_system_message(system_message=system_message, agent=agent)
+
+        system_message_info = {
+            "system_message": str(system_message) if system_message else None,
+            "system_message_role": agent.system_message_role,
+            "build_context": agent.build_context,
+            "description": agent.description,
+            "instructions": instructions,
+            "expected_output": agent.expected_output,
+            "additional_context": agent.additional_context,
+            "markdown": agent.markdown,
+            "add_name_to_context": agent.add_name_to_context,
+            "add_datetime_to_context": agent.add_datetime_to_context,
+            "add_location_to_context": agent.add_location_to_context,
+            "timezone_identifier": agent.timezone_identifier,
+            "resolve_in_context": agent.resolve_in_context,
+        }
+
+        return _filter_meaningful_config(system_message_info, _AGENT_DEFAULTS)
+
+    async def with_dynamic_config(self, agent: Agent) -> "AgentResponse":
+        """Copy of this response with the config resolved per request re-resolved for ``agent``.
+
+        Callable tools, MCP toolkits, instructions and system messages are the only parts of
+        an agent's response that can change between requests; everything else is reused as-is.
+        """
+        update: Dict[str, Any] = {}
+        if callable(agent.tools) or has_mcp_tools(agent):
+            update["tools"] = await self._atools_config(agent)
+        if callable(agent.instructions) or callable(agent.system_message):
+            update["system_message"] = await self._asystem_message_config(agent)
+        return self.model_copy(update=update) if update else self
+
+    @classmethod
+    async def from_agent(
+        cls,
+        agent: Agent,
+        is_component: bool = False,
+    ) -> "AgentResponse":
         additional_input = agent.additional_input
         if additional_input and isinstance(additional_input[0], Message):
             additional_input = [message.to_dict() for message in additional_input]  # type: ignore
@@ -174,12 +229,6 @@ class AgentResponse(BaseModel):
             else (agent.db.knowledge_table_name if agent.db and agent.knowledge else None)
         )
 
-        tools_info = {
-            "tools": formatted_tools,
-            "tool_call_limit": agent.tool_call_limit,
-            "tool_choice": agent.tool_choice,
-        }
-
         sessions_info = {
             "session_table": session_table,
             "add_history_to_context": agent.add_history_to_context,
@@ -240,30 +289,6 @@ class AgentResponse(BaseModel):
             "read_tool_call_history": agent.read_tool_call_history,
         }
 
-        instructions = agent.instructions if agent.instructions else None
-        if instructions and callable(instructions):
-            instructions = await aexecute_instructions(instructions=instructions, agent=agent)
-
-        system_message = agent.system_message if agent.system_message else None
-        if system_message and callable(system_message):
-            system_message = await aexecute_system_message(system_message=system_message, agent=agent)
-
-        system_message_info = {
-            "system_message": str(system_message) if system_message else None,
-            "system_message_role": agent.system_message_role,
-            "build_context": agent.build_context,
-            "description": agent.description,
-            "instructions": instructions,
-            "expected_output": agent.expected_output,
-            "additional_context": agent.additional_context,
-            "markdown": agent.markdown,
-            "add_name_to_context": agent.add_name_to_context,
-            "add_datetime_to_context": agent.add_datetime_to_context,
-            "add_location_to_context": agent.add_location_to_context,
-            "timezone_identifier": agent.timezone_identifier,
-            "resolve_in_context": agent.resolve_in_context,
-        }
-
         extra_messages_info = {
             "additional_input": additional_input,  # type: ignore
             "user_message_role": agent.user_message_role,
@@ -314,16 +339,16 @@ class AgentResponse(BaseModel):
             description=agent.description,
             role=agent.role,
             model=ModelResponse(**_agent_model_data) if _agent_model_data else None,
-            tools=filter_meaningful_config(tools_info, {}),
-            sessions=filter_meaningful_config(sessions_info, agent_defaults),
-            knowledge=filter_meaningful_config(knowledge_info, agent_defaults),
-            memory=filter_meaningful_config(memory_info, agent_defaults) if memory_info else None,
-            reasoning=filter_meaningful_config(reasoning_info, agent_defaults),
-            default_tools=filter_meaningful_config(default_tools_info, agent_defaults),
-            system_message=filter_meaningful_config(system_message_info, agent_defaults),
-            extra_messages=filter_meaningful_config(extra_messages_info, agent_defaults),
-            response_settings=filter_meaningful_config(response_settings_info, agent_defaults),
-            streaming=filter_meaningful_config(streaming_info, agent_defaults),
+            tools=await cls._atools_config(agent),
+            sessions=_filter_meaningful_config(sessions_info, _AGENT_DEFAULTS),
+            knowledge=_filter_meaningful_config(knowledge_info, _AGENT_DEFAULTS),
+            memory=_filter_meaningful_config(memory_info, _AGENT_DEFAULTS) if memory_info else None,
+            reasoning=_filter_meaningful_config(reasoning_info, _AGENT_DEFAULTS),
+            default_tools=_filter_meaningful_config(default_tools_info, _AGENT_DEFAULTS),
+            system_message=await cls._asystem_message_config(agent),
+            extra_messages=_filter_meaningful_config(extra_messages_info, _AGENT_DEFAULTS),
+            response_settings=_filter_meaningful_config(response_settings_info, _AGENT_DEFAULTS),
+            streaming=_filter_meaningful_config(streaming_info, _AGENT_DEFAULTS),
             introduction=agent.introduction,
             metadata=agent.metadata,
             input_schema=input_schema_dict,
@@ -4,7 +4,9 @@ from typing import Any, Dict, List, Optional, Union, cast
 from uuid import uuid4
 
 from fastapi import Depends, HTTPException, Path, Query, Request
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
@@ -30,6 +32,7 @@ from agno.os.schema import (
     ValidationErrorResponse,
 )
 from agno.os.settings import AgnoAPISettings
+from agno.os.utils import RunJSONResponse, etag_json_response
 from agno.remote.base import RemoteDb
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,7 @@ def get_memory_router(
     """Create memory router with comprehensive OpenAPI documentation for user memory management endpoints."""
     router = APIRouter(
         dependencies=[Depends(get_authentication_dependency(settings))],
+        default_response_class=RunJSONResponse,
         tags=["Memory"],
         responses={
             400: {"description": "Bad Request", "model": BadRequestResponse},
@@ -123,7 +127,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 deserialize=False,
             )
         else:
-            user_memory = db.upsert_user_memory(
+            user_memory = await run_in_threadpool(
+                db.upsert_user_memory,
                 memory=UserMemory(
                     memory_id=str(uuid4()),
                     memory=payload.memory,
@@ -178,7 +183,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             await db.delete_user_memory(**local_kwargs)
         else:
-            db.delete_user_memory(**local_kwargs)
+            await run_in_threadpool(db.delete_user_memory, **local_kwargs)
 
     @router.delete(
         "/memories",
@@ -222,7 +227,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             await db.delete_user_memories(memory_ids=request.memory_ids, user_id=request.user_id)
         else:
-            db.delete_user_memories(memory_ids=request.memory_ids, user_id=request.user_id)
+            await run_in_threadpool(db.delete_user_memories, memory_ids=request.memory_ids, user_id=request.user_id)
 
     @router.get(
         "/memories",
@@ -270,7 +275,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         sort_order: Optional[SortOrder] = Query(default=SortOrder.DESC, description="Sort order (asc or desc)"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query memories from"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
-    ) -> PaginatedResponse[UserMemorySchema]:
+    ) -> Union[PaginatedResponse[UserMemorySchema], Response]:
         db, effective_user_id = await resolve_db_and_scope(request, dbs, db_id, table, fallback_user_id=user_id)
 
         if isinstance(db, RemoteDb):
@@ -309,10 +314,10 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             user_memories, total_count = await db.get_user_memories(**local_kwargs)
         else:
-            user_memories, total_count = db.get_user_memories(**local_kwargs)  # type: ignore
+            user_memories, total_count = await run_in_threadpool(db.get_user_memories, **local_kwargs)  # type: ignore
 
         memories = [UserMemorySchema.from_dict(user_memory) for user_memory in user_memories]  # type: ignore
-        return PaginatedResponse(
+        response = PaginatedResponse(
             data=[memory for memory in memories if memory is not None],
             meta=PaginationInfo(
                 page=page,
@@ -321,6 +326,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 total_pages=math.ceil(total_count / limit) if limit is not None and limit > 0 else 0,  # type: ignore
             ),
         )
+        # Memories change far less often than clients poll, so unchanged pages are answered with a 304
+        return etag_json_response(request, response.model_dump_json().encode("utf-8"))
 
     @router.get(
         "/memories/{memory_id}",
@@ -377,7 +384,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             user_memory = await db.get_user_memory(**local_kwargs)
         else:
-            user_memory = db.get_user_memory(**local_kwargs)
+            user_memory = await run_in_threadpool(db.get_user_memory, **local_kwargs)
         if not user_memory:
             raise HTTPException(status_code=404, detail=f"Memory with ID {memory_id} not found")
 
@@ -440,7 +447,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             return await db.get_all_memory_topics(**local_kwargs)
         else:
-            return db.get_all_memory_topics(**local_kwargs)  # type: ignore[return-value]
+            return await run_in_threadpool(db.get_all_memory_topics, **local_kwargs)  # type: ignore[return-value]
 
     @router.patch(
         "/memories/{memory_id}",
@@ -497,7 +504,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             if isinstance(db, AsyncBaseDb):
                 existing = await cast(AsyncBaseDb, db).get_user_memory(memory_id=memory_id, user_id=scoped_user_id)
             else:
-                existing = db.get_user_memory(memory_id=memory_id, user_id=scoped_user_id)
+                existing = await run_in_threadpool(db.get_user_memory, memory_id=memory_id, user_id=scoped_user_id)
             if existing is None:
                 raise HTTPException(status_code=404, detail="Memory not found")
 
@@ -526,7 +533,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 deserialize=False,
             )
         else:
-            user_memory = db.upsert_user_memory(
+            user_memory = await run_in_threadpool(
+                db.upsert_user_memory,
                 memory=UserMemory(
                     memory_id=memory_id,
                     memory=payload.memory,
@@ -603,7 +611,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 db = cast(AsyncBaseDb, db)
                 user_stats, total_count = await db.get_user_memory_stats(**local_kwargs)
             else:
-                user_stats, total_count = db.get_user_memory_stats(**local_kwargs)
+                user_stats, total_count = await run_in_threadpool(db.get_user_memory_stats, **local_kwargs)
             return PaginatedResponse(
                 data=[UserStatsSchema.from_dict(stats) for stats in user_stats],
                 meta=PaginationInfo(
@@ -711,7 +719,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             if isinstance(db, AsyncBaseDb):
                 memories_before = await memory_manager.aget_user_memories(user_id=request.user_id)
             else:
-                memories_before = memory_manager.get_user_memories(user_id=request.user_id)
+                memories_before = await run_in_threadpool(memory_manager.get_user_memories, user_id=request.user_id)
 
             if not memories_before:
                 raise HTTPException(status_code=404, detail=f"No memories found for user {request.user_id}")
@@ -731,7 +739,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                     apply=request.apply,
                 )
             else:
-                optimized_memories = memory_manager.optimize_memories(
+                optimized_memories = await run_in_threadpool(
+                    memory_manager.optimize_memories,
                     user_id=request.user_id,
                     strategy=MemoryOptimizationStrategyType.SUMMARIZE,
                     apply=request.apply,
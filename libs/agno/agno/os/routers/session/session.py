@@ -1,9 +1,11 @@
 import logging
 import time
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union, cast
 from uuid import uuid4
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from agno.db.base import AsyncBaseDb, BaseDb, SessionType
 from agno.db.utils import deserialize_session_by_type, resolve_session_type
@@ -35,11 +37,15 @@ from agno.os.schema import (
 from agno.os.services.sessions import SessionNotFoundError, get_sessions_page
 from agno.os.services.sessions import get_session_runs as get_session_runs_from_service
 from agno.os.settings import AgnoAPISettings
+from agno.os.utils import RunJSONResponse
 from agno.remote.base import RemoteDb
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per storage call when streaming a session listing as NDJSON
+NDJSON_SESSIONS_PAGE_SIZE = 256
+
 
 def get_session_router(
     dbs: dict[str, list[Union[BaseDb, AsyncBaseDb, RemoteDb]]], settings: AgnoAPISettings = AgnoAPISettings()
@@ -47,6 +53,7 @@ def get_session_router(
     """Create session router with comprehensive OpenAPI documentation for session management endpoints."""
     session_router = APIRouter(
         dependencies=[Depends(get_authentication_dependency(settings))],
+        default_response_class=RunJSONResponse,
         tags=["Sessions"],
         responses={
             400: {"description": "Bad Request", "model": BadRequestResponse},
@@ -59,6 +66,41 @@ def get_session_router(
     return attach_routes(router=session_router, dbs=dbs)
 
 
+async def stream_sessions_ndjson(
+    db: Union[BaseDb, AsyncBaseDb],
+    *,
+    session_type: Optional[SessionType] = None,
+    component_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    sort_by: Optional[str] = "created_at",
+    sort_order: Optional[SortOrder] = SortOrder.DESC,
+) -> AsyncIterator[bytes]:
+    """Yield every matching session as one NDJSON line, reading storage a page at a time.
+
+    Only one page of rows is held in memory at once, so peak memory stays flat however
+    many sessions the user has.
+    """
+    page = 1
+    while True:
+        sessions, total_count = await get_sessions_page(
+            db,
+            session_type=session_type,
+            component_id=component_id,
+            user_id=user_id,
+            session_name=session_name,
+            limit=NDJSON_SESSIONS_PAGE_SIZE,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        for session in sessions:
+            yield SessionSchema.from_dict(session).model_dump_json(exclude_none=True).encode("utf-8") + b"\n"
+        if len(sessions) < NDJSON_SESSIONS_PAGE_SIZE or page * NDJSON_SESSIONS_PAGE_SIZE >= total_count:
+            break
+        page += 1
+
+
 def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBaseDb, RemoteDb]]]) -> APIRouter:
     @router.get(
         "/sessions",
@@ -69,13 +111,15 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         description=(
             "Retrieve paginated list of sessions with filtering and sorting options. "
             "Supports filtering by session type (agent, team, workflow), component, user, and name. "
-            "Sessions represent conversation histories and execution contexts."
+            "Sessions represent conversation histories and execution contexts. "
+            "Pass `format=ndjson` to stream every matching session as newline-delimited JSON instead of a single page."
         ),
         response_model_exclude_none=True,
         responses={
             200: {
                 "description": "Sessions retrieved successfully",
                 "content": {
+                    "application/x-ndjson": {},
                     "application/json": {
                         "example": {
                             "session_example": {
@@ -93,7 +137,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                                 },
                             }
                         }
-                    }
+                    },
                 },
             },
             400: {"description": "Invalid session type or filter parameters", "model": BadRequestResponse},
@@ -119,12 +163,33 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         sort_order: Optional[SortOrder] = Query(default=SortOrder.DESC, description="Sort order (asc or desc)"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query sessions from"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
-    ) -> PaginatedResponse[SessionSchema]:
+        response_format: Literal["json", "ndjson"] = Query(
+            default="json",
+            alias="format",
+            description="Response format. `ndjson` streams all matching sessions, one per line, ignoring limit and page.",
+        ),
+    ) -> Union[PaginatedResponse[SessionSchema], Response]:
         try:
             db, effective_user_id = await resolve_db_and_scope(request, dbs, db_id, table, fallback_user_id=user_id)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"{e}")
 
+        if response_format == "ndjson":
+            if isinstance(db, RemoteDb):
+                raise HTTPException(status_code=400, detail="NDJSON streaming is not supported for remote databases")
+            return StreamingResponse(
+                stream_sessions_ndjson(
+                    db,
+                    session_type=session_type,
+                    component_id=component_id,
+                    user_id=effective_user_id,
+                    session_name=session_name,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                ),
+                media_type="application/x-ndjson",
+            )
+
         if isinstance(db, RemoteDb):
             auth_token = get_auth_token_from_request(request)
             headers = {"Authorization": f"Bearer {auth_token}"} if auth_token else None
@@ -156,7 +221,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             sort_order=sort_order,
         )
 
-        return PaginatedResponse(
+        response = PaginatedResponse(
             data=[SessionSchema.from_dict(session) for session in sessions],  # type: ignore
             meta=PaginationInfo(
                 page=page,
@@ -165,6 +230,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 total_pages=(total_count + limit - 1) // limit if limit is not None and limit > 0 else 0,  # type: ignore
             ),
         )
+        # Serialized here so FastAPI does not validate every session against response_model again
+        return Response(content=response.model_dump_json(exclude_none=True), media_type="application/json")
 
     @router.post(
         "/sessions",
@@ -256,12 +323,12 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         # caller to PATCH; the stored session is never touched.
         if create_session_request.session_id is not None:
             if isinstance(db, AsyncBaseDb):
-                existing_session = await db.get_session(
-                    session_id=session_id, session_type=session_type, deserialize=False
-                )
+                session_exists = await db.session_exists(session_id=session_id, session_type=session_type)
             else:
-                existing_session = db.get_session(session_id=session_id, session_type=session_type, deserialize=False)
-            if existing_session is not None:
+                session_exists = await run_in_threadpool(
+                    db.session_exists, session_id=session_id, session_type=session_type
+                )
+            if session_exists:
                 raise HTTPException(
                     status_code=409,
                     detail=f"Session with id '{session_id}' already exists. Use PATCH /sessions/{session_id} to update it.",
@@ -321,7 +388,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 db = cast(AsyncBaseDb, db)
                 created_session = await db.upsert_session(session, deserialize=True)
             else:
-                created_session = db.upsert_session(session, deserialize=True)
+                created_session = await run_in_threadpool(db.upsert_session, session, deserialize=True)
 
             if not created_session:
                 raise HTTPException(status_code=500, detail="Failed to create session")
@@ -464,7 +531,12 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                     session_id=session_id, session_type=session_type, user_id=effective_user_id
                 )  # type: ignore
             else:
-                session = db.get_session(session_id=session_id, session_type=session_type, user_id=effective_user_id)  # type: ignore
+                session = await run_in_threadpool(
+                    db.get_session,  # type: ignore[arg-type]
+                    session_id=session_id,
+                    session_type=session_type,
+                    user_id=effective_user_id,
+                )
 
         if not session:
             raise HTTPException(
@@ -719,7 +791,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 deserialize=False,
             )
         else:
-            session = db.get_session(
+            session = await run_in_threadpool(
+                db.get_session,
                 session_id=session_id,
                 session_type=session_type,
                 user_id=effective_user_id,
@@ -791,7 +864,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             await db.delete_session(**local_kwargs)
         else:
-            db.delete_session(**local_kwargs)
+            await run_in_threadpool(db.delete_session, **local_kwargs)
 
     @router.delete(
         "/sessions",
@@ -847,7 +920,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             await db.delete_sessions(**local_kwargs)
         else:
-            db.delete_sessions(**local_kwargs)
+            await run_in_threadpool(db.delete_sessions, **local_kwargs)
 
     @router.post(
         "/sessions/{session_id}/rename",
@@ -976,7 +1049,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
             db = cast(AsyncBaseDb, db)
             session = await db.rename_session(**local_kwargs)
         else:
-            session = db.rename_session(**local_kwargs)
+            session = await run_in_threadpool(db.rename_session, **local_kwargs)
         if not session:
             raise HTTPException(status_code=404, detail=f"Session with id '{session_id}' not found")
 
@@ -1084,7 +1157,8 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 deserialize=True,
             )
         else:
-            existing_session = db.get_session(
+            existing_session = await run_in_threadpool(
+                db.get_session,
                 session_id=session_id,
                 session_type=session_type,
                 user_id=effective_user_id,
@@ -1120,7 +1194,7 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         if isinstance(db, AsyncBaseDb):
             updated_session = await db.upsert_session(existing_session, deserialize=True)  # type: ignore
         else:
-            updated_session = db.upsert_session(existing_session, deserialize=True)  # type: ignore
+            updated_session = await run_in_threadpool(db.upsert_session, existing_session, deserialize=True)  # type: ignore
 
         if not updated_session:
             raise HTTPException(status_code=500, detail="Failed to update session")
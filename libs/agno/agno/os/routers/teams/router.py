@@ -1,7 +1,7 @@
 import asyncio
 import json
+import traceback
 from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Literal, Optional, Union
-from uuid import uuid4
 
 from fastapi import (
     APIRouter,
@@ -14,7 +14,7 @@ from fastapi import (
     Request,
     UploadFile,
 )
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from agno.db.base import BaseDb
 from agno.exceptions import InputCheckError, OutputCheckError, RunNotContinuableError, RunNotFoundError
@@ -46,15 +46,18 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
-    classify_upload_file,
+    SSE_HEADERS,
+    ComponentResponseCache,
+    RunJSONResponse,
+    SSEErrorFrame,
+    coalesce_sse_stream,
+    etag_json_response,
     find_factory_by_id,
-    format_sse_event,
+    format_sse_event_bytes,
     get_request_kwargs,
     get_team_by_id,
-    process_audio,
-    process_document,
-    process_image,
-    process_video,
+    is_static_component,
+    process_upload_files,
     resolve_team,
 )
 from agno.registry import Registry
@@ -67,10 +70,27 @@ from agno.team.remote import RemoteTeam
 from agno.team.team import Team
 from agno.utils.log import log_debug, log_warning, logger
 from agno.utils.serialize import json_serializer
+from agno.utils.string import generate_uuid7
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
 
+TEAM_RUN_ERROR_FRAME = SSEErrorFrame(TeamRunErrorEvent)
+
+
+def _is_static_team(team: Team) -> bool:
+    """Whether a team's listing response, members included, can be reused across requests."""
+    if not is_static_component(team) or not isinstance(team.members, list):
+        return False
+    return all(
+        _is_static_team(member) if isinstance(member, Team) else is_static_component(member) for member in team.members
+    )
+
+
+def _render_team_response(team_response: TeamResponse) -> bytes:
+    """Render a team's listing entry as GET /teams serializes it (`response_model_exclude_none`)."""
+    return team_response.model_dump_json(exclude_none=True).encode("utf-8")
+
 
 def _is_run_output_accumulator(chunk: Any) -> bool:
     """Return True for accumulated run outputs that are not SSE events."""
@@ -120,7 +140,7 @@ async def team_response_streamer(
         async for run_response_chunk in run_response:
             if _is_run_output_accumulator(run_response_chunk):
                 continue
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = TeamRunErrorEvent(
             content=str(e),
@@ -128,20 +148,13 @@ async def team_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
 
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc()
-        error_response = TeamRunErrorEvent(
-            content=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield TEAM_RUN_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
         return
 
 
@@ -200,19 +213,12 @@ async def team_resumable_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
-        error_response = TeamRunErrorEvent(
-            content=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield TEAM_RUN_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
 
 
 async def _resume_stream_generator(
@@ -432,7 +438,7 @@ async def team_continue_response_streamer(
         async for run_response_chunk in continue_response:
             if _is_run_output_accumulator(run_response_chunk):
                 continue
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = TeamRunErrorEvent(
             content=str(e),
@@ -440,18 +446,11 @@ async def team_continue_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
 
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
-        error_response = TeamRunErrorEvent(
-            content=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield TEAM_RUN_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
         return
 
 
@@ -503,19 +502,12 @@ async def team_resumable_continue_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc(limit=3)
-        error_response = TeamRunErrorEvent(
-            content=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield TEAM_RUN_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
 
 
 def get_team_router(
@@ -643,7 +635,7 @@ def get_team_router(
             logger.debug(f"Continuing session: {session_id}")
         else:
             logger.debug("Creating new session")
-            session_id = str(uuid4())
+            session_id = generate_uuid7()
 
         base64_images: List[Image] = []
         base64_audios: List[Audio] = []
@@ -651,35 +643,7 @@ def get_team_router(
         document_files: List[FileMedia] = []
 
         if files:
-            for file in files:
-                file_category = classify_upload_file(file)
-                if file_category == "image":
-                    try:
-                        base64_image = process_image(file)
-                        base64_images.append(base64_image)
-                    except Exception:
-                        logger.exception(f"Error processing image {file.filename}")
-                        continue
-                elif file_category == "audio":
-                    try:
-                        base64_audio = process_audio(file)
-                        base64_audios.append(base64_audio)
-                    except Exception:
-                        logger.exception(f"Error processing audio {file.filename}")
-                        continue
-                elif file_category == "video":
-                    try:
-                        base64_video = process_video(file)
-                        base64_videos.append(base64_video)
-                    except Exception:
-                        logger.exception(f"Error processing video {file.filename}")
-                        continue
-                elif file_category == "document":
-                    document_file = process_document(file)
-                    if document_file is not None:
-                        document_files.append(document_file)
-                else:
-                    raise HTTPException(status_code=400, detail="Unsupported file type")
+            base64_images, base64_audios, base64_videos, document_files = await process_upload_files(files)
 
         # Merge media passed as JSON form fields (sent by AgnoClient, e.g. when this team
         # is used as a remote member) with media from uploaded files.
@@ -716,6 +680,7 @@ def get_team_router(
                         **kwargs,
                     ),
                     media_type="text/event-stream",
+                    headers=SSE_HEADERS,
                 )
 
             # background=True, stream=False: return 202 immediately with run metadata
@@ -747,20 +712,23 @@ def get_team_router(
 
         if stream:
             return StreamingResponse(
-                team_response_streamer(
-                    team,
-                    message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    images=base64_images if base64_images else None,
-                    audio=base64_audios if base64_audios else None,
-                    videos=base64_videos if base64_videos else None,
-                    files=document_files if document_files else None,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
+                coalesce_sse_stream(
+                    team_response_streamer(
+                        team,
+                        message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        images=base64_images if base64_images else None,
+                        audio=base64_audios if base64_audios else None,
+                        videos=base64_videos if base64_videos else None,
+                        files=document_files if document_files else None,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                        **kwargs,
+                    )
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         else:
             # Pass auth_token for remote teams
@@ -780,7 +748,7 @@ def get_team_router(
                     background_tasks=background_tasks,
                     **kwargs,
                 )
-                return run_response.to_dict()
+                return RunJSONResponse(run_response.to_dict())
 
             except InputCheckError as e:
                 raise HTTPException(status_code=400, detail=str(e))
@@ -941,6 +909,7 @@ def get_team_router(
         return StreamingResponse(
             _resume_stream_generator(team, run_id, last_event_index, session_id, user_id=scoped_user_id),
             media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
 
     @router.post(
@@ -1118,26 +1087,30 @@ def get_team_router(
                     **kwargs,
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         elif stream:
             return StreamingResponse(
-                team_continue_response_streamer(
-                    team,
-                    run_id=run_id,
-                    requirements=updated_requirements or [],
-                    input=input,
-                    continue_from=continue_from_value,
-                    fork=fork,
-                    regenerate=regenerate,
-                    replace_original=replace_original,
-                    additional_instructions=additional_instructions,
-                    session_id=session_id,
-                    user_id=user_id,
-                    background_tasks=background_tasks,
-                    auth_token=auth_token,
-                    **kwargs,
+                coalesce_sse_stream(
+                    team_continue_response_streamer(
+                        team,
+                        run_id=run_id,
+                        requirements=updated_requirements or [],
+                        input=input,
+                        continue_from=continue_from_value,
+                        fork=fork,
+                        regenerate=regenerate,
+                        replace_original=replace_original,
+                        additional_instructions=additional_instructions,
+                        session_id=session_id,
+                        user_id=user_id,
+                        background_tasks=background_tasks,
+                        auth_token=auth_token,
+                        **kwargs,
+                    )
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         else:
             # Build extra kwargs for remote team auth
@@ -1162,7 +1135,7 @@ def get_team_router(
                     **extra_kwargs,
                     **kwargs,
                 )
-                return run_response_obj.to_dict()
+                return RunJSONResponse(run_response_obj.to_dict())
 
             except RunNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
@@ -1223,6 +1196,9 @@ def get_team_router(
 
         return {"session_id": new_session_id, "forked_from_session_id": session_id}
 
+    # Rendered responses for code-defined teams, reused across GET /teams requests
+    team_response_cache = ComponentResponseCache()
+
     @router.get(
         "/teams",
         response_model=List[TeamResponse],
@@ -1304,7 +1280,7 @@ def get_team_router(
             }
         },
     )
-    async def get_teams(request: Request) -> List[TeamResponse]:
+    async def get_teams(request: Request) -> Union[List[TeamResponse], Response]:
         """Return the list of all Teams present in the contextual OS"""
         # Filter teams based on user's scopes (only if authorization is enabled)
         if getattr(request.state, "authorization_enabled", False):
@@ -1327,14 +1303,26 @@ def get_team_router(
         else:
             accessible_teams = os.teams or []
 
-        teams = []
+        # Each team is rendered to JSON once; static teams keep their rendered bytes across requests
+        rendered_teams: List[bytes] = []
         for team in accessible_teams:
-            if isinstance(team, Team):
-                teams.append(await TeamResponse.from_team(team=team, is_component=False))
+            team_json = team_response_cache.get(team)
+            if team_json is not None:
+                rendered_teams.append(team_json)
+            elif isinstance(team, Team):
+                team_response = await TeamResponse.from_team(team=team, is_component=False)
+                team_json = _render_team_response(team_response)
+                # Callable or MCP tools, instructions, system message and members are resolved per request
+                if _is_static_team(team):
+                    team_response_cache.set(team, team_json)
+                rendered_teams.append(team_json)
             elif isinstance(team, TeamFactory):
-                teams.append(TeamResponse.from_factory(team))
+                team_json = _render_team_response(TeamResponse.from_factory(team))
+                team_response_cache.set(team, team_json)
+                rendered_teams.append(team_json)
             elif isinstance(team, RemoteTeam):
-                teams.append(await team.get_team_config())
+                # Remote config can change at any time, so it is never cached
+                rendered_teams.append(_render_team_response(await team.get_team_config()))
 
         # Also load teams from database
         if os.db and isinstance(os.db, BaseDb):
@@ -1345,9 +1333,10 @@ def get_team_router(
             db_teams = get_teams(db=os.db, registry=registry, exclude_component_ids=exclude_ids or None)
             for db_team in db_teams:
                 team_response = await TeamResponse.from_team(team=db_team, is_component=True)
-                teams.append(team_response)
+                rendered_teams.append(_render_team_response(team_response))
 
-        return teams
+        # Rendered here so FastAPI does not validate every team against response_model again
+        return etag_json_response(request, b"[" + b",".join(rendered_teams) + b"]")
 
     @router.get(
         "/teams/{team_id}",
@@ -1514,7 +1503,7 @@ def get_team_router(
         if not run_matches_component(run_output, "teams", team_id):
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return RunJSONResponse(run_output.to_dict())
 
     @router.get(
         "/teams/{team_id}/runs/{run_id}/checkpoints",
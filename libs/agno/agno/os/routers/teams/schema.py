@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-from uuid import uuid4
 
 from pydantic import BaseModel
 
@@ -12,6 +11,8 @@ from agno.agent import Agent
 from agno.os.routers.agents.schema import AgentResponse
 from agno.os.schema import ModelResponse
 from agno.os.utils import (
+    INTROSPECTION_RUN_ID,
+    INTROSPECTION_SESSION_ID,
     format_team_tools,
 )
 from agno.run import RunContext
@@ -123,8 +124,8 @@ class TeamResponse(BaseModel):
             "stream_member_events": False,
         }
 
-        run_id = str(uuid4())
-        session_id = str(uuid4())
+        session_id = INTROSPECTION_SESSION_ID
+        run_id = INTROSPECTION_RUN_ID
         _tools = team._determine_tools_for_model(
             model=team.model,  # type: ignore
             session=TeamSession(session_id=session_id, session_data={}),
@@ -1,8 +1,8 @@
 import asyncio
 import json
+import traceback
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
-from uuid import uuid4
 
 from fastapi import (
     APIRouter,
@@ -47,17 +47,25 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
+    SSE_HEADERS,
+    ComponentResponseCache,
+    RunJSONResponse,
+    SSEErrorFrame,
+    coalesce_sse_stream,
+    find_component_by_id,
     find_factory_by_id,
     format_sse_event,
+    format_sse_event_bytes,
     get_request_kwargs,
     get_workflow_by_id,
     get_workflow_by_id_async,
     resolve_workflow,
 )
 from agno.run.base import RunStatus
-from agno.run.workflow import WorkflowErrorEvent
+from agno.run.workflow import WorkflowErrorEvent, WorkflowPausedEvent
 from agno.utils.log import log_debug, log_warning, logger
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import json_dumps_bytes, json_serializer
+from agno.utils.string import generate_uuid7
 from agno.workflow.factory import WorkflowFactory
 from agno.workflow.remote import RemoteWorkflow
 from agno.workflow.workflow import Workflow
@@ -65,6 +73,8 @@ from agno.workflow.workflow import Workflow
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
 
+WORKFLOW_ERROR_FRAME = SSEErrorFrame(WorkflowErrorEvent, field="error")
+
 
 async def handle_workflow_via_websocket(
     websocket: WebSocket, message: dict, os: "AgentOS", ws_user_context: Optional[Dict[str, Any]] = None
@@ -99,10 +109,7 @@ async def handle_workflow_via_websocket(
             return
 
         # Get workflow from OS — supports both static and factory components
-        is_factory = os.workflows and any(
-            isinstance(w, WorkflowFactory) and w.id == workflow_id for w in (os.workflows or [])
-        )
-        if is_factory:
+        if isinstance(find_component_by_id(workflow_id, os.workflows), WorkflowFactory):
             from agno.factory import RequestContext, TrustedContext
 
             # Build trusted context from JWT claims if available (via websocket auth)
@@ -156,7 +163,7 @@ async def handle_workflow_via_websocket(
             if workflow.session_id:
                 session_id = workflow.session_id
             else:
-                session_id = str(uuid4())
+                session_id = generate_uuid7()
 
         # Execute workflow in background with streaming via WebSocket
         await workflow.arun(  # type: ignore
@@ -601,7 +608,7 @@ async def workflow_response_streamer(
         )
 
         async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
 
         # If the workflow paused, yield WorkflowPausedEvent as the new clean
         # snapshot event. Also yield the legacy "WorkflowRunOutput" event for
@@ -612,8 +619,6 @@ async def workflow_response_streamer(
         if _session and _session.runs:
             _last_run = _session.runs[-1]
             if getattr(_last_run, "is_paused", False):
-                from agno.run.workflow import WorkflowPausedEvent
-
                 paused_event = WorkflowPausedEvent(
                     run_id=_last_run.run_id or "",
                     workflow_id=_last_run.workflow_id,
@@ -629,12 +634,11 @@ async def workflow_response_streamer(
                     content=_last_run.content,
                     metadata=_last_run.metadata,
                 )
-                yield format_sse_event(paused_event)
+                yield format_sse_event_bytes(paused_event)
 
                 # Legacy WorkflowRunOutput event for backwards compatibility
                 run_dict = _last_run.to_dict()
-                run_json = json.dumps(run_dict, default=json_serializer, separators=(",", ":"))
-                yield f"event: WorkflowRunOutput\ndata: {run_json}\n\n"
+                yield b"event: WorkflowRunOutput\ndata: " + json_dumps_bytes(run_dict) + b"\n\n"
 
     except (InputCheckError, OutputCheckError) as e:
         error_response = WorkflowErrorEvent(
@@ -643,20 +647,13 @@ async def workflow_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
 
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc()
-        error_response = WorkflowErrorEvent(
-            error=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield WORKFLOW_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
         return
 
 
@@ -711,8 +708,6 @@ async def workflow_resumable_response_streamer(
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc()
         error_response = WorkflowErrorEvent(
             error=str(e),
@@ -746,7 +741,7 @@ async def workflow_continue_response_streamer(
         )
 
         async for run_response_chunk in run_response:
-            yield format_sse_event(run_response_chunk)  # type: ignore
+            yield format_sse_event_bytes(run_response_chunk)  # type: ignore
 
         # If the workflow re-paused, yield WorkflowPausedEvent as the new clean
         # snapshot event. Also yield the legacy "WorkflowRunOutput" event for
@@ -755,8 +750,6 @@ async def workflow_continue_response_streamer(
         if _session and _session.runs:
             _last_run = _session.runs[-1]
             if getattr(_last_run, "is_paused", False):
-                from agno.run.workflow import WorkflowPausedEvent
-
                 paused_event = WorkflowPausedEvent(
                     run_id=_last_run.run_id or "",
                     workflow_id=_last_run.workflow_id,
@@ -772,12 +765,11 @@ async def workflow_continue_response_streamer(
                     content=_last_run.content,
                     metadata=_last_run.metadata,
                 )
-                yield format_sse_event(paused_event)
+                yield format_sse_event_bytes(paused_event)
 
                 # Legacy WorkflowRunOutput event for backwards compatibility
                 run_dict = _last_run.to_dict()
-                run_json = json.dumps(run_dict, default=json_serializer, separators=(",", ":"))
-                yield f"event: WorkflowRunOutput\ndata: {run_json}\n\n"
+                yield b"event: WorkflowRunOutput\ndata: " + json_dumps_bytes(run_dict) + b"\n\n"
 
     except (InputCheckError, OutputCheckError) as e:
         error_response = WorkflowErrorEvent(
@@ -786,19 +778,12 @@ async def workflow_continue_response_streamer(
             error_id=e.error_id,
             additional_data=e.additional_data,
         )
-        yield format_sse_event(error_response)
+        yield format_sse_event_bytes(error_response)
     except asyncio.CancelledError:
         return
     except Exception as e:
-        import traceback
-
         traceback.print_exc()
-        error_response = WorkflowErrorEvent(
-            error=str(e),
-            error_type=e.type if hasattr(e, "type") else None,
-            error_id=e.error_id if hasattr(e, "error_id") else None,
-        )
-        yield format_sse_event(error_response)
+        yield WORKFLOW_ERROR_FRAME.render(str(e), getattr(e, "type", None), getattr(e, "error_id", None))
         return
 
 
@@ -986,6 +971,9 @@ def get_workflow_router(
         },
     )
 
+    # Responses for code-defined workflows, reused across GET /workflows requests
+    workflow_response_cache = ComponentResponseCache()
+
     @router.get(
         "/workflows",
         response_model=List[WorkflowSummaryResponse],
@@ -1044,7 +1032,13 @@ def get_workflow_router(
         workflows: List[WorkflowSummaryResponse] = []
         if accessible_workflows:
             for workflow in accessible_workflows:
-                workflows.append(WorkflowSummaryResponse.from_workflow(workflow=workflow, is_component=False))
+                workflow_response = workflow_response_cache.get(workflow)
+                if workflow_response is None:
+                    workflow_response = WorkflowSummaryResponse.from_workflow(workflow=workflow, is_component=False)
+                    # Remote config can change at any time, so it is never cached
+                    if not isinstance(workflow, RemoteWorkflow):
+                        workflow_response_cache.set(workflow, workflow_response)
+                workflows.append(workflow_response)
 
         if os.db and isinstance(os.db, BaseDb):
             from agno.workflow.workflow import get_workflows
@@ -1218,7 +1212,7 @@ def get_workflow_router(
             logger.debug(f"Continuing session: {session_id}")
         else:
             logger.debug("Creating new session")
-            session_id = str(uuid4())
+            session_id = generate_uuid7()
 
         # Extract auth token for remote workflows
         auth_token = get_auth_token_from_request(request)
@@ -1245,6 +1239,7 @@ def get_workflow_router(
                         **kwargs,
                     ),
                     media_type="text/event-stream",
+                    headers=SSE_HEADERS,
                 )
 
             # background=True, stream=False: return 202 immediately with run metadata
@@ -1276,16 +1271,19 @@ def get_workflow_router(
         try:
             if stream:
                 return StreamingResponse(
-                    workflow_response_streamer(
-                        workflow,
-                        input=message,
-                        session_id=session_id,
-                        user_id=user_id,
-                        background_tasks=background_tasks,
-                        auth_token=auth_token,
-                        **kwargs,
+                    coalesce_sse_stream(
+                        workflow_response_streamer(
+                            workflow,
+                            input=message,
+                            session_id=session_id,
+                            user_id=user_id,
+                            background_tasks=background_tasks,
+                            auth_token=auth_token,
+                            **kwargs,
+                        )
                     ),
                     media_type="text/event-stream",
+                    headers=SSE_HEADERS,
                 )
             else:
                 # Pass auth_token for remote workflows
@@ -1300,7 +1298,7 @@ def get_workflow_router(
                     background_tasks=background_tasks,
                     **kwargs,
                 )
-                return run_response.to_dict()
+                return RunJSONResponse(run_response.to_dict())
 
         except InputCheckError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -1431,15 +1429,18 @@ def get_workflow_router(
 
         if stream:
             return StreamingResponse(
-                workflow_continue_response_streamer(
-                    workflow,
-                    run_id=run_id,
-                    session_id=session_id,
-                    user_id=effective_user_id,
-                    step_requirements=parsed_requirements,
-                    background_tasks=background_tasks,
+                coalesce_sse_stream(
+                    workflow_continue_response_streamer(
+                        workflow,
+                        run_id=run_id,
+                        session_id=session_id,
+                        user_id=effective_user_id,
+                        step_requirements=parsed_requirements,
+                        background_tasks=background_tasks,
+                    )
                 ),
                 media_type="text/event-stream",
+                headers=SSE_HEADERS,
             )
         else:
             try:
@@ -1452,7 +1453,7 @@ def get_workflow_router(
                     stream=False,
                     background_tasks=background_tasks,
                 )
-                return run_response.to_dict()
+                return RunJSONResponse(run_response.to_dict())
             except InputCheckError as e:
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
@@ -1617,6 +1618,7 @@ def get_workflow_router(
         return StreamingResponse(
             _resume_stream_generator(workflow, run_id, last_event_index, session_id, user_id=scoped_user_id),
             media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
 
     @router.get(
@@ -1694,7 +1696,7 @@ def get_workflow_router(
         if not run_matches_component(run_output, "workflows", workflow_id):
             raise HTTPException(status_code=404, detail="Run not found")
 
-        return run_output.to_dict()
+        return RunJSONResponse(run_output.to_dict())
 
     @router.get(
         "/workflows/{workflow_id}/runs",
@@ -342,6 +342,14 @@ class WorkflowRunRequest(BaseModel):
     session_id: Optional[str] = Field(None, description="Session identifier for context persistence")
 
 
+class AgentBatchRunRequest(BaseModel):
+    messages: List[str] = Field(
+        ..., description="Input messages, each run in its own new session", min_length=1, max_length=100
+    )
+    user_id: Optional[str] = Field(None, description="User identifier for the runs")
+    max_concurrency: int = Field(8, description="Maximum number of runs executing at the same time", ge=1, le=32)
+
+
 class SessionSchema(BaseModel):
     session_id: str = Field(..., description="Unique identifier for the session")
     session_name: str = Field(..., description="Human-readable name for the session")
@@ -381,7 +389,8 @@ class SessionSchema(BaseModel):
         # Determine session_type using shared util
         session_type_str: Optional[str] = detect_session_type(session)
 
-        return cls(
+        # Every value is read from our own storage and normalized above, so skip validation
+        return cls.model_construct(
             session_id=session.get("session_id", ""),
             session_name=session_name,
             session_state=session_data.get("session_state", None),
@@ -440,7 +449,11 @@ class AgentSessionDetailSchema(BaseModel):
 
     @classmethod
     def from_session(cls, session: AgentSession) -> "AgentSessionDetailSchema":
-        session_name = get_session_name({**session.to_dict(), "session_type": "agent"})
+        # Read session_data and its metrics once instead of re-resolving them for every field
+        session_data = session.session_data
+        metrics = session_data.get("session_metrics", {}) if session_data else None
+        # Only the fields get_session_name reads; session.to_dict() would copy and serialize every run
+        session_name = get_session_name({"session_data": session_data, "runs": session.runs, "session_type": "agent"})
         created_at = datetime.fromtimestamp(session.created_at, tz=timezone.utc) if session.created_at else None
         updated_at = datetime.fromtimestamp(session.updated_at, tz=timezone.utc) if session.updated_at else created_at
         return cls(
@@ -449,13 +462,11 @@ class AgentSessionDetailSchema(BaseModel):
             session_id=session.session_id,
             session_name=session_name,
             session_summary=session.summary.to_dict() if session.summary else None,
-            session_state=session.session_data.get("session_state", None) if session.session_data else None,
+            session_state=session_data.get("session_state", None) if session_data else None,
             agent_id=session.agent_id if session.agent_id else None,
             agent_data=session.agent_data,
-            total_tokens=session.session_data.get("session_metrics", {}).get("total_tokens")
-            if session.session_data
-            else None,
-            metrics=session.session_data.get("session_metrics", {}) if session.session_data else None,  # type: ignore
+            total_tokens=metrics.get("total_tokens") if metrics else None,
+            metrics=metrics,  # type: ignore
             metadata=session.metadata,
             chat_history=[message.to_dict() for message in session.get_chat_history()],
             created_at=to_utc_datetime(created_at),
@@ -480,22 +491,23 @@ class TeamSessionDetailSchema(BaseModel):
 
     @classmethod
     def from_session(cls, session: TeamSession) -> "TeamSessionDetailSchema":
-        session_dict = session.to_dict()
-        session_name = get_session_name({**session_dict, "session_type": "team"})
+        # Read session_data and its metrics once instead of re-resolving them for every field
+        session_data = session.session_data
+        metrics = session_data.get("session_metrics", {}) if session_data else None
+        # Only the fields get_session_name reads; session.to_dict() would copy and serialize every run
+        session_name = get_session_name({"session_data": session_data, "runs": session.runs, "session_type": "team"})
         created_at = datetime.fromtimestamp(session.created_at, tz=timezone.utc) if session.created_at else None
         updated_at = datetime.fromtimestamp(session.updated_at, tz=timezone.utc) if session.updated_at else created_at
         return cls(
             session_id=session.session_id,
             team_id=session.team_id,
             session_name=session_name,
-            session_summary=session_dict.get("summary") if session_dict.get("summary") else None,
+            session_summary=(session.summary.to_dict() or None) if session.summary else None,
             user_id=session.user_id,
             team_data=session.team_data,
-            session_state=session.session_data.get("session_state", None) if session.session_data else None,
-            total_tokens=session.session_data.get("session_metrics", {}).get("total_tokens")
-            if session.session_data
-            else None,
-            metrics=session.session_data.get("session_metrics", {}) if session.session_data else None,
+            session_state=session_data.get("session_state", None) if session_data else None,
+            total_tokens=metrics.get("total_tokens") if metrics else None,
+            metrics=metrics,
             metadata=session.metadata,
             chat_history=[message.to_dict() for message in session.get_chat_history()],
             created_at=to_utc_datetime(created_at),
@@ -520,8 +532,16 @@ class WorkflowSessionDetailSchema(BaseModel):
 
     @classmethod
     def from_session(cls, session: WorkflowSession) -> "WorkflowSessionDetailSchema":
-        session_dict = session.to_dict()
-        session_name = get_session_name({**session_dict, "session_type": "workflow"})
+        session_data = session.session_data
+        # Only the fields get_session_name reads; session.to_dict() would copy and serialize every run
+        session_name = get_session_name(
+            {
+                "session_data": session_data,
+                "runs": session.runs,
+                "workflow_data": session.workflow_data,
+                "session_type": "workflow",
+            }
+        )
         created_at = datetime.fromtimestamp(session.created_at, tz=timezone.utc) if session.created_at else None
         updated_at = datetime.fromtimestamp(session.updated_at, tz=timezone.utc) if session.updated_at else created_at
         return cls(
@@ -530,8 +550,8 @@ class WorkflowSessionDetailSchema(BaseModel):
             workflow_id=session.workflow_id,
             workflow_name=session.workflow_name,
             session_name=session_name,
-            session_data=session.session_data,
-            session_state=session.session_data.get("session_state", None) if session.session_data else None,
+            session_data=session_data,
+            session_state=session_data.get("session_state", None) if session_data else None,
             workflow_data=session.workflow_data,
             metadata=session.metadata,
             created_at=to_utc_datetime(created_at),
@@ -434,6 +434,7 @@ def get_default_scope_mappings() -> Dict[str, List[str]]:
         "POST /agents/*/runs": ["agents:run"],
         "POST /agents/*/runs/*/continue": ["agents:run"],
         "POST /agents/*/runs/*/cancel": ["agents:run"],
+        "POST /agents/*/batch": ["agents:run"],
         # Team endpoints
         "GET /teams": ["teams:read"],
         "GET /teams/*": ["teams:read"],
@@ -86,12 +86,11 @@ async def get_sessions_page(
         page=page,
         sort_by=sort_by,
         sort_order=sort_order,
-        deserialize=False,
     )
     if isinstance(db, AsyncBaseDb):
-        sessions, total_count = await db.get_sessions(**kwargs)
+        sessions, total_count = await db.get_session_summaries(**kwargs)
     else:
-        sessions, total_count = await run_in_threadpool(lambda: db.get_sessions(**kwargs))
+        sessions, total_count = await run_in_threadpool(lambda: db.get_session_summaries(**kwargs))
     return sessions, total_count  # type: ignore[return-value]
 
 
@@ -1,9 +1,31 @@
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import date, datetime, time, timezone
 from os import getenv
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+from time import time as unix_time
+from types import MethodType
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from fastapi import FastAPI, HTTPException, Request, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from fastapi.routing import APIRoute, APIRouter
 from pydantic import BaseModel, create_model
 from starlette.middleware.cors import CORSMiddleware
@@ -11,6 +33,7 @@ from starlette.middleware.cors import CORSMiddleware
 from agno.agent import Agent, AgentFactory, RemoteAgent
 from agno.agent.protocol import AgentProtocol
 from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.utils import get_session_title, stringify_input_content
 from agno.factory import (
     FactoryContextRequired,
     FactoryError,
@@ -21,7 +44,6 @@ from agno.factory import (
 from agno.knowledge.knowledge import Knowledge
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
-from agno.models.message import Message
 from agno.os.config import AgentOSConfig
 from agno.registry import Registry
 from agno.remote.base import RemoteDb, RemoteKnowledge
@@ -30,7 +52,8 @@ from agno.run.team import TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.team import RemoteTeam, Team, TeamFactory
 from agno.tools import Function, Toolkit
-from agno.utils.log import log_debug, log_warning, logger
+from agno.utils.log import log_debug, log_error, log_warning, logger
+from agno.utils.serialize import json_dumps_bytes, json_serializer
 from agno.workflow import RemoteWorkflow, Workflow, WorkflowFactory
 
 
@@ -207,6 +230,51 @@ async def get_request_kwargs(request: Request, endpoint_func: Callable) -> Dict[
     return kwargs
 
 
+# Extra headers for SSE responses. Disables proxy buffering (nginx) so each event is flushed immediately.
+SSE_HEADERS = {"X-Accel-Buffering": "no"}
+
+
+class RunJSONResponse(JSONResponse):
+    """JSONResponse for large run/session/memory payloads, rendered with orjson when it is installed.
+
+    Returning a plain dict makes FastAPI walk it with `jsonable_encoder` and then re-serialize
+    it with the stdlib json module. This response encodes the dict directly and only falls back
+    to `jsonable_encoder` for values that are not natively serializable, so the output is unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps_bytes(content, default=jsonable_encoder)
+
+
+def compute_etag(content: bytes) -> str:
+    """Compute a weak ETag for a rendered response body."""
+    return f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using weak comparison."""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def etag_json_response(request: Request, content: bytes) -> Response:
+    """Return a rendered JSON body tagged with its ETag, or an empty 304 if the client already has it.
+
+    Polled list endpoints mostly return what the client fetched last time; answering those
+    polls with a 304 skips resending the payload.
+    """
+    etag = compute_etag(content)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+
 def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]) -> str:
     """Parse JSON data into SSE-compliant format.
 
@@ -237,6 +305,121 @@ def format_sse_event(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRu
         return f"event: message\ndata: {clean_json}\n\n"
 
 
+def format_sse_event_bytes(event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent]) -> bytes:
+    """Format an event as a pre-encoded SSE frame.
+
+    Same framing as `format_sse_event`, but returned as bytes so `StreamingResponse`
+    can write each chunk without encoding it again.
+    """
+    event_type = event.event or "message"
+    return f"event: {event_type}\ndata: ".encode("utf-8") + json_dumps_bytes(event.to_dict()) + b"\n\n"
+
+
+class SSEErrorFrame:
+    """Pre-rendered SSE frame for the error event a run streamer yields when the run fails.
+
+    The frame is rendered once per event class with placeholder values; `render` only splices
+    in the timestamp and the JSON-encoded message, which keeps error bursts from paying for a
+    full event construction and serialization each. Errors carrying an `error_type` or
+    `error_id` are rare and rendered through the event class as usual.
+    """
+
+    _MARKER = "__agno_error_message__"
+
+    def __init__(self, event_cls: Type[Any], field: str = "content") -> None:
+        self.event_cls = event_cls
+        self.field = field
+        frame = format_sse_event_bytes(event_cls(created_at=0, **{field: self._MARKER}))
+        head, tail = frame.split(b'"created_at":0', 1)
+        middle, suffix = tail.split(json_dumps_bytes(self._MARKER), 1)
+        self._head = head + b'"created_at":'
+        self._middle = middle
+        self._suffix = suffix
+
+    def render(self, message: str, error_type: Optional[str] = None, error_id: Optional[str] = None) -> bytes:
+        created_at = int(unix_time())
+        if error_type is not None or error_id is not None:
+            return format_sse_event_bytes(
+                self.event_cls(created_at=created_at, error_type=error_type, error_id=error_id, **{self.field: message})
+            )
+        return b"".join((self._head, str(created_at).encode(), self._middle, json_dumps_bytes(message), self._suffix))
+
+
+SSE_COALESCE_MAX_MS = 4.0
+SSE_COALESCE_MAX_BYTES = 8192
+SSE_COALESCE_MAX_PENDING = 256
+_STREAM_END = object()
+
+
+async def coalesce_sse_stream(
+    stream: AsyncIterator[Union[str, bytes]],
+    max_ms: float = SSE_COALESCE_MAX_MS,
+    max_bytes: int = SSE_COALESCE_MAX_BYTES,
+) -> AsyncGenerator[bytes, None]:
+    """Merge SSE frames produced close together into a single response body chunk.
+
+    Token streams yield many tiny frames per second and each one otherwise becomes its own
+    ASGI message and socket write. The first frame is sent as soon as it is produced; after
+    that, frames are buffered until `max_ms` has passed since the first buffered frame or the
+    buffer holds `max_bytes`.
+
+    The source is iterated by a single producer task, which is cancelled when this generator
+    is closed, so a client disconnect still cancels an inline run.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_COALESCE_MAX_PENDING)
+
+    async def produce() -> None:
+        try:
+            async for frame in stream:
+                await queue.put(frame)
+        except Exception as e:
+            await queue.put(e)
+            return
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    buffer = bytearray()
+    window = 0.0  # The first frame goes out immediately
+    deadline = loop.time()
+    try:
+        while True:
+            if buffer:
+                remaining = deadline - loop.time()
+                if remaining <= 0 or len(buffer) >= max_bytes:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    window = max_ms / 1000
+                    continue
+                if not queue.empty():
+                    item = queue.get_nowait()
+                else:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        continue
+            else:
+                item = await queue.get()
+                deadline = loop.time() + window
+
+            if isinstance(item, BaseException):
+                if buffer:
+                    yield bytes(buffer)
+                raise item
+            if item is _STREAM_END:
+                if buffer:
+                    yield bytes(buffer)
+                return
+            buffer += item.encode("utf-8") if isinstance(item, str) else item
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
 def format_sse_event_with_index(
     event: Union[RunOutputEvent, TeamRunOutputEvent, WorkflowRunOutputEvent],
     event_index: Optional[int] = None,
@@ -255,8 +438,6 @@ def format_sse_event_with_index(
     Returns:
         SSE-formatted string with event_index in the data payload.
     """
-    from agno.utils.serialize import json_serializer
-
     try:
         event_type = event.event or "message"
         event_dict = event.to_dict()
@@ -477,46 +658,12 @@ def get_session_name(session: Dict[str, Any]) -> str:
     if session_data is not None and session_data.get("session_name") is not None:
         return session_data["session_name"]
 
-    runs = session.get("runs", []) or []
-    session_type = session.get("session_type")
-
-    # Handle workflows separately
-    if session_type == "workflow":
-        if not runs:
-            return ""
-        workflow_run = runs[0]
-        workflow_input = workflow_run.get("input")
-        if isinstance(workflow_input, str):
-            return workflow_input
-        elif isinstance(workflow_input, dict):
-            try:
-                return json.dumps(workflow_input)
-            except (TypeError, ValueError):
-                pass
-        workflow_name = session.get("workflow_data", {}).get("name")
-        return f"New {workflow_name} Session" if workflow_name else ""
-
-    # For team, filter to team runs (runs without agent_id); for agents, use all runs
-    if session_type == "team":
-        runs_to_check = [r for r in runs if not r.get("agent_id")]
-    else:
-        runs_to_check = runs
-
-    # Find the first user message across runs
-    for r in runs_to_check:
-        if r is None:
-            continue
-        run_dict = r if isinstance(r, dict) else r.to_dict()
+    # Otherwise use the title precomputed when the session was written, deriving it from runs for
+    # sessions stored before titles were precomputed
+    if session_data is not None and session_data.get("session_title") is not None:
+        return session_data["session_title"]
 
-        for message in run_dict.get("messages") or []:
-            if message.get("role") == "user" and message.get("content"):
-                return message["content"]
-
-        run_input = r.get("input")
-        if run_input is not None:
-            return stringify_input_content(run_input)
-
-    return ""
+    return get_session_title(session)
 
 
 def extract_input_media(run_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -538,75 +685,95 @@ def extract_input_media(run_dict: Dict[str, Any]) -> Dict[str, Any]:
 
 
 # Supported MIME types per media category, used to route uploaded files to the
-# correct processor. Keep these aligned with `File.valid_mime_types()` in agno.media
+# correct processor. Keep these aligned with `FILE_MIME_TYPES` in agno.media
 # for document types.
-IMAGE_MIME_TYPES = {
-    "image/png",
-    "image/jpeg",
-    "image/jpg",
-    "image/gif",
-    "image/webp",
-    "image/bmp",
-    "image/tiff",
-    "image/tif",
-    "image/avif",
-    "image/heic",
-    "image/heif",
-}
+IMAGE_MIME_TYPES: FrozenSet[str] = frozenset(
+    {
+        "image/png",
+        "image/jpeg",
+        "image/jpg",
+        "image/gif",
+        "image/webp",
+        "image/bmp",
+        "image/tiff",
+        "image/tif",
+        "image/avif",
+        "image/heic",
+        "image/heif",
+    }
+)
 
-AUDIO_MIME_TYPES = {
-    "audio/wav",
-    "audio/wave",
-    "audio/mp3",
-    "audio/mpeg",
-    "audio/ogg",
-    "audio/mp4",
-    "audio/m4a",
-    "audio/aac",
-    "audio/flac",
-}
+AUDIO_MIME_TYPES: FrozenSet[str] = frozenset(
+    {
+        "audio/wav",
+        "audio/wave",
+        "audio/mp3",
+        "audio/mpeg",
+        "audio/ogg",
+        "audio/mp4",
+        "audio/m4a",
+        "audio/aac",
+        "audio/flac",
+    }
+)
 
-VIDEO_MIME_TYPES = {
-    "video/x-flv",
-    "video/quicktime",
-    "video/mpeg",
-    "video/mpegs",
-    "video/mpgs",
-    "video/mpg",
-    "video/mp4",
-    "video/webm",
-    "video/wmv",
-    "video/3gpp",
-}
+VIDEO_MIME_TYPES: FrozenSet[str] = frozenset(
+    {
+        "video/x-flv",
+        "video/quicktime",
+        "video/mpeg",
+        "video/mpegs",
+        "video/mpgs",
+        "video/mpg",
+        "video/mp4",
+        "video/webm",
+        "video/wmv",
+        "video/3gpp",
+    }
+)
 
-# NOTE: Keep this in sync with `File.valid_mime_types()` in agno.media. Every type here must
+# NOTE: Keep this in sync with `FILE_MIME_TYPES` in agno.media. Every type here must
 # be valid there, or the upload returns 200 but the file is silently dropped during FileMedia
 # construction. Office binary/OOXML formats (.doc, .docx, .ppt, .pptx, .xls, .xlsx) are accepted
 # at upload, but not all model providers support them as raw input - Anthropic and Gemini, for
 # example, 400 on PowerPoint. Those uploads succeed here and fail later with a provider error.
-DOCUMENT_MIME_TYPES = {
-    "application/pdf",
-    "application/json",
-    "application/x-javascript",
-    # Office Open XML (modern Office formats)
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
-    "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
-    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
-    # Legacy binary Office formats
-    "application/msword",  # .doc
-    "application/vnd.ms-powerpoint",  # .ppt
-    "application/vnd.ms-excel",  # .xls
-    "application/vnd.ms-outlook",  # .msg
-    "text/javascript",
-    "application/x-python",
-    "text/x-python",
-    "text/plain",
-    "text/html",
-    "text/css",
-    "text/markdown",
-    "text/csv",
-    "text/xml",
-    "text/rtf",
+DOCUMENT_MIME_TYPES: FrozenSet[str] = frozenset(
+    {
+        "application/pdf",
+        "application/json",
+        "application/x-javascript",
+        # Office Open XML (modern Office formats)
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
+        # Legacy binary Office formats
+        "application/msword",  # .doc
+        "application/vnd.ms-powerpoint",  # .ppt
+        "application/vnd.ms-excel",  # .xls
+        "application/vnd.ms-outlook",  # .msg
+        "text/javascript",
+        "application/x-python",
+        "text/x-python",
+        "text/plain",
+        "text/html",
+        "text/css",
+        "text/markdown",
+        "text/csv",
+        "text/xml",
+        "text/rtf",
+    }
+)
+
+# Media category of every supported content type, so routing an upload is a single lookup
+CONTENT_TYPE_CATEGORY: Dict[str, str] = {
+    content_type: category
+    for category, content_types in (
+        ("document", DOCUMENT_MIME_TYPES),
+        ("video", VIDEO_MIME_TYPES),
+        ("audio", AUDIO_MIME_TYPES),
+        ("image", IMAGE_MIME_TYPES),
+    )
+    for content_type in content_types
 }
 
 # Fallback mapping from file extension to media category. Used when the browser sends a
@@ -666,7 +833,7 @@ EXTENSION_CATEGORY: Dict[str, str] = {
 
 # Content types that are too generic to classify on their own; fall back to the
 # file extension for these.
-_AMBIGUOUS_CONTENT_TYPES = {None, "", "application/octet-stream"}
+_AMBIGUOUS_CONTENT_TYPES: FrozenSet[Optional[str]] = frozenset({None, "", "application/octet-stream"})
 
 
 def classify_upload_file(file: UploadFile) -> Optional[str]:
@@ -677,14 +844,9 @@ def classify_upload_file(file: UploadFile) -> Optional[str]:
     filename extension. Returns None if the file type is not supported.
     """
     content_type = file.content_type
-    if content_type in IMAGE_MIME_TYPES:
-        return "image"
-    if content_type in AUDIO_MIME_TYPES:
-        return "audio"
-    if content_type in VIDEO_MIME_TYPES:
-        return "video"
-    if content_type in DOCUMENT_MIME_TYPES:
-        return "document"
+    category = CONTENT_TYPE_CATEGORY.get(content_type) if content_type else None
+    if category is not None:
+        return category
 
     # Fall back to the file extension for ambiguous/missing content types.
     if content_type in _AMBIGUOUS_CONTENT_TYPES and file.filename and "." in file.filename:
@@ -756,11 +918,12 @@ def _resolve_document_mime_type(file: UploadFile) -> Optional[str]:
     return file.content_type
 
 
-def process_document(file: UploadFile) -> Optional[FileMedia]:
-    content = file.file.read()
+def process_document(file: UploadFile, content: Optional[bytes] = None) -> Optional[FileMedia]:
+    if content is None:
+        content = file.file.read()
     if not content:
         raise HTTPException(status_code=400, detail="Empty file")
-    # FileMedia construction validates the mime_type against File.valid_mime_types(). Every
+    # FileMedia construction validates the mime_type against FILE_MIME_TYPES. Every
     # type in DOCUMENT_MIME_TYPES must also be valid there, otherwise the file is silently
     # dropped here (the upload still returns 200). The unit tests assert the two stay in sync.
     return FileMedia(
@@ -784,6 +947,73 @@ def extract_format(file: UploadFile) -> Optional[str]:
     return None
 
 
+# How each upload category is named in processing errors
+_UPLOAD_LABELS: Dict[str, str] = {"image": "image", "audio": "audio", "video": "video", "document": "file"}
+
+_MEDIA_PROCESSORS: Dict[str, Callable[[UploadFile], Any]] = {
+    "image": process_image,
+    "audio": process_audio,
+    "video": process_video,
+}
+
+
+async def _process_upload_file(file: UploadFile, category: str) -> Any:
+    try:
+        if category == "document":
+            return process_document(file, content=await file.read())
+        # Media uploads are read (and possibly spooled from disk) synchronously, so keep them off the event loop
+        return await asyncio.to_thread(_MEDIA_PROCESSORS[category], file)
+    finally:
+        # The run holds its own copy of the bytes. Release the spooled upload now rather than when the
+        # request finishes, which for a streamed run can be long after processing.
+        await file.close()
+
+
+async def process_upload_files(
+    files: List[UploadFile],
+) -> Tuple[List[Image], List[Audio], List[Video], List[FileMedia]]:
+    """Convert uploaded files into the image, audio, video and document inputs of a run.
+
+    All uploads are processed concurrently: documents are read with the async
+    ``UploadFile.read`` and media files are processed in worker threads. Each upload is closed
+    once its content has been read. An unsupported file type or a rejected upload (an
+    `HTTPException`, e.g. an empty file) fails the whole request with its status code; any
+    other error while converting a file is logged and that file is skipped.
+    """
+    categories: List[str] = []
+    for file in files:
+        category = classify_upload_file(file)
+        if category is None:
+            raise HTTPException(status_code=400, detail="Unsupported file type")
+        categories.append(category)
+
+    results = await asyncio.gather(
+        *(_process_upload_file(file, category) for file, category in zip(files, categories)),
+        return_exceptions=True,
+    )
+
+    images: List[Image] = []
+    audios: List[Audio] = []
+    videos: List[Video] = []
+    documents: List[FileMedia] = []
+    buckets: Dict[str, List[Any]] = {"image": images, "audio": audios, "video": videos, "document": documents}
+    for file, category, result in zip(files, categories, results):
+        if isinstance(result, HTTPException):
+            raise result
+        if isinstance(result, Exception):
+            log_error(
+                f"Error processing {_UPLOAD_LABELS[category]} {file.filename} "
+                f"with content type {file.content_type}: {str(result)}"
+            )
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        if result is not None:
+            buckets[category].append(result)
+
+    return images, audios, videos, documents
+
+
 def build_request_context(
     request: Request,
     user_id: Optional[str] = None,
@@ -826,18 +1056,172 @@ def build_request_context(
     )
 
 
+# Per-list ID -> position indexes, keyed by id() of the component list. Each entry holds the
+# IDs the index was built from rather than the list itself, so no list is kept alive and an
+# entry left behind by a freed list is detected as stale like any other.
+_COMPONENT_INDEXES: Dict[int, Tuple[Tuple[Optional[str], ...], Dict[str, int]]] = {}
+_MAX_COMPONENT_INDEXES = 64
+
+
+def find_component_by_id(component_id: Optional[str], components: Optional[Sequence[Any]]) -> Optional[Any]:
+    """Find the first agent/team/workflow (or factory) with the given ID in a list of components.
+
+    Hits resolve in O(1) through a cached ID -> position index instead of scanning the list on
+    every request. A miss compares the list's current IDs with the ones the index was built
+    from and only rebuilds the index when they differ, so components replaced in place or
+    renamed are still found, while repeated misses (e.g. IDs served from the database) do not
+    pay for a rebuild.
+    """
+    if not components or component_id is None:
+        return None
+
+    entry = _COMPONENT_INDEXES.get(id(components))
+    if entry is not None and len(entry[0]) == len(components):
+        position = entry[1].get(component_id)
+        if position is not None and components[position].id == component_id:
+            return components[position]
+
+    component_ids = tuple(component.id for component in components)
+    if entry is not None and entry[0] == component_ids:
+        # The index is current, so this ID really is not in the list
+        return None
+
+    # Index missing or stale: rebuild it, keeping the first occurrence of each ID
+    index: Dict[str, int] = {}
+    for position, cid in enumerate(component_ids):
+        if cid is not None:
+            index.setdefault(cid, position)
+    if len(_COMPONENT_INDEXES) >= _MAX_COMPONENT_INDEXES:
+        _COMPONENT_INDEXES.clear()
+    _COMPONENT_INDEXES[id(components)] = (component_ids, index)
+
+    found = index.get(component_id)
+    return components[found] if found is not None else None
+
+
+class ComponentResponseCache:
+    """Memoizes the response built for each code-defined component on the list endpoints.
+
+    Code-defined agents, teams and workflows are fixed for the lifetime of a router, so the
+    response built for each of them can be reused across requests instead of being rebuilt on
+    every hit. Entries are keyed by object identity. Routers are rebuilt on `AgentOS.resync()`,
+    which starts from an empty cache; call `clear()` to drop entries explicitly.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[Any, Tuple[Any, ...], Any]] = {}
+
+    @staticmethod
+    def _tools_fingerprint(component: Any) -> Tuple[Any, ...]:
+        """Identity of the tools (and members' tools) a cached response was built from.
+
+        Tools added after the response was cached (e.g. with `add_tool()`) change this
+        fingerprint, so the stale entry is dropped instead of being served.
+        """
+        tools = getattr(component, "tools", None)
+        members = getattr(component, "members", None)
+        return (
+            tuple(map(id, tools)) if isinstance(tools, list) else id(tools),
+            tuple(ComponentResponseCache._tools_fingerprint(member) for member in members)
+            if isinstance(members, list)
+            else id(members),
+        )
+
+    def get(self, component: Any) -> Optional[Any]:
+        entry = self._entries.get(id(component))
+        if entry is None or entry[0] is not component:
+            return None
+        if entry[1] != self._tools_fingerprint(component):
+            del self._entries[id(component)]
+            return None
+        return entry[2]
+
+    def set(self, component: Any, response: Any) -> None:
+        # Keep a reference to the component so its id() cannot be reused while cached
+        self._entries[id(component)] = (component, self._tools_fingerprint(component), response)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RunResponseCache:
+    """LRU of rendered run responses for exact-match replays of opt-in (`?cache=1`) runs.
+
+    Entries are keyed by a blake2b fingerprint of everything that shapes a run (see
+    `fingerprint`) and hold the response body exactly as it was sent: the SSE frames of a
+    streamed run or the JSON document of a non-streamed one. Only completed runs are stored.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> bytes:
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            hasher.update(json.dumps(part, sort_keys=True, default=json_serializer, ensure_ascii=False).encode("utf-8"))
+            hasher.update(b"\x1f")
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: bytes, body: bytes) -> None:
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def tee(self, key: bytes, frames: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+        """Pass SSE frames through, storing them once the run has streamed to completion."""
+        body = bytearray()
+        last_frame = b""
+        async for frame in frames:
+            body += frame
+            last_frame = frame
+            yield frame
+        if last_frame.startswith(b"event: RunCompleted\n"):
+            self.set(key, bytes(body))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def has_mcp_tools(component: Any) -> bool:
+    """Whether a component uses MCPTools or MultiMCPTools, whose functions change as they (re)connect."""
+    tools = getattr(component, "tools", None)
+    if not isinstance(tools, list):
+        return False
+    # Match on class names (subclasses included) so the optional mcp dependency is not imported
+    return any({cls.__name__ for cls in type(tool).__mro__} & {"MCPTools", "MultiMCPTools"} for tool in tools)
+
+
+def is_static_component(component: Any) -> bool:
+    """Whether a component's cached config response can be served as-is.
+
+    Callable tools, instructions or system messages are resolved per request, and MCP
+    toolkits load their functions on connect, so those parts of the response must be
+    rebuilt for a component using any of them.
+    """
+    if has_mcp_tools(component):
+        return False
+    return not any(callable(getattr(component, attr, None)) for attr in ("tools", "instructions", "system_message"))
+
+
 def find_factory_by_id(
     component_id: str,
     components: Optional[Sequence[Any]],
 ) -> Optional[Any]:
     """Find a factory entry by ID from a list of components."""
-    if not components:
-        return None
     from agno.factory.base import BaseFactory
 
-    for component in components:
-        if isinstance(component, BaseFactory) and component.id == component_id:
-            return component
+    component = find_component_by_id(component_id, components)
+    if isinstance(component, BaseFactory):
+        return component
     return None
 
 
@@ -872,24 +1256,23 @@ def get_agent_by_id(
         return None
 
     # Try to get the agent from the list of agents
-    if agents:
-        for agent in agents:
-            if agent.id == agent_id:
-                # Base Agent — most common path, early exit
-                if isinstance(agent, Agent):
-                    if create_fresh:
-                        fresh_agent = agent.deep_copy()
-                        fresh_agent.team_id = None
-                        fresh_agent.workflow_id = None
-                        return fresh_agent
-                    return agent
-                # Factory path
-                if isinstance(agent, AgentFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(f"Agent '{agent_id}' is a factory and requires a RequestContext.")
-                    return agent.resolve(ctx, expected_type=Agent)
-                # RemoteAgent or other
-                return agent
+    agent = find_component_by_id(agent_id, agents)
+    if agent is not None:
+        # Base Agent — most common path, early exit
+        if isinstance(agent, Agent):
+            if create_fresh:
+                fresh_agent = agent.deep_copy()
+                fresh_agent.team_id = None
+                fresh_agent.workflow_id = None
+                return fresh_agent
+            return agent
+        # Factory path
+        if isinstance(agent, AgentFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Agent '{agent_id}' is a factory and requires a RequestContext.")
+            return agent.resolve(ctx, expected_type=Agent)
+        # RemoteAgent or other
+        return agent
 
     # Try to get the agent from the database
     if db and isinstance(db, BaseDb):
@@ -918,25 +1301,24 @@ async def get_agent_by_id_async(
     if agent_id is None:
         return None
 
-    if agents:
-        for agent in agents:
-            if agent.id == agent_id:
-                # Base Agent — most common path, early exit
-                if isinstance(agent, Agent):
-                    if create_fresh:
-                        fresh_agent = agent.deep_copy()
-                        fresh_agent.team_id = None
-                        fresh_agent.workflow_id = None
-                        return fresh_agent
-                    return agent
-                # Factory path
-                if isinstance(agent, AgentFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(f"Agent '{agent_id}' is a factory and requires a RequestContext.")
-                    result = await agent.resolve_async(ctx, expected_type=Agent)
-                    return result
-                # RemoteAgent or other
-                return agent
+    agent = find_component_by_id(agent_id, agents)
+    if agent is not None:
+        # Base Agent — most common path, early exit
+        if isinstance(agent, Agent):
+            if create_fresh:
+                fresh_agent = agent.deep_copy()
+                fresh_agent.team_id = None
+                fresh_agent.workflow_id = None
+                return fresh_agent
+            return agent
+        # Factory path
+        if isinstance(agent, AgentFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Agent '{agent_id}' is a factory and requires a RequestContext.")
+            result = await agent.resolve_async(ctx, expected_type=Agent)
+            return result
+        # RemoteAgent or other
+        return agent
 
     if db and isinstance(db, BaseDb):
         from agno.agent.agent import get_agent_by_id as get_agent_by_id_db
@@ -980,19 +1362,18 @@ def get_team_by_id(
     if team_id is None:
         return None
 
-    if teams:
-        for team in teams:
-            if team.id == team_id:
-                if isinstance(team, Team):
-                    if create_fresh:
-                        return team.deep_copy()
-                    return team
-                if isinstance(team, TeamFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(f"Team '{team_id}' is a factory and requires a RequestContext.")
-                    result = team.resolve(ctx, expected_type=Team)
-                    return result
-                return team
+    team = find_component_by_id(team_id, teams)
+    if team is not None:
+        if isinstance(team, Team):
+            if create_fresh:
+                return team.deep_copy()
+            return team
+        if isinstance(team, TeamFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Team '{team_id}' is a factory and requires a RequestContext.")
+            result = team.resolve(ctx, expected_type=Team)
+            return result
+        return team
 
     if db and isinstance(db, BaseDb):
         from agno.team.team import get_team_by_id as get_team_by_id_db
@@ -1020,19 +1401,18 @@ async def get_team_by_id_async(
     if team_id is None:
         return None
 
-    if teams:
-        for team in teams:
-            if team.id == team_id:
-                if isinstance(team, Team):
-                    if create_fresh:
-                        return team.deep_copy()
-                    return team
-                if isinstance(team, TeamFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(f"Team '{team_id}' is a factory and requires a RequestContext.")
-                    result = await team.resolve_async(ctx, expected_type=Team)
-                    return result
-                return team
+    team = find_component_by_id(team_id, teams)
+    if team is not None:
+        if isinstance(team, Team):
+            if create_fresh:
+                return team.deep_copy()
+            return team
+        if isinstance(team, TeamFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Team '{team_id}' is a factory and requires a RequestContext.")
+            result = await team.resolve_async(ctx, expected_type=Team)
+            return result
+        return team
 
     if db and isinstance(db, BaseDb):
         from agno.team.team import get_team_by_id as get_team_by_id_db
@@ -1079,21 +1459,18 @@ def get_workflow_by_id(
     if workflow_id is None:
         return None
 
-    if workflows:
-        for workflow in workflows:
-            if workflow.id == workflow_id:
-                if isinstance(workflow, Workflow):
-                    if create_fresh:
-                        return workflow.deep_copy()
-                    return workflow
-                if isinstance(workflow, WorkflowFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(
-                            f"Workflow '{workflow_id}' is a factory and requires a RequestContext."
-                        )
-                    result = workflow.resolve(ctx, expected_type=Workflow)
-                    return result
-                return workflow
+    workflow = find_component_by_id(workflow_id, workflows)
+    if workflow is not None:
+        if isinstance(workflow, Workflow):
+            if create_fresh:
+                return workflow.deep_copy()
+            return workflow
+        if isinstance(workflow, WorkflowFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Workflow '{workflow_id}' is a factory and requires a RequestContext.")
+            result = workflow.resolve(ctx, expected_type=Workflow)
+            return result
+        return workflow
 
     if db and isinstance(db, BaseDb):
         from agno.workflow.workflow import get_workflow_by_id as get_workflow_by_id_db
@@ -1121,21 +1498,18 @@ async def get_workflow_by_id_async(
     if workflow_id is None:
         return None
 
-    if workflows:
-        for workflow in workflows:
-            if workflow.id == workflow_id:
-                if isinstance(workflow, Workflow):
-                    if create_fresh:
-                        return workflow.deep_copy()
-                    return workflow
-                if isinstance(workflow, WorkflowFactory):
-                    if ctx is None:
-                        raise FactoryContextRequired(
-                            f"Workflow '{workflow_id}' is a factory and requires a RequestContext."
-                        )
-                    result = await workflow.resolve_async(ctx, expected_type=Workflow)
-                    return result
-                return workflow
+    workflow = find_component_by_id(workflow_id, workflows)
+    if workflow is not None:
+        if isinstance(workflow, Workflow):
+            if create_fresh:
+                return workflow.deep_copy()
+            return workflow
+        if isinstance(workflow, WorkflowFactory):
+            if ctx is None:
+                raise FactoryContextRequired(f"Workflow '{workflow_id}' is a factory and requires a RequestContext.")
+            result = await workflow.resolve_async(ctx, expected_type=Workflow)
+            return result
+        return workflow
 
     if db and isinstance(db, BaseDb):
         from agno.workflow.workflow import get_workflow_by_id as get_workflow_by_id_db
@@ -1918,6 +2292,34 @@ def format_team_tools(team_tools: List[Union[Function, dict]]):
     return formatted_tools
 
 
+# Placeholder ids for the throwaway session and run built when resolving a component's tools for the
+# listing endpoints. Callable tool factories are cached by session id when there is no user id, so a
+# fresh random id per listing would re-run the factory and add a cache entry on every request.
+INTROSPECTION_SESSION_ID = "__introspect__"
+INTROSPECTION_RUN_ID = "__introspect__"
+
+
+_CALLABLE_TOOL_CACHE_SIZE = 1024
+_callable_tool_cache: "OrderedDict[Tuple[Callable, bool], Dict[str, Any]]" = OrderedDict()
+
+
+def _format_callable_tool(tool: Callable) -> Dict[str, Any]:
+    # Building a Function parses the callable's signature and docstring, which never change.
+    # Bound methods are keyed on their underlying function so no instance is kept alive, and
+    # callers get a deep copy so the cached parameters dict is never shared between responses.
+    is_method = isinstance(tool, MethodType)
+    key = (tool.__func__ if is_method else tool, is_method)  # type: ignore[attr-defined]
+    formatted = _callable_tool_cache.get(key)
+    if formatted is None:
+        formatted = Function.from_callable(tool).to_dict()
+        _callable_tool_cache[key] = formatted
+        if len(_callable_tool_cache) > _CALLABLE_TOOL_CACHE_SIZE:
+            _callable_tool_cache.popitem(last=False)
+    else:
+        _callable_tool_cache.move_to_end(key)
+    return deepcopy(formatted)
+
+
 def format_tools(agent_tools: List[Union[Dict[str, Any], Toolkit, Function, Callable]]):
     formatted_tools: List[Dict] = []
     if agent_tools is not None:
@@ -1930,39 +2332,16 @@ def format_tools(agent_tools: List[Union[Dict[str, Any], Toolkit, Function, Call
             elif isinstance(tool, Function):
                 formatted_tools.append(tool.to_dict())
             elif callable(tool):
-                func = Function.from_callable(tool)
-                formatted_tools.append(func.to_dict())
+                try:
+                    formatted_tools.append(_format_callable_tool(tool))
+                except TypeError:
+                    # Unhashable callable instance, format it uncached
+                    formatted_tools.append(Function.from_callable(tool).to_dict())
             else:
                 logger.warning(f"Unknown tool type: {type(tool)}")
     return formatted_tools
 
 
-def stringify_input_content(input_content: Union[str, Dict[str, Any], List[Any], BaseModel]) -> str:
-    """Convert any given input_content into its string representation.
-
-    This handles both serialized (dict) and live (object) input_content formats.
-    """
-    import json
-
-    if isinstance(input_content, str):
-        return input_content
-    elif isinstance(input_content, Message):
-        return json.dumps(input_content.to_dict())
-    elif isinstance(input_content, dict):
-        return json.dumps(input_content, indent=2, default=str)
-    elif isinstance(input_content, list):
-        if input_content:
-            # Handle live Message objects
-            if isinstance(input_content[0], Message):
-                return json.dumps([m.to_dict() for m in input_content])
-            # Handle serialized Message dicts
-            elif isinstance(input_content[0], dict) and input_content[0].get("role") == "user":
-                return input_content[0].get("content", str(input_content))
-        return str(input_content)
-    else:
-        return str(input_content)
-
-
 # ---------------------------------------------------------------------------
 # High-level resolvers with error handling for routers
 # ---------------------------------------------------------------------------
@@ -1986,7 +2365,7 @@ async def resolve_agent(
 
     Raises HTTPException on all error paths.
     """
-    is_factory = agents and any(isinstance(a, AgentFactory) and a.id == agent_id for a in agents)
+    is_factory = isinstance(find_component_by_id(agent_id, agents), AgentFactory)
     if is_factory:
         if request is None:
             raise HTTPException(status_code=400, detail="Request context is required for factory agents")
@@ -2029,7 +2408,7 @@ async def resolve_team(
     factory_input: Optional[str] = None,
 ) -> Union[Team, RemoteTeam]:
     """Resolve a team by ID with proper error handling for both factory and non-factory paths."""
-    is_factory = teams and any(isinstance(t, TeamFactory) and t.id == team_id for t in teams)
+    is_factory = isinstance(find_component_by_id(team_id, teams), TeamFactory)
     if is_factory:
         if request is None:
             raise HTTPException(status_code=400, detail="Request context is required for factory teams")
@@ -2072,7 +2451,7 @@ async def resolve_workflow(
     factory_input: Optional[str] = None,
 ) -> Union[Workflow, RemoteWorkflow]:
     """Resolve a workflow by ID with proper error handling for both factory and non-factory paths."""
-    is_factory = workflows and any(isinstance(w, WorkflowFactory) and w.id == workflow_id for w in workflows)
+    is_factory = isinstance(find_component_by_id(workflow_id, workflows), WorkflowFactory)
     if is_factory:
         if request is None:
             raise HTTPException(status_code=400, detail="Request context is required for factory workflows")
@@ -191,7 +191,7 @@ class BaseRunOutputEvent:
     def to_json(self, separators=(", ", ": "), indent: Optional[int] = 2) -> str:
         import json
 
-        from agno.utils.serialize import json_serializer
+        from agno.utils.serialize import json_dumps_compact, json_serializer
 
         try:
             _dict = self.to_dict()
@@ -199,7 +199,10 @@ class BaseRunOutputEvent:
             log_error(f"Failed to convert response event to json: {str(e)}")
             raise
 
-        if indent is None:
+        if indent is None and tuple(separators) == (",", ":"):
+            # Compact form is what the SSE streamers emit per chunk, so use the fast encoder
+            return json_dumps_compact(_dict)
+        elif indent is None:
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
             return json.dumps(_dict, indent=indent, separators=separators, default=json_serializer, ensure_ascii=False)
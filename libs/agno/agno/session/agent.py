@@ -72,6 +72,11 @@ class AgentSession:
 
         metadata = data.get("metadata")
 
+        session_data = data.get("session_data")
+        if isinstance(session_data, dict) and "session_title" in session_data:
+            # The title precomputed for session lists is storage-only (see agno.db.utils.session_to_dict_with_title)
+            session_data = {key: value for key, value in session_data.items() if key != "session_title"}
+
         return cls(
             session_id=data.get("session_id"),  # type: ignore
             agent_id=data.get("agent_id"),
@@ -79,7 +84,7 @@ class AgentSession:
             workflow_id=data.get("workflow_id"),
             team_id=data.get("team_id"),
             agent_data=data.get("agent_data"),
-            session_data=data.get("session_data"),
+            session_data=session_data,
             metadata=metadata,
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
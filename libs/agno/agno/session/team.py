@@ -70,13 +70,18 @@ class TeamSession:
                 elif "team_id" in run:
                     serialized_runs.append(TeamRunOutput.from_dict(run))
 
+        session_data = data.get("session_data")
+        if isinstance(session_data, dict) and "session_title" in session_data:
+            # The title precomputed for session lists is storage-only (see agno.db.utils.session_to_dict_with_title)
+            session_data = {key: value for key, value in session_data.items() if key != "session_title"}
+
         return cls(
             session_id=data.get("session_id"),  # type: ignore
             team_id=data.get("team_id"),
             user_id=data.get("user_id"),
             workflow_id=data.get("workflow_id"),
             team_data=data.get("team_data"),
-            session_data=data.get("session_data"),
+            session_data=session_data,
             metadata=data.get("metadata"),
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
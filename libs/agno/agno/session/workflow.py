@@ -94,13 +94,18 @@ class WorkflowSession:
                 else:
                     logger.warning(f"Unexpected run item type: {type(run_item)}")
 
+        session_data = data.get("session_data")
+        if isinstance(session_data, dict) and "session_title" in session_data:
+            # The title precomputed for session lists is storage-only (see agno.db.utils.session_to_dict_with_title)
+            session_data = {key: value for key, value in session_data.items() if key != "session_title"}
+
         return cls(
             session_id=data.get("session_id"),  # type: ignore
             user_id=data.get("user_id"),
             workflow_id=data.get("workflow_id"),
             workflow_name=data.get("workflow_name"),
             runs=runs,
-            session_data=data.get("session_data"),
+            session_data=session_data,
             workflow_data=data.get("workflow_data"),
             metadata=data.get("metadata"),
             created_at=data.get("created_at"),
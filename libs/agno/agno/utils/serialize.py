@@ -1,8 +1,17 @@
 """JSON serialization utilities for handling datetime and enum objects."""
 
+import json
 from datetime import date, datetime, time
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
 
 
 def json_serializer(obj: Any) -> Any:
@@ -30,3 +39,53 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+def json_dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = json_serializer) -> bytes:
+    """Serialize an object to compact, UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed and falls back to the stdlib json module otherwise
+    (or when orjson rejects the payload, e.g. integers wider than 64 bits). The output is
+    equivalent to ``json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default)``.
+
+    Args:
+        obj: Object to serialize
+        default: Hook for objects that are not natively JSON serializable
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            # Datetimes and dataclasses are passed through to `default` so the output matches
+            # the stdlib path exactly.
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False).encode("utf-8")
+
+
+def json_dumps_compact(obj: Any, default: Optional[Callable[[Any], Any]] = json_serializer) -> str:
+    """Serialize an object to a compact JSON string. See `json_dumps_bytes`."""
+    return json_dumps_bytes(obj, default=default).decode("utf-8")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Falls back to the stdlib json module when orjson is missing or rejects the input (e.g. NaN
+    literals or integers wider than 64 bits), so the accepted grammar matches ``json.loads``.
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -87,9 +87,10 @@ def session_selector_widget(agent: Agent, model_id: str, agent_creation_callback
         session_id = session.session_id
         session_name = None
 
-        # Extract session name from session_data
-        if hasattr(session, "session_data") and session.session_data:
-            session_name = session.session_data.get("session_name")
+        # Extract session name from session_data, resolving the attribute once per session
+        session_data = getattr(session, "session_data", None)
+        if session_data:
+            session_name = session_data.get("session_name")
 
         name = session_name or session_id
         session_options.append(name)
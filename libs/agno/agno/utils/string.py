@@ -1,6 +1,8 @@
 import hashlib
 import json
+import os
 import re
+import time
 import uuid
 from typing import Any, Optional, Type, Union
 from uuid import uuid4
@@ -295,6 +297,31 @@ def generate_id(seed: Optional[str] = None) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, seed))
 
 
+def generate_uuid7() -> str:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562) string.
+
+    UUIDv7 ids start with a millisecond Unix timestamp, so ids created later sort later and
+    database indexes on them grow append-only instead of splitting pages at random.
+    Uses `uuid.uuid7` where the standard library provides it.
+
+    Returns:
+        str: A UUIDv7 string.
+    """
+    if hasattr(uuid, "uuid7"):
+        return str(uuid.uuid7())
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | ((random_bits >> 62) & 0xFFF) << 64
+        | 0b10 << 62  # RFC 4122 variant
+        | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return str(uuid.UUID(int=value))
+
+
 def generate_id_from_name(name: Optional[str] = None) -> str:
     """
     Generate a deterministic ID from a name string.
@@ -135,3 +135,22 @@ def test_full_workflow(sqlite_db_real):
 
         assert result is not None
         assert result.session_type == "agent"
+
+
+def test_session_table_has_session_list_indexes(sqlite_db_real):
+    """Test the sessions table gets the composite indexes that the v2.8.7 migration adds to existing tables"""
+    from agno.db.migrations.versions import v2_8_7
+
+    sqlite_db_real._get_table("sessions", create_table_if_not_found=True)
+    expected = {
+        v2_8_7._index_name(sqlite_db_real.session_table_name, columns) for columns in v2_8_7.SESSION_LIST_INDEX_COLUMNS
+    }
+
+    with sqlite_db_real.Session() as sess:
+        rows = sess.execute(text(f"PRAGMA index_list({sqlite_db_real.session_table_name})")).fetchall()
+    assert expected <= {row[1] for row in rows}
+
+    # The migration is a no-op on fresh tables and restores the indexes after a revert
+    assert v2_8_7.up(sqlite_db_real, "sessions", sqlite_db_real.session_table_name) is False
+    assert v2_8_7.down(sqlite_db_real, "sessions", sqlite_db_real.session_table_name) is True
+    assert v2_8_7.up(sqlite_db_real, "sessions", sqlite_db_real.session_table_name) is True
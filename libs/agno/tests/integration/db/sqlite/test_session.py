@@ -233,6 +233,34 @@ def test_get_session_with_user_id_filter(sqlite_db_real: SqliteDb, sample_agent_
     assert result is None
 
 
+def test_session_exists(sqlite_db_real: SqliteDb, sample_agent_session: AgentSession):
+    """Ensure the session_exists method honours the session_id and user_id filters"""
+    assert sqlite_db_real.session_exists(session_id=sample_agent_session.session_id) is False
+
+    sqlite_db_real.upsert_session(sample_agent_session)
+
+    assert sqlite_db_real.session_exists(session_id=sample_agent_session.session_id) is True
+    assert (
+        sqlite_db_real.session_exists(session_id=sample_agent_session.session_id, user_id=sample_agent_session.user_id)
+        is True
+    )
+    assert sqlite_db_real.session_exists(session_id=sample_agent_session.session_id, user_id="wrong_user") is False
+
+
+def test_session_exists_honours_session_type(sqlite_db_real: SqliteDb, sample_agent_session: AgentSession):
+    """Ensure the session_exists method only matches sessions of the requested type"""
+    sqlite_db_real.upsert_session(sample_agent_session)
+
+    assert (
+        sqlite_db_real.session_exists(session_id=sample_agent_session.session_id, session_type=SessionType.AGENT)
+        is True
+    )
+    assert (
+        sqlite_db_real.session_exists(session_id=sample_agent_session.session_id, session_type=SessionType.TEAM)
+        is False
+    )
+
+
 def test_get_session_without_deserialization(sqlite_db_real: SqliteDb, sample_agent_session: AgentSession):
     """Ensure the get_session method works as expected when retrieving a session without deserialization"""
     # Insert session
@@ -433,6 +461,124 @@ def test_get_sessions_without_deserialize(sqlite_db_real: SqliteDb, sample_agent
     assert total_count == 1
 
 
+def test_get_session_summaries_skips_runs_of_named_sessions(
+    sqlite_db_real: SqliteDb, sample_agent_session: AgentSession
+):
+    """Test that session summaries only carry runs when the session has no stored name"""
+    unnamed_session = AgentSession(
+        session_id="unnamed_session",
+        agent_id="test_agent_1",
+        runs=sample_agent_session.runs,
+        created_at=int(time.time()),
+    )
+    sqlite_db_real.upsert_session(sample_agent_session)
+    sqlite_db_real.upsert_session(unnamed_session)
+
+    summaries, total_count = sqlite_db_real.get_session_summaries(session_type=SessionType.AGENT)
+
+    assert total_count == 2
+    by_id = {summary["session_id"]: summary for summary in summaries}
+    named = by_id[sample_agent_session.session_id]
+    assert named["runs"] is None
+    assert named["session_data"]["session_name"] == "Test Agent Session"
+    assert len(by_id["unnamed_session"]["runs"]) == 1
+
+
+def test_upsert_session_precomputes_session_title(sqlite_db_real: SqliteDb):
+    """Test that unnamed sessions store their title on write, so summaries skip their runs"""
+    from agno.models.message import Message
+
+    session = AgentSession(
+        session_id="titled_session",
+        agent_id="test_agent_1",
+        runs=[
+            RunOutput(
+                run_id="titled_run",
+                agent_id="test_agent_1",
+                status=RunStatus.completed,
+                messages=[Message(role="user", content="What is the weather?")],
+            )
+        ],
+        created_at=int(time.time()),
+    )
+    sqlite_db_real.upsert_session(session)
+
+    # The in-memory session is left untouched
+    assert session.session_data is None
+
+    summaries, total_count = sqlite_db_real.get_session_summaries(session_type=SessionType.AGENT)
+
+    assert total_count == 1
+    assert summaries[0]["runs"] is None
+    assert summaries[0]["session_data"]["session_title"] == "What is the weather?"
+
+
+def test_upsert_session_waits_for_user_message_before_storing_title(sqlite_db_real: SqliteDb):
+    """Test that a pending run titled only by its raw input does not freeze the session title"""
+    from agno.models.message import Message
+    from agno.run.agent import RunInput
+
+    run = RunOutput(
+        run_id="pending_run",
+        agent_id="test_agent_1",
+        status=RunStatus.pending,
+        input=RunInput(input_content="hello there"),
+    )
+    session = AgentSession(
+        session_id="pending_session", agent_id="test_agent_1", runs=[run], created_at=int(time.time())
+    )
+    sqlite_db_real.upsert_session(session)
+
+    stored = sqlite_db_real.get_session(session_id="pending_session", session_type=SessionType.AGENT)
+    assert stored is not None
+    assert "session_title" not in (stored.session_data or {})
+
+    stored.runs[0].status = RunStatus.completed  # type: ignore
+    stored.runs[0].messages = [Message(role="user", content="hello there")]  # type: ignore
+    sqlite_db_real.upsert_session(stored)
+
+    summaries, _ = sqlite_db_real.get_session_summaries(session_type=SessionType.AGENT)
+    assert summaries[0]["session_data"]["session_title"] == "hello there"
+
+
+def test_session_title_is_storage_only_and_follows_rewritten_runs(sqlite_db_real: SqliteDb):
+    """Test that the precomputed title is hidden from loaded sessions and rewritten with the runs"""
+    from agno.models.message import Message
+
+    session = AgentSession(
+        session_id="rewritten_session",
+        agent_id="test_agent_1",
+        runs=[
+            RunOutput(
+                run_id="first_run",
+                agent_id="test_agent_1",
+                status=RunStatus.completed,
+                messages=[Message(role="user", content="First question")],
+            )
+        ],
+        session_data={"session_state": {"step": 1}},
+        created_at=int(time.time()),
+    )
+    sqlite_db_real.upsert_session(session)
+
+    stored = sqlite_db_real.get_session(session_id="rewritten_session", session_type=SessionType.AGENT)
+    assert stored is not None
+    assert stored.session_data == {"session_state": {"step": 1}}
+
+    stored.runs = [  # type: ignore
+        RunOutput(
+            run_id="replacement_run",
+            agent_id="test_agent_1",
+            status=RunStatus.completed,
+            messages=[Message(role="user", content="Replacement question")],
+        )
+    ]
+    sqlite_db_real.upsert_session(stored)
+
+    summaries, _ = sqlite_db_real.get_session_summaries(session_type=SessionType.AGENT)
+    assert summaries[0]["session_data"]["session_title"] == "Replacement question"
+
+
 def test_rename_agent_session(sqlite_db_real: SqliteDb, sample_agent_session: AgentSession):
     """Test renaming an AgentSession"""
     from agno.db.base import SessionType
@@ -0,0 +1,252 @@
+"""Unit tests for the AgentOS agents router."""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.os import AgentOS
+from agno.os.routers.agents.schema import AgentResponse
+from agno.run.base import RunStatus
+from agno.tools import Toolkit
+
+
+def _count_from_agent_calls(os_instance: AgentOS, requests: int) -> int:
+    client = TestClient(os_instance.get_app())
+    original = AgentResponse.from_agent.__func__  # type: ignore[attr-defined]
+    calls = 0
+
+    async def counting_from_agent(cls, agent, is_component=False):
+        nonlocal calls
+        calls += 1
+        return await original(cls, agent, is_component=is_component)
+
+    with patch.object(AgentResponse, "from_agent", classmethod(counting_from_agent)):
+        for _ in range(requests):
+            response = client.get("/agents")
+            assert response.status_code == 200
+            assert [a["id"] for a in response.json()] == [a.id for a in os_instance.agents or []]
+    return calls
+
+
+def test_get_agents_reuses_response_for_static_agents():
+    agent = Agent(name="Static Agent", id="static-agent", instructions="Be brief.", telemetry=False)
+    os_instance = AgentOS(agents=[agent], telemetry=False)
+
+    assert _count_from_agent_calls(os_instance, requests=3) == 1
+
+
+def test_get_agents_re_resolves_only_dynamic_config_for_callable_instructions():
+    instruction_calls = 0
+
+    def instructions():
+        nonlocal instruction_calls
+        instruction_calls += 1
+        return f"Be brief. ({instruction_calls})"
+
+    agent = Agent(name="Dynamic Agent", id="dynamic-agent", instructions=instructions, telemetry=False)
+    os_instance = AgentOS(agents=[agent], telemetry=False)
+    client = TestClient(os_instance.get_app())
+
+    assert _count_from_agent_calls(os_instance, requests=3) == 1
+    assert instruction_calls == 3
+
+    response = client.get("/agents")
+    assert response.json()[0]["system_message"]["instructions"] == "Be brief. (4)"
+
+
+def _get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"Sunny in {city}"
+
+
+def _get_time(city: str) -> str:
+    """Get the time in a city."""
+    return f"Noon in {city}"
+
+
+def test_get_agents_rebuilds_cached_response_after_add_tool():
+    agent = Agent(name="Growing Agent", id="growing-agent", tools=[_get_weather], telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+
+    assert [t["name"] for t in client.get("/agents").json()[0]["tools"]["tools"]] == ["_get_weather"]
+
+    agent.add_tool(_get_time)
+
+    assert [t["name"] for t in client.get("/agents").json()[0]["tools"]["tools"]] == ["_get_weather", "_get_time"]
+
+
+def test_get_agents_re_resolves_mcp_tools():
+    class MCPTools(Toolkit):
+        # Matched by class name, like the real (optional) agno.tools.mcp.MCPTools
+        initialized = True
+        refresh_connection = False
+
+    mcp_tools = MCPTools(name="mcp")
+    agent = Agent(name="MCP Agent", id="mcp-agent", tools=[mcp_tools], telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+
+    assert client.get("/agents").json()[0]["tools"]["tools"] == []
+
+    # The toolkit's functions are only known once it (re)connects
+    mcp_tools.register(_get_weather)
+
+    assert [t["name"] for t in client.get("/agents").json()[0]["tools"]["tools"]] == ["_get_weather"]
+
+
+def test_get_agents_reuses_callable_tools_factory_cache():
+    calls = 0
+
+    def get_weather(city: str) -> str:
+        """Get the weather for a city."""
+        return f"Sunny in {city}"
+
+    def tools_factory():
+        nonlocal calls
+        calls += 1
+        return [get_weather]
+
+    agent = Agent(name="Factory Tools Agent", id="factory-tools-agent", tools=tools_factory, telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+
+    for _ in range(3):
+        response = client.get("/agents")
+        assert response.status_code == 200
+        assert [t["name"] for t in response.json()[0]["tools"]["tools"]] == ["get_weather"]
+
+    assert calls == 1
+    assert len(agent._callable_tools_cache) == 1
+
+
+def test_batch_run_streams_one_line_per_message_with_bounded_concurrency():
+    import asyncio
+    import json
+
+    from agno.run.agent import RunOutput
+
+    agent = Agent(name="Batch Agent", id="batch-agent", telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+    in_flight = 0
+    max_in_flight = 0
+    session_ids = set()
+
+    async def fake_arun(self, input, session_id=None, user_id=None, stream=False, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if input == "fail":
+            raise ValueError("boom")
+        session_ids.add(session_id)
+        return RunOutput(run_id=f"run-{input}", agent_id=self.id, session_id=session_id, content=f"echo {input}")
+
+    with patch.object(Agent, "arun", fake_arun):
+        response = client.post(
+            "/agents/batch-agent/batch",
+            json={"messages": ["a", "b", "fail", "c", "d"], "max_concurrency": 2},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = sorted((json.loads(line) for line in response.text.splitlines()), key=lambda line: line["index"])
+    assert [line["index"] for line in lines] == [0, 1, 2, 3, 4]
+    assert [line["response"]["content"] for line in lines if "response" in line] == [
+        "echo a",
+        "echo b",
+        "echo c",
+        "echo d",
+    ]
+    assert lines[2] == {"index": 2, "error": "boom"}
+    assert max_in_flight == 2
+    assert len(session_ids) == 4
+
+
+def test_batch_run_unknown_agent_returns_404():
+    client = TestClient(AgentOS(agents=[Agent(id="known-agent", telemetry=False)], telemetry=False).get_app())
+
+    response = client.post("/agents/missing-agent/batch", json={"messages": ["hi"]})
+
+    assert response.status_code == 404
+
+
+def test_continue_run_rejects_malformed_tools_payload():
+    client = TestClient(AgentOS(agents=[Agent(id="hitl-agent", telemetry=False)], telemetry=False).get_app())
+    url = "/agents/hitl-agent/runs/run-1/continue"
+
+    response = client.post(url, data={"tools": "[{not json", "session_id": "s-1"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid JSON in tools field"
+
+    response = client.post(url, data={"tools": '[{"tool_call_id": "c-1"}, "oops"]', "session_id": "s-1"})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid structure or content for tools")
+
+
+def test_create_run_replays_cached_responses_only_when_requested():
+    from agno.run.agent import RunCompletedEvent, RunContentEvent, RunOutput, RunStartedEvent
+
+    agent = Agent(name="Cached Agent", id="cached-agent", telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+    calls = 0
+
+    def fake_arun(self, input, stream=False, **kwargs):
+        nonlocal calls
+        calls += 1
+
+        async def events():
+            yield RunStartedEvent(run_id=f"run-{calls}")
+            yield RunContentEvent(run_id=f"run-{calls}", content=f"echo {input}")
+            yield RunCompletedEvent(run_id=f"run-{calls}", content=f"echo {input}")
+
+        async def output():
+            return RunOutput(
+                run_id=f"run-{calls}", agent_id=self.id, content=f"echo {input}", status=RunStatus.completed
+            )
+
+        return events() if stream else output()
+
+    with patch.object(Agent, "arun", fake_arun):
+        url = "/agents/cached-agent/runs"
+        first = client.post(url, params={"cache": 1}, data={"message": "hi", "session_id": "s-1"})
+        replay = client.post(url, params={"cache": 1}, data={"message": "hi", "session_id": "s-1"})
+        assert calls == 1
+        assert replay.text == first.text
+        assert "event: RunCompleted" in replay.text
+
+        client.post(url, params={"cache": 1}, data={"message": "hello", "session_id": "s-1"})
+        client.post(url, data={"message": "hi", "session_id": "s-1"})
+        assert calls == 3
+
+        first = client.post(url, params={"cache": 1}, data={"message": "hi", "session_id": "s-1", "stream": "false"})
+        replay = client.post(url, params={"cache": 1}, data={"message": "hi", "session_id": "s-1", "stream": "false"})
+        assert calls == 4
+        assert replay.json() == first.json()
+        assert replay.json()["run_id"] == "run-4"
+
+
+def test_create_run_never_replays_across_sessions():
+    from agno.run.agent import RunOutput
+
+    agent = Agent(name="Cached Agent", id="cached-agent", telemetry=False)
+    client = TestClient(AgentOS(agents=[agent], telemetry=False).get_app())
+    calls = 0
+
+    async def fake_arun(self, input, stream=False, session_id=None, **kwargs):
+        nonlocal calls
+        calls += 1
+        return RunOutput(run_id=f"run-{calls}", agent_id=self.id, session_id=session_id, status=RunStatus.completed)
+
+    with patch.object(Agent, "arun", fake_arun):
+        url = "/agents/cached-agent/runs"
+        data = {"message": "hi", "stream": "false"}
+
+        first = client.post(url, params={"cache": 1}, data=data)
+        second = client.post(url, params={"cache": 1}, data=data)
+        assert calls == 2
+        assert first.json()["session_id"] != second.json()["session_id"]
+
+        client.post(url, params={"cache": 1}, data={**data, "session_id": "s-1"})
+        other = client.post(url, params={"cache": 1}, data={**data, "session_id": "s-2"})
+        assert calls == 4
+        assert other.json()["session_id"] == "s-2"
@@ -1,5 +1,7 @@
 """Unit tests for optional session_type filtering in the session router."""
 
+import asyncio
+import json
 import time
 import uuid
 
@@ -653,6 +655,29 @@ class TestRenameSessionAutoDetect:
         )
         assert resp.status_code == 404
 
+    def test_rename_runs_sync_db_off_the_event_loop(self, db_with_sessions, monkeypatch):
+        db, agent_s, *_ = db_with_sessions
+        client = _build_client(db)
+        loop_running = []
+        original_rename = db.rename_session
+
+        def recording_rename(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                loop_running.append(True)
+            except RuntimeError:
+                loop_running.append(False)
+            return original_rename(*args, **kwargs)
+
+        monkeypatch.setattr(db, "rename_session", recording_rename)
+
+        resp = client.post(
+            f"/sessions/{agent_s.session_id}/rename?user_id=user-1",
+            json={"session_name": "Renamed Off Loop"},
+        )
+        assert resp.status_code == 200
+        assert loop_running == [False]
+
 
 class TestUpdateSession:
     """PATCH /sessions/{id} endpoint tests."""
@@ -1066,3 +1091,31 @@ class TestSessionRunsAutoDetectType:
         data = resp.json()
         assert len(data) == 1
         assert data[0]["workflow_id"] == "w1"
+
+
+class TestGetSessionsNdjson:
+    """GET /sessions?format=ndjson streams every matching session, one per line."""
+
+    def test_streams_all_sessions_across_pages(self, db_with_sessions, monkeypatch):
+        from agno.os.routers.session import session as session_module
+
+        db, agent_s, team_s, wf_s = db_with_sessions
+        monkeypatch.setattr(session_module, "NDJSON_SESSIONS_PAGE_SIZE", 2)
+        client = _build_client(db)
+
+        resp = client.get("/sessions?user_id=user-1&format=ndjson&limit=1")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in resp.text.splitlines() if line]
+        assert [s["session_id"] for s in lines] == [wf_s.session_id, team_s.session_id, agent_s.session_id]
+
+    def test_respects_type_filter(self, db_with_sessions):
+        db, agent_s, _, _ = db_with_sessions
+        client = _build_client(db)
+
+        resp = client.get("/sessions?user_id=user-1&type=agent&format=ndjson")
+        assert resp.status_code == 200
+
+        lines = [json.loads(line) for line in resp.text.splitlines() if line]
+        assert [s["session_id"] for s in lines] == [agent_s.session_id]
@@ -401,6 +401,20 @@ async def test_resolve_session_id_returns_legacy_key_when_session_exists():
     entity.aget_session.assert_awaited_once_with(session_id="agent-1:111.222")
 
 
+@pytest.mark.asyncio
+async def test_resolve_session_id_checks_existence_on_local_db():
+    from agno.db.base import BaseDb
+
+    entity = Mock()
+    entity.db = Mock(spec=BaseDb)
+    entity.db.session_exists = Mock(return_value=True)
+
+    key = await resolve_session_id(entity, "agent-1", "C123", "111.222")
+    assert key == "agent-1:111.222"
+    entity.db.session_exists.assert_called_once_with(session_id="agent-1:111.222")
+    entity.aget_session.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_resolve_session_id_returns_new_key_when_no_legacy_session():
     entity = Mock()
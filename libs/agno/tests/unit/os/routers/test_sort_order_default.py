@@ -27,8 +27,8 @@ def _make_async_db():
     mock = MagicMock(spec=AsyncBaseDb)
     mock.id = "test-db"
 
-    # get_sessions returns (list[dict], int)
-    mock.get_sessions = AsyncMock(return_value=([], 0))
+    # get_session_summaries returns (list[dict], int)
+    mock.get_session_summaries = AsyncMock(return_value=([], 0))
     # get_user_memories returns (list[dict], int)
     mock.get_user_memories = AsyncMock(return_value=([], 0))
     # get_eval_runs returns (list[dict], int)
@@ -111,8 +111,8 @@ class TestSessionSortOrder:
         response = client.get("/sessions?type=agent&db_id=test-db")
         assert response.status_code == 200
 
-        db.get_sessions.assert_called_once()
-        call_kwargs = db.get_sessions.call_args.kwargs
+        db.get_session_summaries.assert_called_once()
+        call_kwargs = db.get_session_summaries.call_args.kwargs
         assert call_kwargs["sort_order"] is SortOrder.DESC
 
     def test_explicit_asc_sort_order(self, client, db):
@@ -120,8 +120,8 @@ class TestSessionSortOrder:
         response = client.get("/sessions?type=agent&db_id=test-db&sort_order=asc")
         assert response.status_code == 200
 
-        db.get_sessions.assert_called_once()
-        call_kwargs = db.get_sessions.call_args.kwargs
+        db.get_session_summaries.assert_called_once()
+        call_kwargs = db.get_session_summaries.call_args.kwargs
         assert call_kwargs["sort_order"] is SortOrder.ASC
 
     def test_explicit_desc_sort_order(self, client, db):
@@ -129,8 +129,8 @@ class TestSessionSortOrder:
         response = client.get("/sessions?type=agent&db_id=test-db&sort_order=desc")
         assert response.status_code == 200
 
-        db.get_sessions.assert_called_once()
-        call_kwargs = db.get_sessions.call_args.kwargs
+        db.get_session_summaries.assert_called_once()
+        call_kwargs = db.get_session_summaries.call_args.kwargs
         assert call_kwargs["sort_order"] is SortOrder.DESC
 
     def test_invalid_sort_order_rejected(self, client):
@@ -142,7 +142,7 @@ class TestSessionSortOrder:
         """Verify the default is an actual SortOrder enum, not a plain string."""
         client.get("/sessions?type=agent&db_id=test-db")
 
-        call_kwargs = db.get_sessions.call_args.kwargs
+        call_kwargs = db.get_session_summaries.call_args.kwargs
         assert isinstance(call_kwargs["sort_order"], SortOrder)
         assert not isinstance(call_kwargs["sort_order"], str) or type(call_kwargs["sort_order"]) is SortOrder
 
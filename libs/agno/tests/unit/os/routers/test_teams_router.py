@@ -1,12 +1,22 @@
-"""Unit tests for the AgentOS teams router stream helpers."""
+"""Unit tests for the AgentOS teams router."""
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
-
-from agno.os.routers.teams.router import team_continue_response_streamer, team_response_streamer
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.os import AgentOS
+from agno.os.routers.teams.schema import TeamResponse
+from agno.os.routers.teams.router import (
+    team_continue_response_streamer,
+    team_resumable_response_streamer,
+    team_response_streamer,
+)
 from agno.run.agent import RunOutput
 from agno.run.team import RunContentEvent, RunErrorEvent, TeamRunOutput
+from agno.team import Team
 
 
 class FakeTeam:
@@ -41,10 +51,10 @@ async def test_team_response_streamer_skips_run_output_accumulators_before_forma
     sse_chunks = [chunk async for chunk in team_response_streamer(team, "hello")]
 
     assert len(sse_chunks) == 1
-    assert sse_chunks[0].startswith("event: TeamRunContent\n")
-    assert '"content":"hello"' in sse_chunks[0]
-    assert "team-aggregate" not in sse_chunks[0]
-    assert "agent-aggregate" not in sse_chunks[0]
+    assert sse_chunks[0].startswith(b"event: TeamRunContent\n")
+    assert b'"content":"hello"' in sse_chunks[0]
+    assert b"team-aggregate" not in sse_chunks[0]
+    assert b"agent-aggregate" not in sse_chunks[0]
     assert team.arun_kwargs is not None
     assert team.arun_kwargs["stream"] is True
     assert team.arun_kwargs["stream_events"] is True
@@ -68,10 +78,117 @@ async def test_team_continue_response_streamer_skips_accumulators_and_formats_er
     ]
 
     assert len(sse_chunks) == 1
-    assert sse_chunks[0].startswith("event: TeamRunError\n")
-    assert '"content":"boom"' in sse_chunks[0]
-    assert "team-aggregate" not in sse_chunks[0]
-    assert "agent-aggregate" not in sse_chunks[0]
+    assert sse_chunks[0].startswith(b"event: TeamRunError\n")
+    assert b'"content":"boom"' in sse_chunks[0]
+    assert b"team-aggregate" not in sse_chunks[0]
+    assert b"agent-aggregate" not in sse_chunks[0]
     assert team.acontinue_run_kwargs is not None
     assert team.acontinue_run_kwargs["stream"] is True
     assert team.acontinue_run_kwargs["stream_events"] is True
+
+
+class FailingResumableTeam(FakeTeam):
+    async def _stream(self):
+        for chunk in self.chunks:
+            yield chunk
+        raise RuntimeError("team crashed")
+
+
+@pytest.mark.asyncio
+async def test_team_resumable_response_streamer_relays_frames_and_renders_errors_as_bytes():
+    relayed = "event: TeamRunContent\ndata: {}\n\n"
+    team: Any = FailingResumableTeam([relayed])
+
+    sse_chunks = [chunk async for chunk in team_resumable_response_streamer(team, "hello")]
+
+    assert sse_chunks[0] == relayed
+    assert sse_chunks[1].startswith(b"event: TeamRunError\n")
+    assert b"team crashed" in sse_chunks[1]
+    assert team.arun_kwargs is not None
+    assert team.arun_kwargs["background"] is True
+
+
+def _count_from_team_calls(os_instance: AgentOS, requests: int) -> int:
+    client = TestClient(os_instance.get_app())
+    original = TeamResponse.from_team.__func__  # type: ignore[attr-defined]
+    calls = 0
+
+    async def counting_from_team(cls, team, is_component=False):
+        nonlocal calls
+        calls += 1
+        return await original(cls, team, is_component=is_component)
+
+    with patch.object(TeamResponse, "from_team", classmethod(counting_from_team)):
+        for _ in range(requests):
+            response = client.get("/teams")
+            assert response.status_code == 200
+            assert [t["id"] for t in response.json()] == [t.id for t in os_instance.teams or []]
+    return calls
+
+
+def test_get_teams_reuses_response_for_static_teams():
+    member = Agent(name="Member", id="member", instructions="Be brief.", telemetry=False)
+    team = Team(name="Static Team", id="static-team", members=[member], telemetry=False)
+    os_instance = AgentOS(teams=[team], telemetry=False)
+
+    # Nested member responses are built inside from_team, so only the first request calls it
+    assert _count_from_team_calls(os_instance, requests=3) == 1
+
+
+def test_get_teams_rebuilds_response_when_a_member_has_callable_instructions():
+    member = Agent(name="Member", id="member", instructions=lambda: "Be brief.", telemetry=False)
+    team = Team(name="Dynamic Team", id="dynamic-team", members=[member], telemetry=False)
+    os_instance = AgentOS(teams=[team], telemetry=False)
+
+    assert _count_from_team_calls(os_instance, requests=3) == 3
+
+
+def test_get_teams_answers_matching_if_none_match_with_304():
+    team = Team(name="Static Team", id="static-team", members=[], telemetry=False)
+    client = TestClient(AgentOS(teams=[team], telemetry=False).get_app())
+
+    first = client.get("/teams")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    cached = client.get("/teams", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    stale = client.get("/teams", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+
+@pytest.mark.parametrize("background,coalesced", [(False, True), (True, False)])
+def test_create_team_run_coalesces_only_inline_streams(background, coalesced):
+    from agno.os.routers.teams import router as teams_router
+
+    team = Team(id="stream-team", members=[Agent(id="member", telemetry=False)], telemetry=False)
+    client = TestClient(AgentOS(teams=[team], telemetry=False).get_app())
+    wrapped = []
+
+    def recording_coalesce(stream, *args, **kwargs):
+        wrapped.append(stream)
+        return stream
+
+    async def frames(*args, **kwargs):
+        yield b"event: TeamRunContent\ndata: {}\n\n"
+
+    with (
+        patch.object(teams_router, "coalesce_sse_stream", recording_coalesce),
+        patch.object(teams_router, "team_response_streamer", frames),
+        patch.object(teams_router, "team_resumable_response_streamer", frames),
+    ):
+        response = client.post(
+            "/teams/stream-team/runs",
+            data={"message": "hi", "stream": "true", "background": str(background).lower()},
+        )
+
+    assert response.status_code == 200
+    assert response.text == "event: TeamRunContent\ndata: {}\n\n"
+    # Resumable streams are relayed frame by frame, like the agent and workflow routers do, so
+    # flush timing and frame boundaries match the event indexes replayed on reconnect
+    assert bool(wrapped) is coalesced
@@ -345,7 +345,7 @@ class _FakeSyncDb:
     def get_session(self, session_id, session_type, user_id, deserialize):
         return self._session
 
-    def get_sessions(self, **kwargs):
+    def get_session_summaries(self, **kwargs):
         return self._sessions, len(self._sessions)
 
 
@@ -0,0 +1,35 @@
+"""Guards that every SSE generator handed to StreamingResponse is an async generator.
+
+Starlette iterates sync iterators through a threadpool hop per chunk, which is far slower
+than native async iteration on the streaming hot path.
+"""
+
+import inspect
+
+import pytest
+
+from agno.os.routers.agents import router as agents_router
+from agno.os.routers.teams import router as teams_router
+from agno.os.routers.workflows import router as workflows_router
+
+STREAMERS = [
+    agents_router.agent_response_streamer,
+    agents_router.agent_resumable_response_streamer,
+    agents_router.agent_continue_response_streamer,
+    agents_router.agent_resumable_continue_response_streamer,
+    agents_router._resume_stream_generator,
+    teams_router.team_response_streamer,
+    teams_router.team_resumable_response_streamer,
+    teams_router.team_continue_response_streamer,
+    teams_router.team_resumable_continue_response_streamer,
+    teams_router._resume_stream_generator,
+    workflows_router.workflow_response_streamer,
+    workflows_router.workflow_resumable_response_streamer,
+    workflows_router.workflow_continue_response_streamer,
+    workflows_router._resume_stream_generator,
+]
+
+
+@pytest.mark.parametrize("streamer", STREAMERS, ids=lambda f: f"{f.__module__}.{f.__name__}")
+def test_streamer_is_async_generator(streamer):
+    assert inspect.isasyncgenfunction(streamer)
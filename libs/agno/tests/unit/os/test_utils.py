@@ -1,7 +1,10 @@
 """Unit tests for OS utility functions."""
 
+import asyncio
 import io
+import json
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Optional
 
 import pytest
@@ -10,10 +13,23 @@ from starlette.datastructures import Headers, UploadFile
 from agno.media import File
 from agno.os.utils import (
     DOCUMENT_MIME_TYPES,
+    RunJSONResponse,
+    SSEErrorFrame,
     classify_upload_file,
+    coalesce_sse_stream,
+    compute_etag,
+    etag_matches,
+    find_component_by_id,
+    format_sse_event,
+    format_sse_event_bytes,
+    format_tools,
+    get_session_name,
     process_document,
+    process_upload_files,
     to_utc_datetime,
 )
+from agno.run.agent import RunContentEvent
+from agno.utils.serialize import json_dumps_bytes, json_loads, json_serializer
 
 
 def test_returns_none_for_none_input():
@@ -213,3 +229,393 @@ class TestDocumentMimeTypesConsistency:
         for mime_type in DOCUMENT_MIME_TYPES:
             # Should not raise.
             File(content=b"data", mime_type=mime_type)
+
+
+class TestProcessUploadFiles:
+    """process_upload_files buckets uploads by category, preserving upload order within each bucket."""
+
+    async def test_buckets_uploads_in_order(self):
+        images, audios, videos, documents = await process_upload_files(
+            [
+                _make_upload_file("a.pdf", "application/pdf", b"first"),
+                _make_upload_file("img.png", "image/png", b"png"),
+                _make_upload_file("b.md", "text/markdown", b"second"),
+                _make_upload_file("clip.wav", "audio/wav", b"wav"),
+                _make_upload_file("movie.mp4", "video/mp4", b"mp4"),
+            ]
+        )
+
+        assert [image.content for image in images] == [b"png"]
+        assert [audio.content for audio in audios] == [b"wav"]
+        assert [video.content for video in videos] == [b"mp4"]
+        assert [(document.filename, document.content) for document in documents] == [
+            ("a.pdf", b"first"),
+            ("b.md", b"second"),
+        ]
+
+    async def test_rejects_empty_files(self):
+        from fastapi import HTTPException
+
+        uploads = [
+            _make_upload_file("img.png", "image/png", b"png"),
+            _make_upload_file("notes.md", "text/markdown", b"notes"),
+            _make_upload_file("empty.md", "text/markdown", b""),
+        ]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await process_upload_files(uploads)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Empty file"
+        assert all(upload.file.closed for upload in uploads)
+
+    async def test_skips_files_that_fail_to_convert(self, monkeypatch):
+        from agno.os import utils as os_utils
+
+        def failing_process_image(file):
+            raise ValueError("corrupt image")
+
+        monkeypatch.setitem(os_utils._MEDIA_PROCESSORS, "image", failing_process_image)
+
+        images, _, _, documents = await process_upload_files(
+            [
+                _make_upload_file("broken.png", "image/png", b"png"),
+                _make_upload_file("notes.md", "text/markdown", b"notes"),
+            ]
+        )
+
+        assert images == []
+        assert [document.filename for document in documents] == ["notes.md"]
+
+    async def test_closes_uploads_after_reading(self):
+        uploads = [
+            _make_upload_file("img.png", "image/png", b"png"),
+            _make_upload_file("notes.md", "text/markdown", b"notes"),
+        ]
+
+        await process_upload_files(uploads)
+
+        assert all(upload.file.closed for upload in uploads)
+
+    async def test_media_processed_off_the_event_loop(self, monkeypatch):
+        import asyncio
+
+        from agno.os import utils as os_utils
+
+        loop_running = []
+        original = os_utils._MEDIA_PROCESSORS["image"]
+
+        def recording_process_image(file):
+            try:
+                asyncio.get_running_loop()
+                loop_running.append(True)
+            except RuntimeError:
+                loop_running.append(False)
+            return original(file)
+
+        monkeypatch.setitem(os_utils._MEDIA_PROCESSORS, "image", recording_process_image)
+
+        images, _, _, _ = await process_upload_files([_make_upload_file("img.png", "image/png", b"png")])
+
+        assert [image.content for image in images] == [b"png"]
+        assert loop_running == [False]
+
+    async def test_unsupported_type_raises_400(self):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await process_upload_files(
+                [
+                    _make_upload_file("notes.md", "text/markdown", b"notes"),
+                    _make_upload_file("archive.zip", "application/zip", b"zip"),
+                ]
+            )
+        assert exc_info.value.status_code == 400
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class TestJsonDumpsBytes:
+    """The fast encoder must produce the same document as the stdlib encoder it replaces."""
+
+    PAYLOAD = {
+        "content": "赵箭 café",
+        "created_at": datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "color": _Color.RED,
+        "nested": [{"a": 1, "b": None, "c": 1.5}],
+        1: "non-string key",
+    }
+
+    def test_matches_stdlib_json(self):
+        expected = json.dumps(self.PAYLOAD, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
+        assert json_dumps_bytes(self.PAYLOAD) == expected.encode("utf-8")
+
+    def test_falls_back_for_big_integers(self):
+        assert json_dumps_bytes({"n": 2**70}) == b'{"n":1180591620717411303424}'
+
+    def test_compact_event_to_json(self):
+        event = RunContentEvent(run_id="run-1", content="héllo")
+        assert json.loads(event.to_json(separators=(",", ":"), indent=None)) == json.loads(event.to_json())
+
+
+class TestJsonLoads:
+    def test_matches_stdlib_json(self):
+        document = '[{"tool_call_id": "c-1", "tool_args": {"city": "赵箭"}, "result": null}]'
+        assert json_loads(document) == json.loads(document)
+        assert json_loads(document.encode("utf-8")) == json.loads(document)
+
+    def test_falls_back_for_inputs_orjson_rejects(self):
+        assert json_loads('{"n": 1180591620717411303424}') == {"n": 2**70}
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            json_loads("[{not json")
+
+
+def test_run_json_response_renders_like_jsonable_encoder():
+    from fastapi.encoders import jsonable_encoder
+
+    content = {"status": _Color.RED, "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc), "text": "赵箭"}
+    response = RunJSONResponse(content)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(content)
+
+
+class TestCoalesceSseStream:
+    @staticmethod
+    async def _frames(delays, frame=b"data: x\n\n"):
+        for delay in delays:
+            if delay:
+                await asyncio.sleep(delay)
+            yield frame
+
+    async def test_merges_frames_produced_together_after_the_first(self):
+        chunks = [c async for c in coalesce_sse_stream(self._frames([0] * 10), max_ms=50)]
+        assert chunks[0] == b"data: x\n\n"
+        assert b"".join(chunks) == b"data: x\n\n" * 10
+        assert len(chunks) < 10
+
+    async def test_flushes_when_the_window_elapses(self):
+        chunks = [c async for c in coalesce_sse_stream(self._frames([0, 0.05, 0.05]), max_ms=1)]
+        assert chunks == [b"data: x\n\n"] * 3
+
+    async def test_flushes_when_the_buffer_is_full(self):
+        stream = coalesce_sse_stream(self._frames([0] * 9, frame=b"x" * 100), max_ms=1000, max_bytes=300)
+        chunks = [c async for c in stream]
+        assert [len(c) for c in chunks] == [100, 300, 300, 200]
+
+    async def test_accepts_str_frames(self):
+        async def frames():
+            yield "event: a\n\n"
+            yield "event: 赵\n\n"
+
+        assert b"".join([c async for c in coalesce_sse_stream(frames())]) == "event: a\n\nevent: 赵\n\n".encode("utf-8")
+
+    async def test_flushes_buffered_frames_before_raising(self):
+        async def frames():
+            yield b"a"
+            yield b"b"
+            raise RuntimeError("boom")
+
+        received = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for chunk in coalesce_sse_stream(frames(), max_ms=1000):
+                received.append(chunk)
+        assert b"".join(received) == b"ab"
+
+    async def test_closing_the_stream_cancels_the_source(self):
+        cancelled = asyncio.Event()
+
+        async def frames():
+            try:
+                yield b"first"
+                await asyncio.sleep(10)
+                yield b"never"
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stream = coalesce_sse_stream(frames())
+        assert await stream.__anext__() == b"first"
+        await stream.aclose()
+        assert cancelled.is_set()
+
+
+def test_format_sse_event_bytes_matches_str_framing():
+    event = RunContentEvent(run_id="run-1", content="赵箭")
+    framed = format_sse_event_bytes(event)
+    assert isinstance(framed, bytes)
+    assert framed.startswith(b"event: RunContent\ndata: ")
+    assert framed.endswith(b"\n\n")
+    assert framed == format_sse_event(event).encode("utf-8")
+
+
+class _Component:
+    def __init__(self, id: str):
+        self.id = id
+
+
+class TestFindComponentById:
+    def test_finds_component(self):
+        components = [_Component("a"), _Component("b")]
+        assert find_component_by_id("b", components) is components[1]
+        assert find_component_by_id("missing", components) is None
+        assert find_component_by_id("a", None) is None
+
+    def test_sees_components_added_after_first_lookup(self):
+        components = [_Component("a")]
+        assert find_component_by_id("a", components) is components[0]
+        components.append(_Component("b"))
+        assert find_component_by_id("b", components) is components[1]
+
+    def test_never_returns_stale_entries(self):
+        components = [_Component("a"), _Component("b")]
+        assert find_component_by_id("b", components) is components[1]
+        components.pop(0)
+        assert find_component_by_id("a", components) is None
+        assert find_component_by_id("b", components) is components[0]
+        replacement = _Component("b")
+        components[0] = replacement
+        assert find_component_by_id("b", components) is replacement
+
+    def test_misses_reuse_the_index(self):
+        from agno.os.utils import _COMPONENT_INDEXES
+
+        components = [_Component("a"), _Component("b")]
+        assert find_component_by_id("a", components) is components[0]
+        index = _COMPONENT_INDEXES[id(components)]
+        assert find_component_by_id("db-only", components) is None
+        assert _COMPONENT_INDEXES[id(components)] is index
+
+    def test_finds_components_replaced_in_place_or_renamed(self):
+        components = [_Component("a"), _Component("b")]
+        assert find_component_by_id("c", components) is None
+        components[1] = _Component("c")
+        assert find_component_by_id("c", components) is components[1]
+        components[0].id = "renamed"
+        assert find_component_by_id("renamed", components) is components[0]
+        assert find_component_by_id("a", components) is None
+
+    def test_index_does_not_keep_lists_alive(self):
+        import gc
+        import weakref
+
+        components = [_Component("a")]
+        assert find_component_by_id("a", components) is components[0]
+        component_ref = weakref.ref(components[0])
+        del components
+        gc.collect()
+        assert component_ref() is None
+
+    def test_first_occurrence_wins(self):
+        components = [_Component("a"), _Component("a")]
+        assert find_component_by_id("a", components) is components[0]
+
+
+def _lookup_weather(city: str) -> str:
+    """Look up the weather for a city."""
+    return city
+
+
+def test_format_tools_formats_plain_callables_once(monkeypatch):
+    from agno.tools.function import Function
+
+    original = Function.from_callable.__func__  # type: ignore[attr-defined]
+    calls = 0
+
+    def counting_from_callable(cls, c, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return original(cls, c, *args, **kwargs)
+
+    monkeypatch.setattr(Function, "from_callable", classmethod(counting_from_callable))
+
+    first = format_tools([_lookup_weather])
+    first[0]["name"] = "mutated"
+    second = format_tools([_lookup_weather])
+
+    assert calls == 1
+    assert second[0]["name"] == "_lookup_weather"
+
+
+def test_format_tools_does_not_share_cached_parameters():
+    first = format_tools([_lookup_weather])
+    first[0]["parameters"]["properties"].clear()
+    second = format_tools([_lookup_weather])
+
+    assert second[0]["parameters"]["properties"] != {}
+
+
+def test_format_tools_does_not_keep_bound_method_owners_alive():
+    import gc
+    import weakref
+
+    class WeatherTools:
+        def lookup(self, city: str) -> str:
+            """Look up the weather for a city."""
+            return city
+
+    first, second = WeatherTools(), WeatherTools()
+    owner_ref = weakref.ref(first)
+
+    assert format_tools([first.lookup]) == format_tools([second.lookup])
+
+    del first
+    gc.collect()
+    assert owner_ref() is None
+
+
+@pytest.mark.parametrize("error_type,error_id", [(None, None), ("model_provider_error", "err-1")])
+def test_sse_error_frame_matches_rendered_event(error_type, error_id):
+    from unittest.mock import patch
+
+    from agno.run.agent import RunErrorEvent
+    from agno.run.workflow import WorkflowErrorEvent
+
+    with patch("agno.os.utils.unix_time", return_value=1704067200.5):
+        for event_cls, field in ((RunErrorEvent, "content"), (WorkflowErrorEvent, "error")):
+            expected = format_sse_event_bytes(
+                event_cls(created_at=1704067200, error_type=error_type, error_id=error_id, **{field: 'say "赵箭"'})
+            )
+            assert SSEErrorFrame(event_cls, field=field).render('say "赵箭"', error_type, error_id) == expected
+
+
+def test_get_session_name_skips_member_runs_and_converts_runs_lazily():
+    from agno.models.message import Message
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+
+    member_run = RunOutput(run_id="r1", agent_id="member", messages=[Message(role="user", content="delegated task")])
+    team_run = TeamRunOutput(run_id="r2", team_id="team", messages=[Message(role="user", content="What's new?")])
+    unreached_run = TeamRunOutput(run_id="r3", team_id="team")
+    unreached_run.to_dict = lambda: pytest.fail("runs after the first match must not be serialized")  # type: ignore
+
+    session = {"session_type": "team", "runs": [member_run, team_run, unreached_run]}
+
+    assert get_session_name(session) == "What's new?"
+    assert get_session_name({"session_type": "agent", "runs": [member_run]}) == "delegated task"
+
+
+def test_get_session_name_converts_only_the_first_workflow_run():
+    from agno.run.workflow import WorkflowRunOutput
+
+    first_run = WorkflowRunOutput(run_id="r1", workflow_id="wf", input="Plan a trip")
+    later_run = WorkflowRunOutput(run_id="r2", workflow_id="wf", input="ignored")
+    later_run.to_dict = lambda: pytest.fail("only the first workflow run names the session")  # type: ignore
+
+    assert get_session_name({"session_type": "workflow", "runs": [first_run, later_run]}) == "Plan a trip"
+    assert get_session_name({"session_type": "workflow", "runs": [{}], "workflow_data": None}) == ""
+
+
+def test_etag_matches_uses_weak_comparison_over_header_lists():
+    etag = compute_etag(b'{"data": []}')
+
+    assert etag == compute_etag(b'{"data": []}')
+    assert etag != compute_etag(b'{"data": [1]}')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
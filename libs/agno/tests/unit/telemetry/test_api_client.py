@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from agno.api.api import Api
+
+
+def test_shared_client_is_reused_until_closed():
+    api = Api()
+    client = api.shared_client()
+    assert api.shared_client() is client
+
+    client.close()
+    assert api.shared_client() is not client
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_shared_on_the_loop_that_opened_it():
+    api = Api()
+    await api.aopen()
+
+    async with api.async_client() as first:
+        pass
+    async with api.async_client() as second:
+        pass
+    assert first is second
+    assert not first.is_closed
+
+    await api.aclose()
+    assert first.is_closed
+
+
+def test_async_client_is_short_lived_without_a_shared_client():
+    api = Api()
+
+    async def use_client():
+        async with api.async_client() as client:
+            pass
+        return client
+
+    first = asyncio.run(use_client())
+    second = asyncio.run(use_client())
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_async_client_is_not_shared_with_other_loops():
+    api = Api()
+
+    async def open_shared():
+        await api.aopen()
+        async with api.async_client() as client:
+            return client
+
+    async def use_client():
+        async with api.async_client() as client:
+            pass
+        return client
+
+    shared = asyncio.run(open_shared())
+    other = asyncio.run(use_client())
+    assert other is not shared
+    assert other.is_closed
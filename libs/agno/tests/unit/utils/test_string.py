@@ -1,3 +1,4 @@
+import uuid
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -5,6 +6,7 @@ from pydantic import BaseModel
 from agno.utils.string import (
     _extract_json_objects,
     generate_id_from_name,
+    generate_uuid7,
     parse_response_model_str,
     sanitize_postgres_string,
     url_safe_string,
@@ -439,3 +441,15 @@ def test_sanitize_postgres_string_other_illegal_chars():
     assert sanitize_postgres_string("hello\x0e\x1fworld") == "helloworld"
     # Unicode replacement characters
     assert sanitize_postgres_string("hello\ufffe\uffffworld") == "helloworld"
+
+
+def test_generate_uuid7_is_valid_and_time_ordered():
+    first = generate_uuid7()
+    later = [generate_uuid7() for _ in range(5)]
+
+    parsed = uuid.UUID(first)
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+    # The leading 48 bits are the creation time in ms, so later ids never sort before earlier ones
+    assert all(uuid.UUID(value).int >> 80 >= parsed.int >> 80 for value in later)
+    assert len(set(later)) == len(later)